@@ -59,5 +59,27 @@ class Cache_Conf(_config.ConfigNamespace):
         cfgtype='boolean'
     )
 
+    cache_backend = _config.ConfigItem(
+        'pickle',
+        ("Storage used for the cache of each service: 'pickle' keeps one file per "
+         "query, 'sqlite' keeps a single indexed database with least recently used "
+         "eviction. See astroquery.cache for registering other backends."),
+        cfgtype='string'
+    )
+
+    cache_max_size = _config.ConfigItem(
+        0,
+        ("Maximum size (bytes) of the cache of each service. The oldest entries are "
+         "evicted when it is exceeded. 0 means unlimited."),
+        cfgtype='integer'
+    )
+
+    name_resolution_cache = _config.ConfigItem(
+        False,
+        ("Keep the sky positions of resolved object names in a cache shared by all "
+         "services, so that names are only resolved again once cache_timeout has passed."),
+        cfgtype='boolean'
+    )
+
 
 cache_conf = Cache_Conf()
@@ -35,6 +35,10 @@ class Conf(_config.ConfigNamespace):
         "",
         'Optional default username for ALMA archive.')
 
+    download_workers = _config.ConfigItem(
+        1,
+        'Number of files sized or downloaded in parallel by download_files.')
+
 
 conf = Conf()
 
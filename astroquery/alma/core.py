@@ -6,9 +6,12 @@ import numpy as np
 import re
 import tarfile
 import string
+import threading
+import time
 import requests
 import warnings
 import importlib.resources as importlib_resources
+from concurrent.futures import ThreadPoolExecutor
 
 from bs4 import BeautifulSoup
 import pyvo
@@ -308,6 +311,34 @@ def get_enhanced_table(result):
     return prep_table
 
 
+class _DownloadProgress:
+    """
+    Log the progress, throughput and expected remaining time of a batch of
+    downloads of the given sizes (in bytes).
+    """
+
+    def __init__(self, sizes):
+        self.nfiles = len(sizes)
+        self.total = sum(sizes)
+        self.done_files = 0
+        self.done_bytes = 0
+        self.start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def update(self, size):
+        with self._lock:
+            self.done_files += 1
+            self.done_bytes += size
+            elapsed = time.monotonic() - self.start
+            rate = self.done_bytes / elapsed if elapsed > 0 else 0
+            message = (f"Downloaded {self.done_files}/{self.nfiles} files "
+                       f"({self.done_bytes / 1e9:.2f} of {self.total / 1e9:.2f} GB")
+            if rate:
+                eta = (self.total - self.done_bytes) / rate
+                message += f", {rate / 1e6:.1f} MB/s, ETA {eta:.0f} s"
+            log.info(message + ")")
+
+
 class AlmaAuth(BaseVOQuery, BaseQuery):
     """Authentication session information for passing credentials to an OIDC instance
 
@@ -902,12 +933,14 @@ class AlmaClass(QueryWithLogin):
         (This is discouraged by the ALMA archive, as it puts unnecessary load
         on their system)
         """
+        def head(fileLink):
+            return self._request('HEAD', fileLink, stream=False,
+                                 cache=False, timeout=self.TIMEOUT)
+
         totalsize = 0 * u.B
         data_sizes = {}
         pb = ProgressBar(len(files))
-        for index, fileLink in enumerate(files):
-            response = self._request('HEAD', fileLink, stream=False,
-                                     cache=False, timeout=self.TIMEOUT)
+        for index, (fileLink, response) in enumerate(zip(files, self._map_concurrently(head, files))):
             filesize = (int(response.headers['content-length']) * u.B).to(u.GB)
             totalsize += filesize
             data_sizes[fileLink] = filesize
@@ -917,6 +950,22 @@ class AlmaClass(QueryWithLogin):
 
         return data_sizes, totalsize.to(u.GB)
 
+    def _map_concurrently(self, func, items):
+        """
+        Apply ``func`` to ``items``, ``conf.download_workers`` at a time, and
+        yield the results in order. The remaining calls are cancelled if one
+        of them fails.
+        """
+        items = list(items)
+        if conf.download_workers <= 1 or len(items) <= 1:
+            yield from map(func, items)
+            return
+        executor = ThreadPoolExecutor(max_workers=conf.download_workers)
+        try:
+            yield from executor.map(func, items)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def download_files(self, files, *, savedir=None, cache=True,
                        continuation=True, skip_unauthorized=True,
                        verify_only=False):
@@ -951,11 +1000,11 @@ class AlmaClass(QueryWithLogin):
         else:
             auth = None
 
-        downloaded_files = []
         if savedir is None:
             savedir = self.cache_location
-        for file_link in unique(files):
-            log.debug("Downloading {0} to {1}".format(file_link, savedir))
+        file_links = unique(files)
+
+        def check(file_link):
             try:
                 check_filename = self._request('HEAD', file_link, auth=auth, timeout=self.TIMEOUT)
                 check_filename.raise_for_status()
@@ -964,7 +1013,7 @@ class AlmaClass(QueryWithLogin):
                     if skip_unauthorized:
                         log.info("Access denied to {url}.  Skipping to"
                                  " next file".format(url=file_link))
-                        continue
+                        return None
                     else:
                         raise (ex)
 
@@ -975,75 +1024,104 @@ class AlmaClass(QueryWithLogin):
                 log.info(f"Unable to find filename for {file_link}  "
                          "(missing Content-Disposition in header).  "
                          "Skipping to next file.")
-                continue
+                return None
 
             if savedir is not None:
                 filename = os.path.join(savedir,
                                         filename)
+            return filename, check_filename.headers
 
-            if verify_only:
-                existing_file_length = os.stat(filename).st_size
-                if 'content-length' in check_filename.headers:
-                    length = int(check_filename.headers['content-length'])
-                    if length == 0:
-                        warnings.warn('URL {0} has length=0'.format(file_link))
-                    elif existing_file_length == length:
-                        log.info(f"Found cached file {filename} with expected size {existing_file_length}.")
-                    elif existing_file_length < length:
-                        log.info(f"Found cached file {filename} with size {existing_file_length} < expected "
-                                 f"size {length}.  The download should be continued.")
-                    elif existing_file_length > length:
-                        warnings.warn(f"Found cached file {filename} with size {existing_file_length} > expected "
-                                      f"size {length}.  The download is likely corrupted.",
-                                      CorruptDataWarning)
-                else:
-                    warnings.warn(f"Could not verify {file_link} because it has no 'content-length'")
+        # The HEAD requests are all sent first, so that the size of the whole batch is known
+        checks = list(self._map_concurrently(check, file_links))
+        downloads = [(file_link, *checked) for file_link, checked in zip(file_links, checks) if checked]
+        progress = _DownloadProgress(
+            [int(headers.get('content-length', 0) or 0) for _, _, headers in downloads])
 
-            try:
-                if not verify_only:
-                    self._download_file(file_link,
-                                        filename,
-                                        timeout=self.TIMEOUT,
-                                        auth=auth,
-                                        cache=cache,
-                                        method='GET',
-                                        head_safe=False,
-                                        continuation=continuation)
-
-                downloaded_files.append(filename)
-            except requests.HTTPError as ex:
-                if ex.response.status_code == 401:
-                    if skip_unauthorized:
-                        log.info("Access denied to {url}.  Skipping to"
-                                 " next file".format(url=file_link))
-                        continue
-                    else:
-                        raise (ex)
-                elif ex.response.status_code == 403:
-                    log.error("Access denied to {url}".format(url=file_link))
-                    if 'dataPortal' in file_link and 'sso' not in file_link:
-                        log.error("The URL may be incorrect.  Try using "
-                                  "{0} instead of {1}"
-                                  .format(file_link.replace('dataPortal/',
-                                                            'dataPortal/sso/'),
-                                          file_link))
-                    raise ex
-                elif ex.response.status_code == 500:
-                    # empirically, this works the second time most of the time...
-                    self._download_file(file_link,
-                                        filename,
-                                        timeout=self.TIMEOUT,
-                                        auth=auth,
-                                        cache=cache,
-                                        method='GET',
-                                        head_safe=False,
-                                        continuation=continuation)
-
-                    downloaded_files.append(filename)
-                else:
-                    raise ex
+        def download(args):
+            file_link, filename, headers = args
+            log.debug("Downloading {0} to {1}".format(file_link, savedir))
+            filename = self._download_checked_file(file_link, filename, headers, auth=auth, cache=cache,
+                                                   continuation=continuation,
+                                                   skip_unauthorized=skip_unauthorized,
+                                                   verify_only=verify_only)
+            if not verify_only:
+                progress.update(int(headers.get('content-length', 0) or 0))
+            return filename
+
+        downloaded_files = [filename for filename in self._map_concurrently(download, downloads)
+                            if filename is not None]
         return downloaded_files
 
+    def _download_checked_file(self, file_link, filename, headers, *, auth, cache, continuation,
+                               skip_unauthorized, verify_only):
+        """
+        Download (or with ``verify_only``, check the size of) ``file_link``
+        into ``filename``, ``headers`` being the headers of its HEAD response.
+        Returns `None` if the download was skipped.
+        """
+        if verify_only:
+            existing_file_length = os.stat(filename).st_size
+            if 'content-length' in headers:
+                length = int(headers['content-length'])
+                if length == 0:
+                    warnings.warn('URL {0} has length=0'.format(file_link))
+                elif existing_file_length == length:
+                    log.info(f"Found cached file {filename} with expected size {existing_file_length}.")
+                elif existing_file_length < length:
+                    log.info(f"Found cached file {filename} with size {existing_file_length} < expected "
+                             f"size {length}.  The download should be continued.")
+                elif existing_file_length > length:
+                    warnings.warn(f"Found cached file {filename} with size {existing_file_length} > expected "
+                                  f"size {length}.  The download is likely corrupted.",
+                                  CorruptDataWarning)
+            else:
+                warnings.warn(f"Could not verify {file_link} because it has no 'content-length'")
+            return filename
+
+        # Several progress bars cannot be shown at once
+        verbose = conf.download_workers <= 1
+        try:
+            self._download_file(file_link,
+                                filename,
+                                timeout=self.TIMEOUT,
+                                auth=auth,
+                                cache=cache,
+                                method='GET',
+                                head_safe=False,
+                                continuation=continuation,
+                                verbose=verbose)
+        except requests.HTTPError as ex:
+            if ex.response.status_code == 401:
+                if skip_unauthorized:
+                    log.info("Access denied to {url}.  Skipping to"
+                             " next file".format(url=file_link))
+                    return None
+                else:
+                    raise (ex)
+            elif ex.response.status_code == 403:
+                log.error("Access denied to {url}".format(url=file_link))
+                if 'dataPortal' in file_link and 'sso' not in file_link:
+                    log.error("The URL may be incorrect.  Try using "
+                              "{0} instead of {1}"
+                              .format(file_link.replace('dataPortal/',
+                                                        'dataPortal/sso/'),
+                                      file_link))
+                raise ex
+            elif ex.response.status_code == 500:
+                # empirically, this works the second time most of the time...
+                self._download_file(file_link,
+                                    filename,
+                                    timeout=self.TIMEOUT,
+                                    auth=auth,
+                                    cache=cache,
+                                    method='GET',
+                                    head_safe=False,
+                                    continuation=continuation,
+                                    verbose=verbose)
+            else:
+                raise ex
+        return filename
+
     def _parse_result(self, response, verbose=False):
         """
         Parse a VOtable response
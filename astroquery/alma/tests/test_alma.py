@@ -14,7 +14,7 @@ from astropy.coordinates import SkyCoord
 from astropy.time import Time
 import pyvo
 
-from astroquery.alma import Alma
+from astroquery.alma import Alma, conf
 from astroquery.alma.core import _gen_sql, _OBSCORE_TO_ALMARESULT, get_enhanced_table
 from astroquery.alma.tapsql import _val_parse
 
@@ -694,3 +694,29 @@ def test_download_files():
     alma._request.return_value = Mock(headers={})
     result = alma.download_files(['https://location/file1'])
     assert not result
+
+
+def test_download_files_concurrent(caplog):
+    def _requests_mock(method, url, **kwargs):
+        response = Mock()
+        response.headers = {
+            'Content-Disposition': 'attachment; '
+                                   'filename={}'.format(url.split('/')[-1]),
+            'content-length': '1000000'}
+        return response
+
+    alma = Alma()
+    alma._request = Mock(side_effect=_requests_mock)
+    alma._download_file = Mock()
+    urls = ['https://location/file{}'.format(i) for i in range(5)]
+    with conf.set_temp('download_workers', 3), caplog.at_level('INFO'):
+        downloaded_files = alma.download_files(urls + urls[:2])
+        data_sizes, totalsize = alma._HEADER_data_size(urls)
+
+    assert [os.path.basename(filename) for filename in downloaded_files] == \
+        ['file{}'.format(i) for i in range(5)]
+    assert alma._download_file.call_count == 5
+    assert all(not call.kwargs['verbose'] for call in alma._download_file.call_args_list)
+    assert "Downloaded 5/5 files (0.01 of 0.01 GB" in caplog.text
+    assert list(data_sizes) == urls
+    assert u.isclose(totalsize, 0.005 * u.GB)
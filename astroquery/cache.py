@@ -0,0 +1,526 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Storage backends for the astroquery HTTP response cache.
+
+`~astroquery.query.BaseQuery` stores the responses of cached requests in a
+per-service cache location. How they are stored there is delegated to one of
+the backends defined here, selected by the ``cache_backend`` option of
+``astroquery.cache_conf``:
+
+``'pickle'``
+    One pickle file per request (the historical layout). Expiry relies on the
+    file modification time.
+``'sqlite'``
+    A single indexed SQLite database per service. Lookups do not touch the
+    file system beyond the database itself, and entries are evicted in least
+    recently used order once the size cap is reached.
+
+Additional backends can be made available with `register_cache_backend`.
+
+Independently of the services, `NameResolutionCache` keeps the coordinates of
+resolved object names in a single database shared by all services, enabled
+with the ``name_resolution_cache`` option of ``astroquery.cache_conf``.
+"""
+import abc
+import copy
+import pickle
+import sqlite3
+import threading
+import time
+
+from contextlib import closing
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import requests
+from astropy.config import paths
+from astropy.coordinates import SkyCoord
+
+from astroquery import log, cache_conf
+
+
+__all__ = ['CacheBackend', 'PickleCacheBackend', 'SQLiteCacheBackend',
+           'register_cache_backend', 'get_cache_backend',
+           'NameResolutionCache', 'get_name_resolution_cache', 'resolve_names']
+
+
+_CACHE_BACKENDS = {}
+
+
+def register_cache_backend(name, backend_class):
+    """
+    Make a cache backend selectable through ``cache_conf.cache_backend``.
+
+    Parameters
+    ----------
+    name : str
+        Name used in the configuration to select the backend.
+    backend_class : subclass of `CacheBackend`
+    """
+    if not (isinstance(backend_class, type) and issubclass(backend_class, CacheBackend)):
+        raise TypeError("backend_class must be a subclass of CacheBackend")
+    _CACHE_BACKENDS[name] = backend_class
+
+
+def get_cache_backend(name):
+    """Return the cache backend class registered under ``name``."""
+    try:
+        return _CACHE_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown cache backend '{name}', available backends are: "
+                         f"{', '.join(sorted(_CACHE_BACKENDS))}") from None
+
+
+def _copy_response(original_response):
+    """
+    Return a copy of ``original_response`` that can be pickled.
+
+    Copying a TAPService instance with an auth session produces some warnings
+    as a side affect. The hooks are not needed in the cache, so we remove
+    them before copying and restore them afterwards.
+    Related pyvo issue: https://github.com/astropy/pyvo/issues/755
+    """
+    hooks = None
+    if hasattr(original_response, 'request'):
+        hooks = original_response.request.hooks
+        del original_response.request.hooks
+    if hasattr(original_response, 'history'):
+        for r in original_response.history:
+            if hasattr(r, 'request'):
+                del r.request.hooks
+    response_copy = copy.deepcopy(original_response)
+    if hooks:
+        original_response.request.hooks = hooks
+    return response_copy
+
+
+def _is_expired(created, cache_timeout):
+    if cache_timeout == -1:
+        return False
+    current_time = datetime.now(timezone.utc)
+    cache_time = datetime.fromtimestamp(created, timezone.utc)
+    return current_time - cache_time > timedelta(seconds=cache_timeout)
+
+
+class CacheBackend(abc.ABC):
+    """
+    Base class for the storage of cached responses.
+
+    Subclasses implement ``_get``, ``_set``, ``_usage``, ``remove``,
+    ``evict`` and ``invalidate``; hit and miss counting and triggering the
+    eviction are handled here.
+
+    Parameters
+    ----------
+    location : str or `~pathlib.Path`
+        Directory holding the cache of a single service.
+    max_size : int, optional
+        Maximum size of the cache in bytes. Zero or None means unlimited.
+    """
+
+    name = None
+
+    def __init__(self, location, *, max_size=None):
+        self.location = Path(location)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, cache_timeout):
+        """
+        Return the cached response stored under ``key``, or None if it is
+        missing or older than ``cache_timeout`` seconds (-1 never expires).
+        """
+        response = self._get(key, cache_timeout)
+        if response is not None and not isinstance(response, requests.Response):
+            response = None
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    def set(self, key, response):
+        """Store ``response`` under ``key``, evicting old entries if needed."""
+        self._set(key, response)
+        if self.max_size:
+            self.evict(self.max_size)
+
+    def stats(self):
+        """
+        Return a dictionary with the number of ``entries``, their total
+        ``size`` in bytes and the ``hits`` and ``misses`` counted by this
+        instance.
+        """
+        entries, size = self._usage()
+        return {'backend': self.name, 'location': str(self.location),
+                'entries': entries, 'size': size, 'max_size': self.max_size,
+                'hits': self.hits, 'misses': self.misses}
+
+    def clear(self):
+        """Remove all entries."""
+        return self.invalidate()
+
+    @abc.abstractmethod
+    def _get(self, key, cache_timeout):
+        pass
+
+    @abc.abstractmethod
+    def _set(self, key, response):
+        pass
+
+    @abc.abstractmethod
+    def _usage(self):
+        pass
+
+    @abc.abstractmethod
+    def remove(self, key):
+        """Remove the entry stored under ``key``. Returns whether it existed."""
+
+    @abc.abstractmethod
+    def evict(self, max_size):
+        """Remove entries, least valuable first, until at most ``max_size`` bytes are used."""
+
+    @abc.abstractmethod
+    def invalidate(self, *, url=None, older_than=None):
+        """
+        Remove entries in bulk and return how many were removed.
+
+        Parameters
+        ----------
+        url : str, optional
+            Only remove responses whose URL starts with this prefix.
+        older_than : float, optional
+            Only remove responses stored more than this many seconds ago.
+        """
+
+
+class PickleCacheBackend(CacheBackend):
+    """
+    One pickle file per cached response, named after the request hash.
+
+    Size capping evicts the files with the oldest modification time first.
+    """
+
+    name = 'pickle'
+
+    def request_file(self, key):
+        return self.location.joinpath(key + ".pickle")
+
+    def _files(self):
+        return self.location.glob("*.pickle")
+
+    def _get(self, key, cache_timeout):
+        request_file = self.request_file(key)
+        try:
+            if _is_expired(request_file.stat().st_mtime, cache_timeout):
+                log.debug(f"Cache expired for {request_file}...")
+                return None
+            with open(request_file, "rb") as f:
+                response = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        log.debug("Retrieved data from {0}".format(request_file))
+        return response
+
+    def _set(self, key, response):
+        request_file = self.request_file(key)
+        log.debug("Caching data to {0}".format(request_file))
+        with open(request_file, "wb") as f:
+            pickle.dump(_copy_response(response), f, protocol=4)
+
+    def _usage(self):
+        sizes = [fle.stat().st_size for fle in self._files()]
+        return len(sizes), sum(sizes)
+
+    def remove(self, key):
+        try:
+            self.request_file(key).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def evict(self, max_size):
+        stats = sorted(((fle.stat(), fle) for fle in self._files()),
+                       key=lambda entry: entry[0].st_mtime)
+        size = sum(stat.st_size for stat, _ in stats)
+        for stat, fle in stats:
+            if size <= max_size:
+                break
+            fle.unlink(missing_ok=True)
+            size -= stat.st_size
+
+    def invalidate(self, *, url=None, older_than=None):
+        removed = 0
+        now = time.time()
+        for fle in self._files():
+            if older_than is not None and now - fle.stat().st_mtime <= older_than:
+                continue
+            if url is not None:
+                # The URL is only known after loading the response, which
+                # makes URL based invalidation slow for this backend.
+                with open(fle, "rb") as f:
+                    response = pickle.load(f)
+                if not (getattr(response, 'url', None) or '').startswith(url):
+                    continue
+            fle.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    All cached responses of a service in a single SQLite database.
+
+    The database is indexed on the request hash, so a lookup is a single
+    query regardless of the number of cached responses. Each entry records
+    its creation and last access time; size capping evicts the least
+    recently used entries first.
+    """
+
+    name = 'sqlite'
+    filename = 'cache.sqlite'
+
+    _schema = ("CREATE TABLE IF NOT EXISTS responses ("
+               "key TEXT PRIMARY KEY, url TEXT, created REAL NOT NULL, "
+               "accessed REAL NOT NULL, size INTEGER NOT NULL, data BLOB NOT NULL)",
+               "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def __init__(self, location, *, max_size=None):
+        super().__init__(location, max_size=max_size)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            for statement in self._schema:
+                conn.execute(statement)
+
+    @property
+    def database(self):
+        return self.location.joinpath(self.filename)
+
+    def _connect(self):
+        # A connection per operation keeps the backend usable from several
+        # threads; SQLite serializes the writers.
+        return closing(sqlite3.connect(self.database, timeout=30, isolation_level=None))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _get(self, key, cache_timeout):
+        with self._connect() as conn:
+            row = conn.execute("SELECT created, data FROM responses WHERE key = ?",
+                               (key,)).fetchone()
+            if row is None:
+                return None
+            created, data = row
+            if _is_expired(created, cache_timeout):
+                log.debug(f"Cache expired for {key} in {self.database}...")
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+        log.debug(f"Retrieved data for {key} from {self.database}")
+        return pickle.loads(data)
+
+    def _set(self, key, response):
+        log.debug(f"Caching data for {key} to {self.database}")
+        data = pickle.dumps(_copy_response(response), protocol=4)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                         (key, getattr(response, 'url', None), now, now, len(data), data))
+
+    def _usage(self):
+        with self._connect() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), TOTAL(size) FROM responses").fetchone()
+        return entries, int(size)
+
+    def remove(self, key):
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount > 0
+
+    def evict(self, max_size):
+        with self._lock, self._connect() as conn:
+            size = conn.execute("SELECT TOTAL(size) FROM responses").fetchone()[0]
+            if size <= max_size:
+                return
+            evicted = []
+            rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall()
+            for key, entry_size in rows:
+                if size <= max_size:
+                    break
+                evicted.append((key,))
+                size -= entry_size
+            conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+            log.debug(f"Evicted {len(evicted)} entries from {self.database}")
+
+    def invalidate(self, *, url=None, older_than=None):
+        conditions, parameters = [], []
+        if url is not None:
+            conditions.append("substr(url, 1, ?) = ?")
+            parameters += [len(url), url]
+        if older_than is not None:
+            conditions.append("created < ?")
+            parameters.append(time.time() - older_than)
+        statement = "DELETE FROM responses"
+        if conditions:
+            statement += " WHERE " + " AND ".join(conditions)
+        with self._connect() as conn:
+            removed = conn.execute(statement, parameters).rowcount
+            if not conditions:
+                conn.execute("VACUUM")
+        return removed
+
+
+register_cache_backend(PickleCacheBackend.name, PickleCacheBackend)
+register_cache_backend(SQLiteCacheBackend.name, SQLiteCacheBackend)
+
+
+class NameResolutionCache:
+    """
+    Persistent cache of the sky positions of object names, shared by all services.
+
+    Positions are stored in ICRS, per resolver, in a single SQLite database.
+    Names are compared case insensitively and with their whitespace normalized.
+
+    Parameters
+    ----------
+    location : str or `~pathlib.Path`, optional
+        Directory holding the database. Defaults to the astroquery cache directory.
+    """
+
+    filename = 'name_resolution.sqlite'
+
+    _schema = ("CREATE TABLE IF NOT EXISTS names ("
+               "resolver TEXT NOT NULL, name TEXT NOT NULL, ra REAL NOT NULL, "
+               "dec REAL NOT NULL, created REAL NOT NULL, PRIMARY KEY (resolver, name))",)
+
+    def __init__(self, location=None):
+        self.location = Path(location or Path(paths.get_cache_dir(), 'astroquery'))
+        self.location.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        with self._connect() as conn:
+            for statement in self._schema:
+                conn.execute(statement)
+
+    @property
+    def database(self):
+        return self.location.joinpath(self.filename)
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.database, timeout=30, isolation_level=None))
+
+    @staticmethod
+    def _key(name):
+        return ' '.join(name.split()).lower()
+
+    def get_many(self, names, *, resolver='', cache_timeout=None):
+        """
+        Return a dictionary of the cached `~astropy.coordinates.SkyCoord` of ``names``.
+
+        Names that are missing, or were cached more than ``cache_timeout``
+        seconds ago (-1 never expires), are left out. ``cache_timeout``
+        defaults to ``cache_conf.cache_timeout``.
+        """
+        if cache_timeout is None:
+            cache_timeout = cache_conf.cache_timeout
+        keys = {self._key(name): name for name in names}
+        rows = []
+        with self._connect() as conn:
+            # Stay below the SQLite limit on the number of parameters
+            key_list = list(keys)
+            for start in range(0, len(key_list), 500):
+                chunk = key_list[start:start + 500]
+                rows += conn.execute(f"SELECT name, ra, dec, created FROM names WHERE resolver = ? "
+                                     f"AND name IN ({', '.join('?' * len(chunk))})",
+                                     [resolver] + chunk).fetchall()
+        found = {}
+        for key, ra, dec, created in rows:
+            if not _is_expired(created, cache_timeout):
+                found[keys[key]] = SkyCoord(ra, dec, unit='deg', frame='icrs')
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return {name: found[name] for name in keys.values() if name in found}
+
+    def set_many(self, coordinates, *, resolver=''):
+        """Store the `~astropy.coordinates.SkyCoord` values of the ``coordinates`` dictionary under their names."""
+        now = time.time()
+        rows = []
+        for name, coord in coordinates.items():
+            icrs = coord.icrs
+            rows.append((resolver, self._key(name), float(icrs.ra.deg), float(icrs.dec.deg), now))
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO names VALUES (?, ?, ?, ?, ?)", rows)
+
+    def resolve(self, names, resolve_func, *, resolver=''):
+        """
+        Return a dictionary of the positions of ``names``, resolving only the uncached ones.
+
+        Parameters
+        ----------
+        names : list of str
+            The object names.
+        resolve_func : callable
+            Called with the list of names missing from the cache, returns a
+            dictionary of name: `~astropy.coordinates.SkyCoord` for those it resolved.
+        resolver : str, optional
+            Identifies the resolution service, names resolved by different
+            resolvers are cached separately.
+        """
+        found = self.get_many(names, resolver=resolver)
+        missing = [name for name in names if name not in found]
+        if missing:
+            resolved = resolve_func(missing)
+            self.set_many(resolved, resolver=resolver)
+            found.update(resolved)
+        return {name: found[name] for name in names if name in found}
+
+    def stats(self):
+        """
+        Return a dictionary with the number of cached ``entries`` and the
+        ``hits`` and ``misses`` counted by this instance.
+        """
+        with self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM names").fetchone()[0]
+        return {'location': str(self.database), 'entries': entries,
+                'hits': self.hits, 'misses': self.misses}
+
+    def clear(self, *, resolver=None):
+        """Remove the cached positions, only those of ``resolver`` if given. Returns how many were removed."""
+        with self._connect() as conn:
+            if resolver is None:
+                return conn.execute("DELETE FROM names").rowcount
+            return conn.execute("DELETE FROM names WHERE resolver = ?", (resolver,)).rowcount
+
+
+_name_resolution_caches = {}
+
+
+def get_name_resolution_cache():
+    """
+    Return the shared `NameResolutionCache`, or None if the
+    ``name_resolution_cache`` or ``cache_active`` options are off.
+    """
+    if not (cache_conf.cache_active and cache_conf.name_resolution_cache):
+        return None
+    location = Path(paths.get_cache_dir(), 'astroquery')
+    if location not in _name_resolution_caches:
+        _name_resolution_caches[location] = NameResolutionCache(location)
+    return _name_resolution_caches[location]
+
+
+def resolve_names(names, resolve_func, *, resolver=''):
+    """
+    Resolve ``names`` with ``resolve_func`` through the shared name resolution cache, if it is enabled.
+
+    See `NameResolutionCache.resolve` for the parameters.
+    """
+    cache = get_name_resolution_cache()
+    if cache is None:
+        return resolve_func(list(names))
+    return cache.resolve(list(names), resolve_func, resolver=resolver)
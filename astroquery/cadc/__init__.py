@@ -20,6 +20,8 @@ class Conf(_config.ConfigNamespace):
         'ivo://cadc.nrc.ca/gms', 'CADC login service identified')
     TIMEOUT = _config.ConfigItem(
         30, 'Time limit for connecting to template_module server.')
+    DATALINK_WORKERS = _config.ConfigItem(
+        1, 'Number of DataLink requests sent in parallel.')
 
 
 conf = Conf()
@@ -17,6 +17,7 @@ from urllib.error import HTTPError
 
 from ..utils.class_or_instance import class_or_instance
 from ..utils import async_to_sync, commons
+from ..utils.datalink import resolve_datalinks, check_datalink_errors
 from ..query import BaseQuery, BaseVOQuery
 from bs4 import BeautifulSoup
 from astropy import units as u
@@ -445,17 +446,7 @@ class CadcClass(BaseVOQuery, BaseQuery):
                 'publisherID column missing from query_result argument')
 
         result = []
-
-        # Send datalink requests in batches of 20 publisher ids
-        batch_size = 20
-
-        # Iterate through list of sublists to send datalink requests in batches
-        for pid_sublist in (publisher_ids[pos:pos + batch_size] for pos in
-                            range(0, len(publisher_ids), batch_size)):
-            datalink = pyvo.dal.adhoc.DatalinkResults.from_result_url(
-                '{}?{}'.format(self.data_link_url,
-                               urlencode({'ID': pid_sublist}, True)),
-                session=self.cadcdatalink._session)
+        for datalink in self._get_datalinks(publisher_ids):
             for service_def in datalink.bysemantics('#cutout'):
                 access_url = service_def.access_url
 
@@ -509,20 +500,10 @@ class CadcClass(BaseVOQuery, BaseQuery):
             raise AttributeError(
                 'publisherID column missing from query_result argument')
         result = []
-        # Send datalink requests in batches of 20 publisher ids
-        batch_size = 20
-
-        # Iterate through list of sublists to send datalink requests in batches
-        for pid_sublist in (publisher_ids[pos:pos + batch_size] for pos in
-                            range(0, len(publisher_ids), batch_size)):
-            # REQUEST=download-only is a CADC optimization to restrict
-            # results to downloadable URLs as opposed to redirects
-            # to other services such as cutouts that are not required
-            datalink = pyvo.dal.adhoc.DatalinkResults.from_result_url(
-                '{}?{}'.format(self.data_link_url,
-                               urlencode({'ID': pid_sublist,
-                                          'REQUEST': 'downloads-only'}, True)),
-                session=self.cadcdatalink._session)
+        # REQUEST=download-only is a CADC optimization to restrict
+        # results to downloadable URLs as opposed to redirects
+        # to other services such as cutouts that are not required
+        for datalink in self._get_datalinks(publisher_ids, REQUEST='downloads-only'):
             for service_def in datalink:
                 if service_def.semantics in ['http://www.opencadc.org/caom2#pkg', '#package']:
                     # TODO http://www.openadc.org/caom2#pkg has been replaced
@@ -538,6 +519,26 @@ class CadcClass(BaseVOQuery, BaseQuery):
                 result.append(service_def.access_url)
         return result
 
+    def _get_datalinks(self, publisher_ids, **params):
+        """
+        Returns the DataLink results for ``publisher_ids``, obtained in
+        batches of 20 distinct publisher ids sent ``conf.DATALINK_WORKERS`` at
+        a time. Failed batches are logged and skipped unless they all fail.
+        """
+        publisher_ids = list(dict.fromkeys(publisher_ids))
+        # Send datalink requests in batches of 20 publisher ids
+        batch_size = 20
+        urls = ['{}?{}'.format(self.data_link_url,
+                               urlencode({'ID': publisher_ids[pos:pos + batch_size], **params}, True))
+                for pos in range(0, len(publisher_ids), batch_size)]
+
+        def fetch_datalink(url):
+            return pyvo.dal.adhoc.DatalinkResults.from_result_url(url, session=self.cadcdatalink._session)
+
+        datalinks, errors = resolve_datalinks(urls, fetch_datalink, workers=conf.DATALINK_WORKERS)
+        check_datalink_errors(errors, len(urls))
+        return [datalink for datalink in datalinks if datalink is not None]
+
     def get_tables(self, *, only_names=False):
         """
         Gets all public tables
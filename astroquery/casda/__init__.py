@@ -33,6 +33,10 @@ class Conf(_config.ConfigNamespace):
         '',
         'Optional default username for CASDA archive.'
     )
+    datalink_workers = _config.ConfigItem(
+        1,
+        'Number of DataLink documents fetched in parallel when staging data.'
+    )
 
 
 conf = Conf()
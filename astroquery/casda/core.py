@@ -18,6 +18,7 @@ import numpy as np
 from ..query import QueryWithLogin
 from ..utils import commons
 from ..utils import async_to_sync
+from ..utils.datalink import resolve_datalinks, check_datalink_errors
 from . import conf
 from ..exceptions import LoginError
 
@@ -244,18 +245,23 @@ class CasdaClass(QueryWithLogin):
 
     def _create_job(self, table, service_name, verbose):
         # Use datalink to get authenticated access for each file
+        def fetch_datalink(access_url):
+            response = self._request('GET', access_url, auth=self._auth,
+                                     timeout=self.TIMEOUT, cache=False)
+            response.raise_for_status()
+            return self._parse_datalink_for_service_and_id(response, service_name)
+
+        # Each file only needs to be staged once
+        access_urls = list(dict.fromkeys(row['access_url'] for row in table if row['access_url']))
+        datalinks, errors = resolve_datalinks(access_urls, fetch_datalink, workers=conf.datalink_workers)
+        check_datalink_errors(errors, len(access_urls))
+
         tokens = []
         soda_url = None
-        for row in table:
-            access_url = row['access_url']
-            if access_url:
-                response = self._request('GET', access_url, auth=self._auth,
-                                         timeout=self.TIMEOUT, cache=False)
-                response.raise_for_status()
-                service_url, id_token = self._parse_datalink_for_service_and_id(response, service_name)
-                if id_token:
-                    tokens.append(id_token)
-                    soda_url = service_url
+        for service_url, id_token in filter(None, datalinks):
+            if id_token:
+                tokens.append(id_token)
+                soda_url = service_url
 
         # Trap a request with no allowed data
         if not soda_url:
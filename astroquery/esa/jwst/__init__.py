@@ -47,6 +47,10 @@ class Conf(_config.ConfigNamespace):
 
     JWST_ARCHIVE_TABLE = _config.ConfigItem("jwst.archive", "JWST archive table")
 
+    JWST_MAX_IDS_PER_QUERY = _config.ConfigItem(200,
+                                                "Maximum number of observation or plane identifiers "
+                                                "looked up in a single query.")
+
 
 conf = Conf()
 
@@ -23,7 +23,6 @@ import astroquery.esa.utils.utils as esautils
 from astropy import log
 from astropy import units
 from astropy.coordinates import Angle, SkyCoord
-from astropy.table import vstack
 from astropy.units import Quantity
 from requests.exceptions import ConnectionError
 
@@ -80,6 +79,10 @@ class JwstClass(BaseQuery):
         else:
             self.__jwstdata = data_handler
 
+        # Planes resolved so far, reused by the product queries
+        self.__observation_planes = {}
+        self.__plane_graph = {}
+
         if show_messages:
             self.get_status_messages()
 
@@ -759,51 +762,99 @@ class JwstClass(BaseQuery):
     def _get_associated_planes(self, plane_ids, cal_level,
                                max_cal_level, is_url):
         if (cal_level == max_cal_level):
-            if (not is_url):
-                list = "('{}')".format("', '".join(plane_ids))
-            else:
-                list = "{}".format(",".join(plane_ids))
-            return list
+            plane_list = plane_ids
         else:
-            plane_list = []
-            for plane_id in plane_ids:
-                siblings = self.__get_sibling_planes(planeid=plane_id, cal_level=cal_level)
-                members = self.__get_member_planes(planeid=plane_id, cal_level=cal_level)
-                plane_id_table = vstack([siblings, members])
-                plane_list.extend(plane_id_table['product_planeid'])
-            if (not is_url):
-                list = "('{}')".format("', '".join(plane_list))
-            else:
-                list = "{}".format(",".join(plane_list))
+            plane_list = self._get_product_planes(plane_ids=plane_ids,
+                                                  cal_level=cal_level)
+        if (not is_url):
+            list = "('{}')".format("', '".join(plane_list))
+        else:
+            list = "{}".format(",".join(plane_list))
         return list
 
+    def _get_product_planes(self, plane_ids, cal_level):
+        """Return the planes holding the products of ``plane_ids`` at
+        ``cal_level``, their siblings first and then their members.
+
+        The planes not resolved yet by this instance are looked up together,
+        with at most ``conf.JWST_MAX_IDS_PER_QUERY`` of them per query.
+        """
+        missing = [plane_id for plane_id in dict.fromkeys(plane_ids)
+                   if (plane_id, cal_level) not in self.__plane_graph]
+        for chunk in self.__chunks(missing):
+            products = {plane_id: ([], []) for plane_id in chunk}
+            siblings = self.__get_sibling_planes(planeids=chunk, cal_level=cal_level)
+            members = self.__get_member_planes(planeids=chunk, cal_level=cal_level)
+            for index, table in enumerate([siblings, members]):
+                for row in table:
+                    plane_id = JwstClass.get_decoded_string(row['planeid'])
+                    products[plane_id][index].append(
+                        JwstClass.get_decoded_string(row['product_planeid']))
+            for plane_id, (sibling_ids, member_ids) in products.items():
+                self.__plane_graph[(plane_id, cal_level)] = sibling_ids + member_ids
+        plane_list = []
+        for plane_id in plane_ids:
+            plane_list.extend(self.__plane_graph[(plane_id, cal_level)])
+        return plane_list
+
     def _get_plane_id(self, observation_id):
         try:
-            planeids = []
-            query_plane = (f"select distinct m.planeid, m.calibrationlevel "
-                           f"from {conf.JWST_MAIN_TABLE} m where "
-                           f"m.observationid = '{observation_id}'")
-            job = self.__jwsttap.launch_job(query=query_plane)
-            job.get_results().sort(["calibrationlevel"])
-            job.get_results().reverse()
-            max_cal_level = job.get_results()["calibrationlevel"][0]
-            for row in job.get_results():
-                if row["calibrationlevel"] == max_cal_level:
-                    planeids.append(
-                        JwstClass.get_decoded_string(row["planeid"]))
-            return planeids, max_cal_level
+            if observation_id not in self.__observation_planes:
+                self._get_plane_ids(observation_ids=[observation_id])
+            return self.__observation_planes[observation_id]
         except Exception:
             raise ValueError("This observation_id does not exist in "
                              "JWST database")
 
-    def __get_sibling_planes(self, planeid, *, cal_level='ALL'):
+    def _get_plane_ids(self, observation_ids):
+        """Look up the planes of the highest calibration level of each of
+        ``observation_ids``, with at most ``conf.JWST_MAX_IDS_PER_QUERY``
+        observations per query.
+
+        Returns a dictionary of the (planeids, max_cal_level) of the
+        observations found in the archive.
+        """
+        missing = [observation_id for observation_id in dict.fromkeys(observation_ids)
+                   if observation_id not in self.__observation_planes]
+        for chunk in self.__chunks(missing):
+            query_plane = (f"select distinct m.observationid, m.planeid, "
+                           f"m.calibrationlevel from {conf.JWST_MAIN_TABLE} m "
+                           f"where m.observationid IN {self.__in_list(chunk)}")
+            job = self.__jwsttap.launch_job(query=query_plane)
+            levels = {}
+            for row in job.get_results():
+                observation_id = JwstClass.get_decoded_string(row["observationid"])
+                levels.setdefault(observation_id, []).append(
+                    (row["calibrationlevel"],
+                     JwstClass.get_decoded_string(row["planeid"])))
+            for observation_id, planes in levels.items():
+                max_cal_level = max(level for level, _ in planes)
+                # Same order as the reversed sort by calibration level
+                planeids = [planeid for level, planeid in reversed(planes)
+                            if level == max_cal_level]
+                self.__observation_planes[observation_id] = (planeids, max_cal_level)
+        return {observation_id: self.__observation_planes[observation_id]
+                for observation_id in observation_ids
+                if observation_id in self.__observation_planes}
+
+    @staticmethod
+    def __chunks(ids):
+        size = max(int(conf.JWST_MAX_IDS_PER_QUERY), 1)
+        for start in range(0, len(ids), size):
+            yield ids[start:start + size]
+
+    @staticmethod
+    def __in_list(ids):
+        return "('{}')".format("', '".join(ids))
+
+    def __get_sibling_planes(self, planeids, *, cal_level='ALL'):
         where_clause = ""
         if (cal_level == "ALL"):
             where_clause = "WHERE sp.calibrationlevel<=p.calibrationlevel "\
-                           "AND p.planeid ="
+                           "AND p.planeid IN "
         else:
             where_clause = (f"WHERE sp.calibrationlevel={cal_level} AND "
-                            f"p.planeid =")
+                            f"p.planeid IN ")
         try:
             query_siblings = (f"SELECT o.observationuri, p.planeid, "
                               f"p.calibrationlevel, sp.planeid as "
@@ -813,19 +864,20 @@ class JwstClass(BaseQuery):
                               f"{conf.JWST_PLANE_TABLE} p ON "
                               f"p.obsid=o.obsid JOIN "
                               f"{conf.JWST_PLANE_TABLE} sp ON "
-                              f"sp.obsid=o.obsid {where_clause}'{planeid}'")
+                              f"sp.obsid=o.obsid {where_clause}"
+                              f"{self.__in_list(planeids)}")
             job = self.__jwsttap.launch_job(query=query_siblings)
             return job.get_results()
         except Exception as e:
             raise ValueError(e)
 
-    def __get_member_planes(self, planeid, *, cal_level='ALL'):
+    def __get_member_planes(self, planeids, *, cal_level='ALL'):
         where_clause = ""
         if (cal_level == "ALL"):
-            where_clause = "WHERE p.planeid ="
+            where_clause = "WHERE p.planeid IN "
         else:
             where_clause = (f"WHERE mp.calibrationlevel={cal_level} AND "
-                            f"p.planeid =")
+                            f"p.planeid IN ")
         try:
             query_members = (f"SELECT o.observationuri, p.planeid, "
                              f"p.calibrationlevel, mp.planeid as "
@@ -840,7 +892,7 @@ class JwstClass(BaseQuery):
                              f"mo on m.memberid=mo.observationuri JOIN "
                              f"{conf.JWST_PLANE_TABLE} mp on "
                              f"mo.obsid=mp.obsid "
-                             f"{where_clause}'{planeid}'")
+                             f"{where_clause}{self.__in_list(planeids)}")
             job = self.__jwsttap.launch_job(query=query_members)
             return job.get_results()
         except Exception as e:
@@ -1064,6 +1116,12 @@ class JwstClass(BaseQuery):
             print(query)
         job = self.__jwsttap.launch_job_async(query=query, verbose=verbose)
         allobs = set(JwstClass.get_decoded_string(job.get_results()['observationid']))
+        # Resolve the planes of the whole program up front, in a few queries
+        observation_planes = self._get_plane_ids(observation_ids=list(allobs))
+        self._get_product_planes(
+            plane_ids=[plane_id for plane_ids, _ in observation_planes.values()
+                       for plane_id in plane_ids],
+            cal_level='ALL')
         for oid in allobs:
             log.info(f"Downloading products for Observation ID: {oid}")
             self.get_obs_products(observation_id=oid, product_type=product_type)
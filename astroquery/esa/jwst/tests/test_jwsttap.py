@@ -691,6 +691,53 @@ class TestTap:
             jwst.download_files_from_program()
         assert "missing 1 required positional argument: 'proposal_id'" in err.value.args[0]
 
+    def test_get_plane_graph(self, monkeypatch):
+        monkeypatch.undo()
+        monkeypatch.setattr(conf, 'JWST_MAX_IDS_PER_QUERY', 2)
+
+        def launch_job(query):
+            job = MagicMock()
+            if 'm.observationid IN' in query:
+                results = Table({'observationid': ['obs1', 'obs1', 'obs2', 'obs3'],
+                                 'planeid': ['p1', 'p1b', 'p2', 'p3'],
+                                 'calibrationlevel': [3, 2, 3, 3]})
+            elif 'sp.planeid as product_planeid' in query:
+                results = Table({'planeid': ['p1', 'p2', 'p1'],
+                                 'product_planeid': ['p1', 'p2', 'p1b']})
+            else:
+                results = Table({'planeid': ['p1', 'p3'],
+                                 'product_planeid': ['m1', 'm3']})
+            key = results.colnames[0]
+            results = results[[f"'{value}'" in query for value in results[key]]]
+            job.get_results.return_value = results
+            return job
+
+        tap_handler = MagicMock()
+        tap_handler.launch_job.side_effect = launch_job
+        jwst = JwstClass(tap_plus_handler=tap_handler, data_handler=tap_handler, show_messages=False)
+
+        observation_planes = jwst._get_plane_ids(observation_ids=['obs1', 'obs2', 'obs3', 'obs4'])
+        assert observation_planes == {'obs1': (['p1'], 3), 'obs2': (['p2'], 3), 'obs3': (['p3'], 3)}
+        # The observations are looked up in chunks of two
+        assert tap_handler.launch_job.call_count == 2
+        assert "IN ('obs1', 'obs2')" in tap_handler.launch_job.call_args_list[0].kwargs['query']
+
+        tap_handler.launch_job.reset_mock()
+        assert jwst._get_plane_id(observation_id='obs2') == (['p2'], 3)
+        assert jwst._get_associated_planes(plane_ids=['p1', 'p2', 'p3'], cal_level='ALL',
+                                           max_cal_level=3, is_url=True) == 'p1,p1b,m1,p2,m3'
+        # Siblings and members of two chunks of planes
+        assert tap_handler.launch_job.call_count == 4
+
+        # Resolved planes are not queried again
+        tap_handler.launch_job.reset_mock()
+        assert jwst._get_associated_planes(plane_ids=['p3', 'p1'], cal_level='ALL',
+                                           max_cal_level=3, is_url=False) == "('m3', 'p1', 'p1b', 'm1')"
+        assert tap_handler.launch_job.call_count == 0
+
+        with pytest.raises(ValueError, match="does not exist"):
+            jwst._get_plane_id(observation_id='obs4')
+
     def test_get_obs_products(self):
         dummyTapHandler = DummyTapHandler()
         jwst = JwstClass(tap_plus_handler=dummyTapHandler, data_handler=dummyTapHandler, show_messages=False)
@@ -18,6 +18,11 @@ class Conf(_config.ConfigNamespace):
         10000,
         'Maximum number of rows returned (set to -1 for unlimited).')
 
+    query_workers = _config.ConfigItem(
+        1,
+        'Maximum number of missions or catalogs queried at the same time '
+        'when querying several of them.')
+
 
 conf = Conf()
 
@@ -6,13 +6,17 @@ import tarfile as esatar
 import sys
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from io import BytesIO
 from zipfile import ZipFile
 from pathlib import Path
 
+import numpy as np
 from astropy import units as u
 from astropy.coordinates import Angle
 from astropy.io import fits
+from astropy.table import Table
 from astropy.utils.console import ProgressBar
 from astroquery import log
 from requests import HTTPError
@@ -33,6 +37,15 @@ if hasattr(esatar, "fully_trusted_filter"):
     esatar.TarFile.extraction_filter = staticmethod(esatar.fully_trusted_filter)
 
 
+@contextmanager
+def _vo_warnings_filter(verbose):
+    with warnings.catch_warnings():
+        if not verbose:
+            commons.suppress_vo_warnings()
+            warnings.filterwarnings("ignore", category=u.UnitsWarning)
+        yield
+
+
 @async_to_sync
 class ESASkyClass(BaseQuery):
 
@@ -51,6 +64,7 @@ class ESASkyClass(BaseQuery):
     __ZERO_ARCMIN_STRING = "0 arcmin"
     __MIN_RADIUS_CATALOG_DEG = Angle(5 * u.arcsec).to_value(u.deg)
     __HERSCHEL_STRING = 'herschel'
+    __POSITIONS_TABLE = 'positions'
 
     __HERSCHEL_FILTERS = {
         'psw': '250',
@@ -107,15 +121,15 @@ class ESASkyClass(BaseQuery):
         -------
         A table object
         """
-        if not verbose:
-            with warnings.catch_warnings():
-                commons.suppress_vo_warnings()
-                warnings.filterwarnings("ignore", category=u.UnitsWarning)
-                job = self._tap.launch_job(query=query, output_file=output_file, output_format=output_format,
-                                           verbose=False, dump_to_file=output_file is not None)
-        else:
-            job = self._tap.launch_job(query=query, output_file=output_file, output_format=output_format,
-                                       verbose=True, dump_to_file=output_file is not None)
+        with _vo_warnings_filter(verbose):
+            return self._launch_query(query, output_file=output_file, output_format=output_format,
+                                      verbose=verbose)
+
+    def _launch_query(self, query, *, output_file=None, output_format="votable", verbose=False,
+                      upload_resource=None, upload_table_name=None):
+        job = self._tap.launch_job(query=query, output_file=output_file, output_format=output_format,
+                                   verbose=verbose, dump_to_file=output_file is not None,
+                                   upload_resource=upload_resource, upload_table_name=upload_table_name)
         return job.get_results()
 
     def get_tables(self, *, only_names=True, verbose=False, cache=True):
@@ -654,7 +668,9 @@ class ESASkyClass(BaseQuery):
         ----------
         position : str or `astropy.coordinates` object
             Can either be a string of the location, eg 'M51', or the coordinates
-            of the object.
+            of the object. Several coordinates are matched in a single query
+            per mission, and the rows found for each of them are identified by
+            the ``position_index`` column.
         radius : str or `~astropy.units.Quantity`
             The radius of a region.
         missions : str or list, optional
@@ -722,7 +738,9 @@ class ESASkyClass(BaseQuery):
         ----------
         position : str or `astropy.coordinates` object
             Can either be a string of the location, eg 'M51', or the coordinates
-            of the object.
+            of the object. Several coordinates are matched in a single query
+            per mission, and the rows found for each of them are identified by
+            the ``position_index`` column.
         radius : str or `~astropy.units.Quantity`
             The radius of a region.
         catalogs : str or list, optional
@@ -791,7 +809,9 @@ class ESASkyClass(BaseQuery):
         ----------
         position : str or `astropy.coordinates` object
             Can either be a string of the location, eg 'M51', or the coordinates
-            of the object.
+            of the object. Several coordinates are matched in a single query
+            per mission, and the rows found for each of them are identified by
+            the ``position_index`` column.
         radius : str or `~astropy.units.Quantity`
             The radius of a region.
         missions : str or list, optional
@@ -1693,18 +1713,33 @@ class ESASkyClass(BaseQuery):
         start_index = product_url.rindex("/") + 1
         return product_url[start_index:]
 
-    def _query(self, name, descriptors, verbose=False, **kwargs):
+    def _build_query(self, name, descriptors, **kwargs):
         if 'ids' in kwargs:
-            query = self._build_id_query(ids=kwargs.get('ids'),
-                                         row_limit=kwargs.get('row_limit'),
-                                         descriptor=descriptors[name])
-        else:
-            query = self._build_region_query(coordinates=kwargs.get('coordinates'), radius=kwargs.get('radius'),
-                                             row_limit=kwargs.get('row_limit'),
-                                             descriptor=descriptors[name])
+            return self._build_id_query(ids=kwargs.get('ids'),
+                                        row_limit=kwargs.get('row_limit'),
+                                        descriptor=descriptors[name])
+        if not kwargs.get('coordinates').isscalar:
+            return self._build_positions_query(radius=kwargs.get('radius'),
+                                               row_limit=kwargs.get('row_limit'),
+                                               descriptor=descriptors[name])
+        return self._build_region_query(coordinates=kwargs.get('coordinates'), radius=kwargs.get('radius'),
+                                        row_limit=kwargs.get('row_limit'),
+                                        descriptor=descriptors[name])
+
+    def _query_upload(self, coordinates):
+        # Several positions are uploaded as a table and matched in a single query
+        if coordinates is None or coordinates.isscalar:
+            return {}
+        icrs = coordinates.transform_to('icrs')
+        positions = Table({'position_index': np.arange(len(icrs)),
+                           'ra': icrs.ra.deg, 'dec': icrs.dec.deg})
+        return {'upload_resource': positions, 'upload_table_name': self.__POSITIONS_TABLE}
+
+    def _query(self, name, descriptors, verbose=False, **kwargs):
+        query = self._build_query(name=name, descriptors=descriptors, **kwargs)
 
         if 'get_query_payload' in kwargs and kwargs.get('get_query_payload'):
-            return self._create_request_payload(query)
+            return self._create_request_payload(query, **self._query_upload(kwargs.get('coordinates')))
 
         if not query:
             # Could not create query. The most common reason for this is a type mismatch between user specified ID and
@@ -1714,7 +1749,9 @@ class ESASkyClass(BaseQuery):
             # is a number and "2CXO J090341.1-322609" cannot be converted to a number.
             return query
 
-        return self.query(query, output_format="votable", verbose=verbose)
+        with _vo_warnings_filter(verbose):
+            return self._launch_query(query, output_format="votable", verbose=verbose,
+                                      **self._query_upload(kwargs.get('coordinates')))
 
     def _build_region_query(self, coordinates, radius, row_limit, descriptor):
         ra = coordinates.transform_to('icrs').ra.deg
@@ -1755,6 +1792,32 @@ class ESASkyClass(BaseQuery):
 
         return query
 
+    def _build_positions_query(self, radius, row_limit, descriptor):
+        radius_deg = Angle(radius).to_value(u.deg)
+        if radius_deg == 0:
+            radius_deg = self.__MIN_RADIUS_CATALOG_DEG
+
+        select_query = "SELECT "
+        if row_limit > 0:
+            select_query = "".join([select_query, "TOP {} ".format(row_limit)])
+        elif row_limit != -1:
+            raise ValueError("Invalid value of row_limit")
+
+        select_query = "".join([select_query, "u.position_index, c.* "])
+
+        from_query = " FROM tap_upload.{} AS u JOIN {} AS c".format(
+            self.__POSITIONS_TABLE, descriptor['table_name'])
+        if descriptor['intersect_polygon_query']:
+            join_query = (" ON 1=INTERSECTS(CIRCLE('ICRS', u.ra, u.dec, {}), c.fov)".
+                          format(radius_deg))
+        else:
+            join_query = (" ON 1=CONTAINS(POINT('ICRS', c.{}, c.{}), CIRCLE('ICRS', u.ra, u.dec, {}))".
+                          format(descriptor['ra'], descriptor['dec'], radius_deg))
+        query = "".join([select_query, from_query,
+                         join_query])
+
+        return query
+
     def _build_id_query(self, ids, row_limit, descriptor):
         select_query = "SELECT "
         if row_limit > 0:
@@ -1795,8 +1858,33 @@ class ESASkyClass(BaseQuery):
         return query
 
     def _store_query_result(self, query_result, names, descriptors, verbose=False, **kwargs):
-        for name in names:
-            table = self._query(name=name, descriptors=descriptors, verbose=verbose, **kwargs)
+        workers = min(int(conf.query_workers), len(names))
+        if workers <= 1 or kwargs.get('get_query_payload'):
+            for name in names:
+                table = self._query(name=name, descriptors=descriptors, verbose=verbose, **kwargs)
+                if len(table) > 0:
+                    query_result[name] = table
+            return
+
+        # Building some of the queries queries the service itself, through
+        # ``query`` whose warning filters are not thread safe: only the
+        # final queries are sent in parallel.
+        queries = [self._build_query(name=name, descriptors=descriptors, **kwargs) for name in names]
+        upload = self._query_upload(kwargs.get('coordinates'))
+
+        def run(query):
+            if not query:
+                return query
+            return self._launch_query(query, output_format="votable", verbose=verbose, **upload)
+
+        with _vo_warnings_filter(verbose):
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                tables = list(executor.map(run, queries))
+            finally:
+                # don't send the remaining queries if one of them failed
+                executor.shutdown(cancel_futures=True)
+        for name, table in zip(names, tables):
             if len(table) > 0:
                 query_result[name] = table
 
@@ -1841,9 +1929,14 @@ class ESASkyClass(BaseQuery):
         where descriptor_table_name='{}'""".format(data_table)
         return self.query(query)[0]['xmatch_table']
 
-    def _create_request_payload(self, query):
-        return {'REQUEST': 'doQuery', 'LANG': 'ADQL', 'FORMAT': 'VOTABLE',
-                'QUERY': query}
+    def _create_request_payload(self, query, upload_resource=None, upload_table_name=None):
+        payload = {'REQUEST': 'doQuery', 'LANG': 'ADQL', 'FORMAT': 'VOTABLE',
+                   'QUERY': query}
+        if upload_resource is not None:
+            # the uploaded table is sent as the multipart part of this name
+            payload['UPLOAD'] = '{0},param:{0}'.format(upload_table_name)
+            payload[upload_table_name] = upload_resource
+        return payload
 
     def _send_get_request(self, url_extension, request_payload, cache):
         url = self.URLbase + url_extension
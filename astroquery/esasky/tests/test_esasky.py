@@ -0,0 +1,91 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+
+import threading
+import time
+
+import astropy.units as u
+import pytest
+from astropy.coordinates import SkyCoord
+from astropy.table import Table
+
+from astroquery.esasky import ESASkyClass, conf
+
+DESCRIPTORS = {
+    'HSC': {'mission': 'HSC', 'table_name': 'catalogues.hsc',
+            'intersect_polygon_query': False, 'ra': 'ra', 'dec': 'dec'},
+    'XMM-OM': {'mission': 'XMM-OM', 'table_name': 'catalogues.xmm_om',
+               'intersect_polygon_query': False, 'ra': 'raj2000', 'dec': 'dej2000'},
+    'GAIA-DR3': {'mission': 'GAIA-DR3', 'table_name': 'catalogues.gaia_dr3',
+                 'intersect_polygon_query': False, 'ra': 'ra', 'dec': 'dec'},
+}
+
+POSITIONS = SkyCoord([202.469575, 210.802429], [47.195258, 54.348750], unit="deg")
+
+
+class MockJob:
+
+    def __init__(self, table):
+        self.table = table
+
+    def get_results(self):
+        return self.table
+
+
+class MockTap:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def launch_job(self, query, *, output_file=None, output_format="votable", verbose=False,
+                   dump_to_file=False, upload_resource=None, upload_table_name=None):
+        table_name = query.split(" JOIN ")[1].split()[0]
+        # The first catalogue answers last
+        if table_name == 'catalogues.hsc':
+            time.sleep(0.2)
+        with self.lock:
+            self.calls.append({'query': query, 'upload_resource': upload_resource,
+                               'upload_table_name': upload_table_name})
+        return MockJob(Table({'position_index': [0, 1], 'table_name': [table_name] * 2}))
+
+
+@pytest.fixture
+def esasky(monkeypatch):
+    esasky = ESASkyClass(tap_handler=MockTap())
+    monkeypatch.setattr(esasky, '_get_catalogs_info', lambda: DESCRIPTORS)
+    return esasky
+
+
+def test_query_region_catalogs_positions(esasky):
+    with conf.set_temp('query_workers', 3):
+        result = esasky.query_region_catalogs(position=POSITIONS, radius=1 * u.arcmin,
+                                              catalogs=["HSC", "XMM-OM", "GAIA-DR3"])
+
+    assert list(result.keys()) == ["HSC", "XMM-OM", "GAIA-DR3"]
+    for name in result.keys():
+        assert result[name]['table_name'][0] == DESCRIPTORS[name]['table_name']
+
+    calls = esasky._tap.calls
+    assert len(calls) == 3
+    # The slow first catalogue did not block the others
+    assert calls[-1]['query'].split(" JOIN ")[1].startswith('catalogues.hsc')
+    for call in calls:
+        assert "FROM tap_upload.positions AS u JOIN" in call['query']
+        assert "CIRCLE('ICRS', u.ra, u.dec, " in call['query']
+        assert call['upload_table_name'] == 'positions'
+        upload = call['upload_resource']
+        assert upload.colnames == ['position_index', 'ra', 'dec']
+        assert list(upload['position_index']) == [0, 1]
+        assert upload['ra'][1] == pytest.approx(210.802429)
+        assert upload['dec'][0] == pytest.approx(47.195258)
+
+
+def test_query_region_catalogs_positions_payload(esasky):
+    payload = esasky.query_region_catalogs(position=POSITIONS, radius=1 * u.arcmin,
+                                           catalogs="XMM-OM", get_query_payload=True)
+    payload = payload["XMM-OM"]
+    assert "JOIN catalogues.xmm_om AS c" in payload['QUERY']
+    assert "POINT('ICRS', c.raj2000, c.dej2000)" in payload['QUERY']
+    assert payload['UPLOAD'] == 'positions,param:positions'
+    assert list(payload['positions']['position_index']) == [0, 1]
+    assert not esasky._tap.calls
@@ -4,12 +4,14 @@ import os
 from pathlib import Path
 
 import pytest
+import astropy.units as u
+from astropy.coordinates import SkyCoord
 from astropy.io.fits.hdu.hdulist import HDUList
 
 from astroquery.utils.commons import TableList
 from astroquery.utils.tap.model.tapcolumn import TapColumn
 from astroquery.utils.tap.model.taptable import TapTableMeta
-from astroquery.esasky import ESASky
+from astroquery.esasky import ESASky, conf
 
 
 @pytest.mark.remote_data
@@ -33,6 +35,16 @@ class TestESASky:
         assert "1342221275" in result["HERSCHEL"].columns["observation_id"]
         assert "1342221848" in result["HERSCHEL"].columns["observation_id"]
 
+    def test_esasky_query_region_catalogs_positions(self):
+        positions = SkyCoord([202.469575, 210.802429], [47.195258, 54.348750], unit="deg")
+        with conf.set_temp('query_workers', 2):
+            result = ESASky.query_region_catalogs(position=positions, radius=1 * u.arcmin,
+                                                  catalogs=["HSC", "XMM-OM"])
+        assert isinstance(result, TableList)
+        for table in result.values():
+            assert set(table["position_index"]) <= {0, 1}
+        assert set(result["HSC"]["position_index"]) == {0, 1}
+
     def test_esasky_query_ids_catalogs(self):
         result = ESASky.query_ids_catalogs(source_ids=["2CXO J090341.1-322609", "2CXO J090353.8-322642"],
                                            catalogs="CHANDRA-SC2")
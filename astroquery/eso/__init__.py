@@ -24,6 +24,12 @@ class Conf(_config.ConfigNamespace):
     tap_cat_url = _config.ConfigItem(
         "https://archive.eso.org/tap_cat",
         'URL for TAP catalogue queries.')
+    download_workers = _config.ConfigItem(
+        1,
+        'Number of files downloaded in parallel by retrieve_data.')
+    header_workers = _config.ConfigItem(
+        1,
+        'Number of headers requested in parallel by get_headers.')
 
 
 conf = Conf()
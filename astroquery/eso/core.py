@@ -9,6 +9,8 @@ European Southern Observatory (ESO)
 import base64
 import email
 import functools
+import hashlib
+import html
 import json
 import os
 import os.path
@@ -19,6 +21,8 @@ import subprocess
 import time
 import warnings
 import xml.etree.ElementTree as ET
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple, Dict, Set, Union
 
 import astropy.utils.data
@@ -26,7 +30,6 @@ import keyring
 import requests
 from astropy.table import Table, Column
 from astropy.utils.decorators import deprecated_renamed_argument
-from bs4 import BeautifulSoup
 from pyvo.dal import TAPService
 from pyvo.dal.exceptions import DALQueryError, DALFormatError, DALOverflowWarning
 
@@ -50,6 +53,37 @@ class CalSelectorError(Exception):
     """
 
 
+_HEADER_PRE_RE = re.compile(r'<pre[^>]*>(.*?)</pre>', re.DOTALL | re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+class _GzipStreamDecompressor:
+    """
+    Writes the uncompressed content of the gzip stream fed to `write` into
+    ``filename``.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._fd = open(filename, 'wb')
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def write(self, data: bytes):
+        while data:
+            try:
+                self._fd.write(self._decompressor.decompress(data))
+            except zlib.error as ex:
+                raise RuntimeError(f"Unable to uncompress {self.filename}: {ex}") from ex
+            # Concatenated gzip members are uncompressed one after the other
+            data = self._decompressor.unused_data
+            if data:
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def close(self):
+        self._fd.write(self._decompressor.flush())
+        self._fd.close()
+
+
 class _AuthInfo:
     def __init__(self, username: str, token: str):
         self.username = username
@@ -790,51 +824,75 @@ class EsoClass(QueryWithLogin):
         _schema_product_ids = schema.Schema(
             schema.Or(Column, [schema.Schema(str)]))
         _schema_product_ids.validate(product_ids)
-        # Get all headers
-        result = []
-        for dp_id in product_ids:
+
+        def get_header(dp_id):
             response = self._request(
                 "GET", f"https://archive.eso.org/hdr?DpId={dp_id}",
                 cache=cache)
-            root = BeautifulSoup(response.content, 'html5lib')
-            hdr = root.select('pre')[0].text
-            header = {'DP.ID': dp_id}
-            for key_value in hdr.split('\n'):
-                if "=" in key_value:
-                    key, value = key_value.split('=', 1)
-                    key = key.strip()
-                    value = value.split('/', 1)[0].strip()
-                    if key[0:7] != "COMMENT":  # drop comments
-                        if value == "T":  # Convert boolean T to True
-                            value = True
-                        elif value == "F":  # Convert boolean F to False
-                            value = False
-                        # Convert to string, removing quotation marks
-                        elif value[0] == "'":
-                            value = value[1:-1]
-                        elif "." in value or "E" in value:  # Convert to float
-                            value = float(value)
-                        else:  # Convert to integer
-                            value = int(value)
-                        header[key] = value
-                elif key_value.startswith("END"):
-                    break
-            result.append(header)
-        # Identify all columns
-        columns = []
-        column_types = []
-        for header in result:
-            for key in header:
+            return self._parse_header_page(response.text, dp_id)
+
+        # Get all headers
+        product_ids = list(product_ids)
+        if conf.header_workers > 1 and len(product_ids) > 1:
+            with ThreadPoolExecutor(max_workers=conf.header_workers) as executor:
+                result = list(executor.map(get_header, product_ids))
+        else:
+            result = [get_header(dp_id) for dp_id in product_ids]
+        return self._headers_to_table(result)
+
+    @staticmethod
+    def _parse_header_page(page: str, dp_id: str) -> Dict[str, Union[str, bool, int, float]]:
+        """
+        Parse the FITS header shown in the ``<pre>`` element of an archive
+        header page.
+        """
+        match = _HEADER_PRE_RE.search(page)
+        if match is None:
+            raise RemoteServiceError(f"Unable to find the header of {dp_id}")
+        hdr = html.unescape(_HTML_TAG_RE.sub('', match.group(1)))
+        header = {'DP.ID': dp_id}
+        for key_value in hdr.split('\n'):
+            if "=" in key_value:
+                key, value = key_value.split('=', 1)
+                key = key.strip()
+                value = value.split('/', 1)[0].strip()
+                if key[0:7] != "COMMENT":  # drop comments
+                    if value == "T":  # Convert boolean T to True
+                        value = True
+                    elif value == "F":  # Convert boolean F to False
+                        value = False
+                    # Convert to string, removing quotation marks
+                    elif value[0] == "'":
+                        value = value[1:-1]
+                    elif "." in value or "E" in value:  # Convert to float
+                        value = float(value)
+                    else:  # Convert to integer
+                        value = int(value)
+                    header[key] = value
+            elif key_value.startswith("END"):
+                break
+        return header
+
+    @staticmethod
+    def _headers_to_table(headers: List[dict]) -> Table:
+        """
+        Build a table from a list of headers, one column per keyword. Missing
+        keywords are set to the default value of the type of the keyword in
+        the first header where it appears.
+        """
+        columns = {}
+        column_types = {}
+        for i, header in enumerate(headers):
+            for key, value in header.items():
                 if key not in columns:
-                    columns.append(key)
-                    column_types.append(type(header[key]))
+                    columns[key] = [None] * len(headers)
+                    column_types[key] = type(value)
+                columns[key][i] = value
         # Add all missing elements
-        for item in result:
-            for (column, column_type) in zip(columns, column_types):
-                if column not in item:
-                    item[column] = column_type()
-        # Return as Table
-        return Table(result)
+        for key, values in columns.items():
+            default = column_types[key]()
+            columns[key] = [default if value is None else value for value in values]
+        return Table(columns)
 
     @staticmethod
     def _get_filename_from_response(response: requests.Response) -> str:
@@ -855,42 +913,120 @@ class EsoClass(QueryWithLogin):
                 return True
         return False
 
+    @staticmethod
+    def _get_expected_size(response: requests.Response) -> Optional[int]:
+        content_range = response.headers.get("Content-Range", "")
+        if response.status_code == 206 and "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            return int(total) if total.isdigit() else None
+        content_length = response.headers.get("Content-Length")
+        return int(content_length) if content_length and content_length.isdigit() else None
+
     def _download_eso_file(self, file_link: str, destination: str,
-                           overwrite: bool) -> Tuple[str, bool]:
+                           overwrite: bool, *, unzip: bool = False) -> Tuple[str, bool]:
+        """
+        Download ``file_link`` into ``destination`` through a ``.part`` file.
+
+        An existing ``.part`` file is continued with an HTTP range request, and
+        the size (and MD5 checksum, when the archive sends one) of the
+        completed file is checked. With ``unzip``, gzip compressed files are
+        uncompressed while they are downloaded, and only the uncompressed file
+        is kept.
+        """
         block_size = astropy.utils.data.conf.download_block_size
         headers = self._get_auth_header()
         with self._session.get(file_link, stream=True, headers=headers) as response:
             response.raise_for_status()
             filename = self._get_filename_from_response(response)
             filename = os.path.join(destination, filename)
+            download_required = overwrite or not self._find_cached_file(filename)
+            if not download_required:
+                return filename, False
+
             part_filename = filename + ".part"
-            if os.path.exists(part_filename):
+            expected_size = self._get_expected_size(response)
+            expected_md5 = response.headers.get("Content-MD5")
+            offset = os.path.getsize(part_filename) if os.path.exists(part_filename) else 0
+            if offset and expected_size is not None and offset >= expected_size:
                 log.info(f"Removing partially downloaded file {part_filename}")
                 os.remove(part_filename)
-            download_required = overwrite or not self._find_cached_file(filename)
-            if download_required:
-                with open(part_filename, 'wb') as fd:
+                offset = 0
+
+            if offset:
+                response.close()
+                log.info(f"Resuming download of {filename} from byte {offset}")
+                response = self._session.get(file_link, stream=True,
+                                             headers={**headers, "Range": f"bytes={offset}-"})
+                response.raise_for_status()
+                if response.status_code != 206:
+                    offset = 0
+
+            decompressor = None
+            if unzip and filename.endswith('fits.gz'):
+                uncompressed_filename = filename.rsplit(".", 1)[0]
+                decompressor = _GzipStreamDecompressor(uncompressed_filename + ".part")
+
+            md5 = hashlib.md5(usedforsecurity=False)
+            try:
+                with open(part_filename, 'ab' if offset else 'wb') as fd:
+                    if offset:
+                        with open(part_filename, 'rb') as part:
+                            for chunk in iter(functools.partial(part.read, block_size), b''):
+                                md5.update(chunk)
+                                if decompressor:
+                                    decompressor.write(chunk)
                     for chunk in response.iter_content(chunk_size=block_size):
                         fd.write(chunk)
-                os.rename(part_filename, filename)
-        return filename, download_required
+                        md5.update(chunk)
+                        if decompressor:
+                            decompressor.write(chunk)
+            finally:
+                response.close()
+                if decompressor:
+                    decompressor.close()
+
+            size = os.path.getsize(part_filename)
+            if expected_size is not None and size != expected_size:
+                # Keep the .part file so that the download can be continued
+                if decompressor:
+                    os.remove(decompressor.filename)
+                raise RuntimeError(f"Incomplete download of {filename}: got {size} bytes "
+                                   f"out of {expected_size}")
+            if expected_md5 and base64.b64encode(md5.digest()).decode() != expected_md5:
+                os.remove(part_filename)
+                if decompressor:
+                    os.remove(decompressor.filename)
+                raise RuntimeError(f"Checksum mismatch for {filename}")
+
+            if decompressor:
+                os.replace(decompressor.filename, uncompressed_filename)
+                os.remove(part_filename)
+                log.info(f"Uncompressed file {filename}")
+                return uncompressed_filename, True
+            os.replace(part_filename, filename)
+        return filename, True
 
     def _download_eso_files(self, file_ids: List[str], destination: Optional[str],
-                            overwrite: bool) -> List[str]:
+                            overwrite: bool, *, unzip: bool = False) -> List[str]:
         destination = destination or self.cache_location
         destination = os.path.abspath(destination)
         os.makedirs(destination, exist_ok=True)
         nfiles = len(file_ids)
         log.info(f"Downloading {nfiles} files ...")
-        downloaded_files = []
-        for i, file_id in enumerate(file_ids, 1):
+        unzip_z = unzip and shutil.which(self.GUNZIP)
+
+        def download(i, file_id):
             file_link = self.DOWNLOAD_URL + file_id
             log.info(f"Downloading file {i}/{nfiles} {file_link} to {destination}")
             try:
-                filename, downloaded = self._download_eso_file(file_link, destination, overwrite)
-                downloaded_files.append(filename)
+                filename, downloaded = self._download_eso_file(file_link, destination, overwrite, unzip=unzip)
                 if downloaded:
                     log.info(f"Successfully downloaded dataset {file_id} to {filename}")
+                # Files that cannot be uncompressed on the fly are uncompressed by the worker
+                # that downloaded them, while the other files are still being downloaded
+                if unzip_z:
+                    filename = self._unzip_file(filename)
+                return filename
             except requests.HTTPError as http_error:
                 if http_error.response.status_code == 401:
                     log.error(f"Access denied to {file_link}")
@@ -898,7 +1034,14 @@ class EsoClass(QueryWithLogin):
                     log.error(f"Failed to download {file_link}. {http_error}")
             except RuntimeError as ex:
                 log.error(f"Failed to download {file_link}. {ex}")
-        return downloaded_files
+
+        indices = range(1, nfiles + 1)
+        if conf.download_workers > 1 and nfiles > 1:
+            with ThreadPoolExecutor(max_workers=conf.download_workers) as executor:
+                downloaded_files = list(executor.map(download, indices, file_ids))
+        else:
+            downloaded_files = list(map(download, indices, file_ids))
+        return [filename for filename in downloaded_files if filename is not None]
 
     def _unzip_file(self, filename: str) -> str:
         """
@@ -1056,7 +1199,7 @@ class EsoClass(QueryWithLogin):
 
         all_datasets = datasets + associated_files
         log.info("Downloading datasets ...")
-        files = self._download_eso_files(all_datasets, destination, continuation)
+        files = self._download_eso_files(all_datasets, destination, continuation, unzip=unzip)
         if unzip:
             files = self._unzip_files(files)
         log.info("Done!")
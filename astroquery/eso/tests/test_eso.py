@@ -7,9 +7,13 @@ ESO Astroquery Module tests
 European Southern Observatory (ESO)
 
 """
+import base64
+import gzip
+import hashlib
 import os
 import shutil
 import sys
+from pathlib import Path
 
 import pytest
 import pyvo
@@ -17,7 +21,7 @@ from astropy.table import Table
 import astropy.io.ascii
 
 from astroquery.utils.mocks import MockResponse
-from ...eso import Eso
+from ...eso import Eso, conf
 from ...eso.utils import _UserParams, \
     _build_adql_string, _adql_sanitize_op_val, _reorder_columns, \
     DEFAULT_LEAD_COLS_RAW
@@ -215,6 +219,54 @@ def test_download(monkeypatch, tmp_path):
     assert downloaded_files[0] == filename
 
 
+@pytest.mark.parametrize("resume", [False, True])
+def test_download_gzip_resume(monkeypatch, tmp_path, resume):
+    eso = Eso()
+    eso.cache_location = tmp_path
+    content = b"SIMPLE  =                    T" * 100
+    compressed = gzip.compress(content)
+    headers = {'Content-Length': str(len(compressed)),
+               'Content-MD5': base64.b64encode(hashlib.md5(compressed).digest()).decode()}
+    ranges = []
+
+    def ranged_request(url, **kwargs):
+        range_header = kwargs['headers'].get('Range')
+        ranges.append(range_header)
+        response_headers = {**headers, 'Content-Disposition': f'filename={url.rsplit("/", 1)[1]}.fits.gz'}
+        if range_header:
+            start = int(range_header.split('=')[1].rstrip('-'))
+            response_headers['Content-Range'] = f'bytes {start}-/{len(compressed)}'
+            return MockResponse(content=compressed[start:], url=url, status_code=206, headers=response_headers)
+        return MockResponse(content=compressed, url=url, headers=response_headers)
+
+    if resume:
+        (tmp_path / 'file1.fits.gz.part').write_bytes(compressed[:20])
+    monkeypatch.setattr(eso._session, 'get', ranged_request)
+    with conf.set_temp('download_workers', 2):
+        downloaded_files = eso.retrieve_data(['file1', 'file2'])
+
+    assert downloaded_files == [str(tmp_path / 'file1.fits'), str(tmp_path / 'file2.fits')]
+    for filename in downloaded_files:
+        assert Path(filename).read_bytes() == content
+    assert sorted(os.listdir(tmp_path)) == ['file1.fits', 'file2.fits']
+    assert ('bytes=20-' in ranges) is resume
+
+
+def test_download_incomplete(monkeypatch, tmp_path):
+    eso = Eso()
+    eso.cache_location = tmp_path
+    filename = 'testfile.fits.Z'
+
+    def truncated_request(url, **kwargs):
+        header = {'Content-Disposition': f'filename={filename}', 'Content-Length': '1000'}
+        return MockResponse(content=b'0' * 10, url=url, headers=header)
+
+    monkeypatch.setattr(eso._session, 'get', truncated_request)
+    assert eso.retrieve_data(['testfile'], unzip=False) == []
+    # The partial file is kept to continue the download later
+    assert (tmp_path / f'{filename}.part').read_bytes() == b'0' * 10
+
+
 @pytest.mark.skipif(sys.platform.startswith("win"), reason="gunzip not available on Windows")
 def test_unzip(tmp_path):
     eso = Eso()
@@ -227,6 +279,29 @@ def test_unzip(tmp_path):
     assert uncompressed_files[0] == str(uncompressed_filename)
 
 
+def test_get_headers(monkeypatch):
+    eso = Eso()
+
+    def header_request(method, url, **kwargs):
+        dp_id = url.split('DpId=')[1]
+        cards = [f"DATE-OBS= '{dp_id}' / date", "EXPTIME =               12.5 / exposure time"]
+        if dp_id.endswith('1'):
+            cards.append("HIERARCH ESO DET NDIT =    3 / number of DITs")
+        page = "<html><body><pre>" + "\n".join(cards + ["END"]) + "</pre></body></html>"
+        return MockResponse(content=page.encode(), url=url)
+
+    monkeypatch.setattr(eso, '_request', header_request)
+    dp_ids = ['FORS2.2021-01-02T00:59:12.530', 'FORS2.2021-01-02T00:59:12.531']
+    with conf.set_temp('header_workers', 2):
+        result = eso.get_headers(dp_ids)
+
+    assert result.colnames == ['DP.ID', 'DATE-OBS', 'EXPTIME', 'HIERARCH ESO DET NDIT']
+    assert list(result['DP.ID']) == dp_ids
+    assert list(result['DATE-OBS']) == dp_ids
+    assert list(result['EXPTIME']) == [12.5, 12.5]
+    assert list(result['HIERARCH ESO DET NDIT']) == [0, 3]
+
+
 def test_cached_file():
     eso = Eso()
     filename = os.path.join(DATA_DIR, 'testfile.fits.Z')
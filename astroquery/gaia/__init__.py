@@ -54,6 +54,15 @@ class Conf(_config.ConfigNamespace):
 
     VALID_LINKING_PARAMETERS = {'SOURCE_ID', 'TRANSIT_ID', 'IMAGE_ID'}
 
+    DATALINK_MAX_IDS = _config.ConfigItem(5000,
+                                          "Maximum number of identifiers sent in a "
+                                          "single DataLink request; longer lists are "
+                                          "split in several requests (set to 0 to "
+                                          "disable the splitting).")
+    DATALINK_WORKERS = _config.ConfigItem(1,
+                                          "Number of DataLink requests sent in "
+                                          "parallel when the identifiers are split.")
+
 
 conf = Conf()
 
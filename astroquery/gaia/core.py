@@ -12,8 +12,11 @@ import datetime
 import json
 import os
 import shutil
+import tempfile
+import weakref
 import zipfile
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 
 from astropy import units
 from astropy import units as u
@@ -21,7 +24,7 @@ from astropy.coordinates import Angle
 from astropy.io import fits
 from astropy.io import votable
 from astropy.io.fits import TableHDU, BinTableHDU
-from astropy.table import Table
+from astropy.table import Table, vstack
 from astropy.units import Quantity
 from astropy.utils.decorators import deprecated_renamed_argument
 from requests import HTTPError
@@ -168,7 +171,7 @@ class GaiaClass(TapPlus):
     def load_data(self, ids, *, data_release=None, data_structure='DATAMODEL_STANDARD', retrieval_type="ALL",
                   linking_parameter='SOURCE_ID', valid_data=False, band=None, avoid_datatype_check=False,
                   format="votable", dump_to_file=False, overwrite_output_file=False, verbose=False,
-                  output_file=None):
+                  output_file=None, lazy=False):
         """Loads the specified table
         TAP+ only
 
@@ -223,10 +226,19 @@ class GaiaClass(TapPlus):
             To overwrite the output file ("datalink_output.zip") if it already exists.
         verbose : bool, optional, default 'False'
             Flag to display information about the process
+        lazy : bool, optional, default 'False'
+            If True, the products are only read when they are accessed in the returned mapping, FITS files being
+            memory mapped. The extracted files are kept in a temporary directory until the mapping is deleted.
 
         Returns
         -------
         A dictionary where the keys are the file names and its value is a list of astropy.table.table.Table objects
+
+        Notes
+        -----
+        Lists of more than ``conf.DATALINK_MAX_IDS`` identifiers are retrieved in several requests, sent
+        ``conf.DATALINK_WORKERS`` at a time, and their products are merged. When ``dump_to_file`` is set, each of
+        these requests is stored in its own file, named after the single request one with a ``_<n>`` suffix.
         """
 
         output_file_specified = False
@@ -275,14 +287,7 @@ class GaiaClass(TapPlus):
         elif valid_data:
             params_dict['VALID_DATA'] = "true"
 
-        if isinstance(ids, str):
-            ids_arg = ids
-        else:
-            if isinstance(ids, int):
-                ids_arg = str(ids)
-            else:
-                ids_arg = ','.join(str(item) for item in ids)
-        params_dict['ID'] = ids_arg
+        ids_args = self.__split_ids(ids)
         if data_release is not None:
             params_dict['RELEASE'] = data_release
         params_dict['DATA_STRUCTURE'] = data_structure
@@ -298,24 +303,57 @@ class GaiaClass(TapPlus):
             if linking_parameter != 'SOURCE_ID':
                 params_dict['LINKING_PARAMETER'] = linking_parameter
 
+        if len(ids_args) == 1:
+            output_files = [output_file]
+        else:
+            root, ext = os.path.splitext(output_file)
+            output_files = [f"{root}_{i}{ext}" for i in range(1, len(ids_args) + 1)]
+
+        def load_chunk(ids_arg, chunk_output_file):
+            self.__gaiadata.load_data(params_dict={**params_dict, 'ID': ids_arg}, output_file=chunk_output_file,
+                                      verbose=verbose)
+
+        # Lazily read products must outlive this call, so they are extracted elsewhere
+        extract_root = tempfile.mkdtemp(prefix='gaia_datalink_') if lazy else path
+        extract_dirs = []
         files = dict()
         try:
-            self.__gaiadata.load_data(params_dict=params_dict, output_file=output_file, verbose=verbose)
-            files = Gaia.__get_data_files(output_file=output_file, path=path)
+            if len(ids_args) == 1:
+                load_chunk(ids_args[0], output_files[0])
+            else:
+                with ThreadPoolExecutor(max_workers=conf.DATALINK_WORKERS) as executor:
+                    list(executor.map(load_chunk, ids_args, output_files))
+
+            file_paths = dict()
+            for i, chunk_output_file in enumerate(output_files, start=1):
+                extract_dir = extract_root if len(output_files) == 1 else os.path.join(extract_root, f"chunk_{i}")
+                extract_dirs.append(extract_dir)
+                for key, file_path in Gaia.__extract_data_files(chunk_output_file, extract_dir).items():
+                    file_paths.setdefault(key, []).append(file_path)
+
+            if lazy:
+                files = DataLinkProducts(file_paths, directory=extract_root)
+            else:
+                files = {key: Gaia._read_data_files(key, paths) for key, paths in file_paths.items()}
         except Exception as err:
+            if lazy:
+                shutil.rmtree(extract_root, ignore_errors=True)
             raise err
         finally:
             if not output_file_specified:
                 shutil.rmtree(path)
-            else:
-                for file in files.keys():
-                    final_file = os.path.join(os.getcwd(), path, file)
-                    if os.path.isfile(final_file):
-                        os.remove(final_file)
+            elif not lazy:
+                for extract_dir in extract_dirs:
+                    for file in files.keys():
+                        final_file = os.path.join(os.getcwd(), extract_dir, file)
+                        if os.path.isfile(final_file):
+                            os.remove(final_file)
+                    if extract_dir != path and os.path.isdir(extract_dir) and not os.listdir(extract_dir):
+                        os.rmdir(extract_dir)
 
         if verbose:
             if output_file_specified:
-                log.info("output_file = %s" % output_file)
+                log.info("output_file = %s" % ", ".join(output_files))
 
         if log.isEnabledFor(20):
             log.debug("List of products available:")
@@ -325,13 +363,33 @@ class GaiaClass(TapPlus):
         return files
 
     @staticmethod
-    def __get_data_files(output_file, path):
+    def __split_ids(ids):
+        """
+        Returns the ``ID`` parameter values of ``ids``, split in chunks of at
+        most ``conf.DATALINK_MAX_IDS`` identifiers.
+        """
+        if isinstance(ids, str):
+            ids_list = [ids]
+            if 0 < conf.DATALINK_MAX_IDS < ids.count(',') + 1:
+                ids_list = [item.strip() for item in ids.split(',')]
+        elif isinstance(ids, int):
+            ids_list = [str(ids)]
+        else:
+            ids_list = [str(item) for item in ids]
+
+        chunk_size = conf.DATALINK_MAX_IDS if conf.DATALINK_MAX_IDS > 0 else max(len(ids_list), 1)
+        if len(ids_list) <= chunk_size:
+            return [','.join(ids_list)]
+        return [','.join(ids_list[i:i + chunk_size]) for i in range(0, len(ids_list), chunk_size)]
+
+    @staticmethod
+    def __extract_data_files(output_file, path):
         files = {}
         extracted_files = []
 
         with zipfile.ZipFile(output_file, "r") as zip_ref:
             extracted_files.extend(zip_ref.namelist())
-            zip_ref.extractall(os.path.dirname(output_file))
+            zip_ref.extractall(path)
 
         # r=root, d=directories, f = files
         for r, d, f in os.walk(path):
@@ -339,61 +397,82 @@ class GaiaClass(TapPlus):
                 if file in extracted_files:
                     files[file] = os.path.join(r, file)
 
-        for key, value in files.items():
-
-            if key.endswith('.fits'):
-                tables = []
-                with fits.open(value, memmap=False) as hduList:
-                    for hdu in hduList:
-                        if isinstance(hdu, (TableHDU, BinTableHDU)):
-                            table = Table.read(hdu, format='fits')
-                            Gaia.correct_table_units(table)
-                            tables.append(table)
-                files[key] = tables
-
-            elif key.endswith('.xml'):
-                tables = []
-                for table in votable.parse(value).iter_tables():
-                    tables.append(table)
-                files[key] = tables
-
-            elif key.endswith('.csv'):
-                tables = []
-                table = Table.read(value, format='ascii.csv', fast_reader=False)
-                tables.append(table)
-                files[key] = tables
+        return files
+
+    @staticmethod
+    def _read_data_files(key, paths, *, lazy=False):
+        """
+        Reads the product ``key``, merging its tables if it was retrieved in
+        several files.
+        """
+        products = [Gaia._read_data_file(key, path, lazy=lazy) for path in paths]
+        if len(products) == 1:
+            return products[0]
+        if isinstance(products[0], Table):
+            return vstack(products, metadata_conflicts='silent')
+        return [vstack(list(tables), metadata_conflicts='silent') for tables in zip(*products)]
+
+    @staticmethod
+    def _read_data_file(key, value, *, lazy=False):
+        """
+        Reads the DataLink product ``key`` stored in ``value``.
 
-            elif key.endswith('.ecsv'):
-                tables = []
-                table = Table.read(value, format='ascii.ecsv', fast_reader=False)
+        With ``lazy``, FITS files are memory mapped and the fast readers are
+        used for CSV files.
+        """
+        if key.endswith('.fits'):
+            tables = []
+            with fits.open(value, memmap=lazy) as hduList:
+                for hdu in hduList:
+                    if isinstance(hdu, (TableHDU, BinTableHDU)):
+                        table = Table.read(hdu, format='fits')
+                        Gaia.correct_table_units(table)
+                        tables.append(table)
+            return tables
+
+        elif key.endswith('.xml'):
+            tables = []
+            for table in votable.parse(value).iter_tables():
                 tables.append(table)
-                files[key] = tables
+            return tables
 
-            elif key.endswith('.json'):
-                tables = []
-                with open(value) as f:
-                    data = json.load(f)
+        elif key.endswith('.csv'):
+            tables = []
+            table = Table.read(value, format='ascii.csv', fast_reader=lazy)
+            tables.append(table)
+            return tables
 
-                    if data.get('data') and data.get('metadata'):
+        elif key.endswith('.ecsv'):
+            tables = []
+            table = Table.read(value, format='ascii.ecsv', fast_reader=False)
+            tables.append(table)
+            return tables
 
-                        column_name = []
-                        for name in data['metadata']:
-                            column_name.append(name['name'])
+        elif key.endswith('.json'):
+            tables = []
+            with open(value) as f:
+                data = json.load(f)
 
-                        result = Table(rows=data['data'], names=column_name, masked=True)
+                if data.get('data') and data.get('metadata'):
 
-                        for v in data['metadata']:
-                            col_name = v['name']
-                            result[col_name].unit = v['unit']
-                            result[col_name].description = v['description']
-                            result[col_name].meta = {'metadata': v}
+                    column_name = []
+                    for name in data['metadata']:
+                        column_name.append(name['name'])
 
-                        files[key] = result
-                    else:
-                        tables.append(Table.read(value, format='pandas.json'))
-                        files[key] = tables
+                    result = Table(rows=data['data'], names=column_name, masked=True)
 
-        return files
+                    for v in data['metadata']:
+                        col_name = v['name']
+                        result[col_name].unit = v['unit']
+                        result[col_name].description = v['description']
+                        result[col_name].meta = {'metadata': v}
+
+                    return result
+                else:
+                    tables.append(Table.read(value, format='pandas.json'))
+                    return tables
+
+        return value
 
     def get_datalinks(self, ids, *, linking_parameter='SOURCE_ID', verbose=False):
         """Gets datalinks associated to the provided identifiers
@@ -1221,4 +1300,35 @@ class GaiaClass(TapPlus):
             print("Status messages could not be retrieved")
 
 
+class DataLinkProducts(Mapping):
+    """
+    Read-only mapping of the DataLink products returned by ``GaiaClass.load_data(..., lazy=True)``.
+
+    The keys are the file names. A product is only read when it is first
+    accessed, and then kept. The extracted files are removed when the mapping
+    is deleted.
+    """
+
+    def __init__(self, file_paths, *, directory=None):
+        self._file_paths = file_paths
+        self._products = {}
+        self.directory = directory
+        if directory is not None:
+            self._finalizer = weakref.finalize(self, shutil.rmtree, directory, ignore_errors=True)
+
+    def __getitem__(self, key):
+        if key not in self._products:
+            self._products[key] = GaiaClass._read_data_files(key, self._file_paths[key], lazy=True)
+        return self._products[key]
+
+    def __iter__(self):
+        return iter(self._file_paths)
+
+    def __len__(self):
+        return len(self._file_paths)
+
+    def __repr__(self):
+        return f"<DataLinkProducts: {len(self)} products, {len(self._products)} read>"
+
+
 Gaia = GaiaClass()
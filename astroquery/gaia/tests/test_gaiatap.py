@@ -1167,6 +1167,39 @@ def test_load_data_fits(monkeypatch, tmp_path, tmp_path_factory, patch_datetime_
     path.unlink()
 
 
+@pytest.mark.filterwarnings("ignore:")
+@pytest.mark.parametrize("lazy", [False, True])
+def test_load_data_chunked(monkeypatch, lazy):
+    with open(DL_PRODUCTS_FITS, 'rb') as file:
+        zip_bytes = file.read()
+
+    requested_ids = []
+
+    def load_data_monkeypatched(self, params_dict, output_file, verbose):
+        requested_ids.append(params_dict["ID"])
+        Path(output_file).write_bytes(zip_bytes)
+
+    monkeypatch.setattr(TapPlus, "load_data", load_data_monkeypatched)
+
+    with conf.set_temp("DATALINK_MAX_IDS", 2), conf.set_temp("DATALINK_WORKERS", 2):
+        result_dict = GAIA_QUERIER.load_data(ids=[1, 2, 3, 4, 5], format='fits', retrieval_type="ALL", lazy=lazy)
+
+    assert sorted(requested_ids) == ["1,2", "3,4", "5"]
+    assert len(result_dict) == 3
+
+    key = 'XP_SAMPLED-Gaia DR3 5937083312263887616.fits'
+    single = GaiaClass._read_data_file(key, zipfile.ZipFile(DL_PRODUCTS_FITS).open(key))
+    tables = result_dict[key]
+    assert len(tables) == len(single)
+    assert len(tables[0]) == 3 * len(single[0])
+
+    if lazy:
+        directory = result_dict.directory
+        assert os.path.isdir(directory)
+        del tables, result_dict
+        assert not os.path.exists(directory)
+
+
 def test_load_data_csv(monkeypatch, tmp_path, tmp_path_factory, patch_datetime_now):
     assert datetime.datetime.now(datetime.timezone.utc) == FAKE_TIME
 
@@ -32,6 +32,18 @@ class Conf(_config.ConfigNamespace):
         'URL for the xamin tar servlet'
     )
 
+    tar_max_size = _config.ConfigItem(
+        10.,
+        'Maximum size in GB of the files requested in a single tar archive '
+        'when streaming downloads from the HEASARC (0 to disable the splitting).'
+    )
+
+    tar_workers = _config.ConfigItem(
+        1,
+        'Number of tar archives downloaded in parallel when streaming '
+        'downloads from the HEASARC.'
+    )
+
     S3_BUCKET = _config.ConfigItem(
         'nasa-heasarc',
         'The name of the AWS S3 bucket that contain the HEASARC data'
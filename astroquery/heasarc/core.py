@@ -3,6 +3,7 @@ import shutil
 import requests
 import tarfile
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from astropy.table import Table, Row
 from astropy import coordinates
@@ -802,7 +803,7 @@ class HeasarcClass(BaseVOQuery, BaseQuery):
                 return 'aws'
         return 'heasarc'
 
-    def download_data(self, links, *, host=None, location='.'):
+    def download_data(self, links, *, host=None, location='.', stream=False):
         """Download data products in links with a choice of getting the
         data from either the heasarc server, sciserver, or the cloud in AWS.
 
@@ -821,11 +822,21 @@ class HeasarcClass(BaseVOQuery, BaseQuery):
         location : str
             local folder where the downloaded file will be saved.
             Default is current working directory
+        stream : bool
+            Only used when downloading from the heasarc server. If True,
+            the files are extracted while the tar archive is downloaded,
+            instead of after saving it to disk. Tables of links larger
+            than ``conf.tar_max_size`` GB are then requested in several
+            tar archives (``conf.tar_workers`` at a time), and the files
+            or directories already present locally with the expected size
+            (``content_length``) are not requested again, so that an
+            interrupted download can be resumed by calling this method
+            again. Default is False.
 
         Note that ff you are downloading large datasets (more 10 10GB),
         from the main heasarc server, it is recommended that you split
-        it up, so that if the downloaded is interrupted, you do not need
-        to start again.
+        it up (or use ``stream=True``), so that if the downloaded is
+        interrupted, you do not need to start again.
         """
 
         if len(links) == 0:
@@ -851,7 +862,10 @@ class HeasarcClass(BaseVOQuery, BaseQuery):
         if host == 'heasarc':
 
             log.info('Downloading data from the HEASARC ...')
-            self._download_heasarc(links, location)
+            if stream:
+                self._stream_heasarc(links, location)
+            else:
+                self._download_heasarc(links, location)
 
         elif host == 'sciserver':
 
@@ -888,12 +902,7 @@ class HeasarcClass(BaseVOQuery, BaseQuery):
                     "again. Consider downloading the data in chunks."
                 )
 
-        file_list = [f"/FTP/{link.split('FTP/')[1]}"
-                     for link in links['access_url']]
-        params = {
-            'files': f'>{"&&>".join(file_list)}&&',
-            'filter': ''
-        }
+        params = self._tar_params(links)
 
         # get local_filepath name
         local_filepath = f'{location}/heasarc-data.tar'
@@ -920,6 +929,120 @@ class HeasarcClass(BaseVOQuery, BaseQuery):
                 'An error occurred when downloading the data. Retry again.'
             )
 
+    @staticmethod
+    def _tar_params(links):
+        """Build the parameters of the tar servlet request for links"""
+        file_list = [f"/FTP/{link.split('FTP/')[1]}"
+                     for link in links['access_url']]
+        return {
+            'files': f'>{"&&>".join(file_list)}&&',
+            'filter': ''
+        }
+
+    @staticmethod
+    def _missing_links(links, location):
+        """Leave out of links those already present in location
+
+        A link is present if the file or directory named after it in
+        location has the size given by content_length, directories being
+        measured by the total size of their files.
+        """
+        if 'content_length' not in links.colnames:
+            return links
+        keep = np.ones(len(links), dtype=bool)
+        for irow, (link, length) in enumerate(zip(links['access_url'], links['content_length'])):
+            local_path = os.path.join(location, os.path.basename(str(link).rstrip('/')))
+            if os.path.isfile(local_path):
+                size = os.path.getsize(local_path)
+            elif os.path.isdir(local_path):
+                size = sum(os.path.getsize(os.path.join(root, name))
+                           for root, _, names in os.walk(local_path) for name in names)
+            else:
+                continue
+            if size == length:
+                log.debug(f'Skipping {local_path}, already downloaded')
+                keep[irow] = False
+        return links[keep]
+
+    @staticmethod
+    def _split_links(links, max_size):
+        """Split links in tables of at most max_size GB of content_length
+
+        A single link larger than max_size gets its own table.
+        """
+        if 'content_length' not in links.colnames or max_size <= 0:
+            return [links]
+        chunks = []
+        start, size = 0, 0
+        for irow, length in enumerate(links['content_length'] / 2**30):
+            if irow > start and size + length > max_size:
+                chunks.append(links[start:irow])
+                start, size = irow, 0
+            size += length
+        chunks.append(links[start:])
+        return chunks
+
+    def _stream_heasarc(self, links, location='.'):
+        """Download data from the heasarc main server, extracting the tar
+        archives returned by xamin's tar servlet while they are downloaded
+
+        Do not call directly.
+        Users should be using `~self.download_data` instead
+
+        Parameters
+        ----------
+        links : `astropy.table.Table`
+            The result from locate_data
+        location : str
+            local folder where the files will be saved.
+            Default is current working directory
+
+        """
+        os.makedirs(location, exist_ok=True)
+        links = self._missing_links(links, location)
+        if len(links) == 0:
+            log.info('All the files are already downloaded.')
+            return
+        chunks = self._split_links(links, conf.tar_max_size)
+        if len(chunks) > 1:
+            log.info(f'Splitting the request in {len(chunks)} tar archives ...')
+
+        def download(chunk):
+            with self._session.request('POST', self.TAR_URL, data=self._tar_params(chunk),
+                                       timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                self._extract_tar_stream(response.raw, location)
+
+        if conf.tar_workers > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=conf.tar_workers) as executor:
+                list(executor.map(download, chunks))
+        else:
+            for chunk in chunks:
+                download(chunk)
+
+    @staticmethod
+    def _extract_tar_stream(fileobj, location):
+        """Extract the tar archive read from fileobj into location
+
+        Regular files that are already present with the expected size
+        are skipped.
+        """
+        try:
+            with tarfile.open(fileobj=fileobj, mode='r|') as tfile:
+                for member in tfile:
+                    local_path = os.path.join(location, member.name)
+                    if (member.isfile() and os.path.isfile(local_path)
+                            and os.path.getsize(local_path) == member.size):
+                        log.debug(f'Skipping {local_path}, already downloaded')
+                        continue
+                    log.debug(f'Extracting {local_path} ...')
+                    tfile.extract(member, path=location, filter="fully_trusted")
+        except tarfile.ReadError:
+            raise ValueError(
+                'An error occurred when downloading the data. Retry again.'
+            )
+
     def _copy_sciserver(self, links, location='.'):
         """Copy data from the local archive on sciserver
 
@@ -1,7 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+import io
 import os
 import pytest
+import tarfile
 import tempfile
 from unittest.mock import patch, PropertyMock
 from astropy.coordinates import SkyCoord
@@ -10,8 +12,9 @@ from astropy.io import votable
 from pyvo.dal import TAPResults
 import astropy.units as u
 
-from astroquery.heasarc import Heasarc, HeasarcClass
+from astroquery.heasarc import Heasarc, HeasarcClass, conf
 from astroquery.exceptions import InvalidQueryError
+from astroquery.utils.mocks import MockResponse
 
 try:
     # Both boto3, botocore and moto are optional dependencies,
@@ -743,3 +746,55 @@ def test_query_region_offset_with_no_column():
         add_offset=True,
     )
     assert ',DISTANCE(POINT(' in query
+
+
+def _make_tar(files):
+    stream = io.BytesIO()
+    with tarfile.open(fileobj=stream, mode='w') as tfile:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tfile.addfile(info, io.BytesIO(content))
+    return stream.getvalue()
+
+
+def test_download_data__heasarc_stream(monkeypatch, tmp_path):
+    links = Table({
+        'access_url': [f'https://heasarc.gsfc.nasa.gov/FTP/mission/obs{i}/file{i}.fits' for i in range(4)]
+        + ['https://heasarc.gsfc.nasa.gov/FTP/mission/obs4/'],
+        'content_length': [3] + [2**30] * 3 + [5]
+    })
+    requested = []
+
+    def mock_request(method, url, data=None, **kwargs):
+        files = data['files'].strip('>&').split('&&>')
+        requested.append(files)
+        response = MockResponse(_make_tar({os.path.basename(file): b'new' for file in files}))
+        response.raw = io.BytesIO(response.content)
+        return response
+
+    # already downloaded files and directories with the expected size are
+    # not requested again
+    (tmp_path / 'file0.fits').write_bytes(b'old')
+    (tmp_path / 'file1.fits').write_bytes(b'partial')
+    (tmp_path / 'obs4' / 'sub').mkdir(parents=True)
+    (tmp_path / 'obs4' / 'a.fits').write_bytes(b'aa')
+    (tmp_path / 'obs4' / 'sub' / 'b.fits').write_bytes(b'bbb')
+
+    heasarc = HeasarcClass()
+    monkeypatch.setattr(heasarc._session, 'request', mock_request)
+    with conf.set_temp('tar_max_size', 2.5), conf.set_temp('tar_workers', 2):
+        heasarc.download_data(links, host='heasarc', location=str(tmp_path), stream=True)
+
+    assert sorted(len(files) for files in requested) == [1, 2]
+    assert sorted(os.path.basename(file) for files in requested for file in files) == [
+        'file1.fits', 'file2.fits', 'file3.fits']
+    assert (tmp_path / 'file0.fits').read_bytes() == b'old'
+    assert (tmp_path / 'file1.fits').read_bytes() == b'new'
+    assert (tmp_path / 'file3.fits').read_bytes() == b'new'
+
+    # nothing is requested once everything is present
+    requested.clear()
+    links['content_length'][1:4] = 3
+    heasarc.download_data(links, host='heasarc', location=str(tmp_path), stream=True)
+    assert requested == []
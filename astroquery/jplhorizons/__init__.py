@@ -24,6 +24,15 @@ class Conf(_config.ConfigNamespace):
         30,
         'Time limit for connecting to JPL servers.')
 
+    max_uri_length = _config.ConfigItem(
+        2000,
+        'Maximum length of the URIs of queries for a list of epochs; longer '
+        'lists of epochs are queried in several requests.')
+
+    epoch_workers = _config.ConfigItem(
+        1,
+        'Number of requests sent in parallel when a list of epochs is split.')
+
     # JPL Horizons settings
 
     # quantities queried in ephemerides query (see
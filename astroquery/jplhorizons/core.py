@@ -2,15 +2,18 @@
 
 # 1. standard library imports
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Mapping
+from urllib.parse import quote_plus
 import warnings
 
 # 2. third party imports
+from requests import Request
 from requests.exceptions import HTTPError
 from numpy import nan
 from numpy import isnan
 from numpy import ndarray
-from astropy.table import Table, Column
+from astropy.table import Table, Column, vstack
 from astropy.io import ascii
 from astropy.time import Time
 from astropy import units as u
@@ -20,7 +23,7 @@ from astropy.utils.decorators import deprecated_renamed_argument, deprecated_att
 # 3. local imports - use relative imports
 # commonly required local imports shown below as example
 # all Query classes should inherit from BaseQuery.
-from ..query import BaseQuery
+from ..query import AstroQuery, BaseQuery
 # async_to_sync generates the relevant query tools from _async methods
 from ..utils import async_to_sync
 # import configurable items declared in __init__.py
@@ -29,6 +32,11 @@ from . import conf
 __all__ = ['Horizons', 'HorizonsClass']
 
 
+def _prepare_url(url, params):
+    """The URI of a GET request of ``url`` with ``params``"""
+    return Request('GET', url, params=params).prepare().url
+
+
 @async_to_sync
 class HorizonsClass(BaseQuery):
     """
@@ -701,27 +709,18 @@ class HorizonsClass(BaseQuery):
 
         self.query_type = 'ephemerides'
 
+        # long lists of epochs are queried in several requests
+        request_payloads = self._split_epochs(URL, request_payload)
+
         # return request_payload if desired
         if get_query_payload:
-            return request_payload
+            return request_payloads[0] if len(request_payloads) == 1 else request_payloads
 
         # set return_raw flag, if raw response desired
         if get_raw_response:
             self.return_raw = True
 
-        # query and parse
-        response = self._request('GET', URL, params=request_payload,
-                                 timeout=self.TIMEOUT, cache=cache)
-        self.uri = response.url
-
-        # check length of uri
-        if len(self.uri) >= 2000:
-            warnings.warn(('The uri used in this query is very long '
-                           'and might have been truncated. The results of '
-                           'the query might be compromised. If you queried '
-                           'a list of epochs, consider querying a range.'))
-
-        return response
+        return self._query_payloads(URL, request_payloads, cache=cache)
 
     @deprecated_renamed_argument("get_raw_response", None, since="0.4.7",
                                  alternative="async methods")
@@ -932,27 +931,18 @@ class HorizonsClass(BaseQuery):
 
         self.query_type = 'elements'
 
+        # long lists of epochs are queried in several requests
+        request_payloads = self._split_epochs(URL, request_payload)
+
         # return request_payload if desired
         if get_query_payload:
-            return request_payload
+            return request_payloads[0] if len(request_payloads) == 1 else request_payloads
 
         # set return_raw flag, if raw response desired
         if get_raw_response:
             self.return_raw = True
 
-        # query and parse
-        response = self._request('GET', URL, params=request_payload,
-                                 timeout=self.TIMEOUT, cache=cache)
-        self.uri = response.url
-
-        # check length of uri
-        if len(self.uri) >= 2000:
-            warnings.warn(('The uri used in this query is very long '
-                           'and might have been truncated. The results of '
-                           'the query might be compromised. If you queried '
-                           'a list of epochs, consider querying a range.'))
-
-        return response
+        return self._query_payloads(URL, request_payloads, cache=cache)
 
     @deprecated_renamed_argument("get_raw_response", None, since="0.4.7",
                                  alternative="async methods")
@@ -1185,27 +1175,81 @@ class HorizonsClass(BaseQuery):
 
         self.query_type = 'vectors'
 
+        # long lists of epochs are queried in several requests
+        request_payloads = self._split_epochs(URL, request_payload)
+
         # return request_payload if desired
         if get_query_payload:
-            return request_payload
+            return request_payloads[0] if len(request_payloads) == 1 else request_payloads
 
         # set return_raw flag, if raw response desired
         if get_raw_response:
             self.return_raw = True
 
-        # query and parse
-        response = self._request('GET', URL, params=request_payload,
-                                 timeout=self.TIMEOUT, cache=cache)
-        self.uri = response.url
+        return self._query_payloads(URL, request_payloads, cache=cache)
 
-        # check length of uri
-        if len(self.uri) >= 2000:
-            warnings.warn(('The uri used in this query is very long '
-                           'and might have been truncated. The results of '
-                           'the query might be compromised. If you queried '
-                           'a list of epochs, consider querying a range.'))
-
-        return response
+    @staticmethod
+    def _split_epochs(url, request_payload):
+        """
+        Split the ``TLIST`` epochs of ``request_payload`` so that the URI of
+        each request is shorter than ``conf.max_uri_length`` characters.
+        """
+        if 'TLIST' not in request_payload:
+            return [request_payload]
+        if len(_prepare_url(url, request_payload)) < conf.max_uri_length:
+            return [request_payload]
+
+        base_length = len(_prepare_url(url, {**request_payload, 'TLIST': ''}))
+        chunks = [[]]
+        length = base_length
+        for epoch in request_payload['TLIST'].split('\n'):
+            # the separating line break is encoded as %0A
+            epoch_length = len(quote_plus(epoch)) + 3
+            if chunks[-1] and length + epoch_length >= conf.max_uri_length:
+                chunks.append([])
+                length = base_length
+            chunks[-1].append(epoch)
+            length += epoch_length
+        return [{**request_payload, 'TLIST': '\n'.join(chunk)} for chunk in chunks]
+
+    def _query_payloads(self, url, request_payloads, *, cache):
+        """
+        Query ``request_payloads``, ``conf.epoch_workers`` at a time if there
+        are several of them, in which case the list of their responses is
+        returned.
+        """
+        def query(request_payload):
+            response = self._request('GET', url, params=request_payload,
+                                     timeout=self.TIMEOUT, cache=cache)
+            if len(request_payloads) > 1:
+                try:
+                    response.raise_for_status()
+                except HTTPError:
+                    # don't cache any HTTP errored request; ``_last_query``
+                    # may belong to another one by the time it is parsed
+                    self.cache_backend.remove(AstroQuery('GET', url, params=request_payload).hash())
+            return response
+
+        if len(request_payloads) == 1:
+            response = query(request_payloads[0])
+            self.uri = response.url
+
+            # check length of uri
+            if len(self.uri) >= conf.max_uri_length:
+                warnings.warn(('The uri used in this query is very long '
+                               'and might have been truncated. The results of '
+                               'the query might be compromised. If you queried '
+                               'a list of epochs, consider querying a range.'))
+
+            return response
+
+        if conf.epoch_workers > 1:
+            with ThreadPoolExecutor(max_workers=conf.epoch_workers) as executor:
+                responses = list(executor.map(query, request_payloads))
+        else:
+            responses = [query(request_payload) for request_payload in request_payloads]
+        self.uri = [response.url for response in responses]
+        return responses
 
     # ---------------------------------- parser functions
     @staticmethod
@@ -1270,17 +1314,26 @@ class HorizonsClass(BaseQuery):
 
         """
 
+        # queries split in several requests
+        if isinstance(response, list):
+            # the errored requests were removed from the cache when sent
+            for chunk_response in response:
+                chunk_response.raise_for_status()
+            return_raw = self.return_raw
+            results = []
+            for chunk_response in response:
+                self.return_raw = return_raw
+                results.append(self._parse_result(chunk_response, verbose=verbose))
+            if return_raw:
+                return ''.join(results)
+            return vstack(results, metadata_conflicts='silent')
+
         self.last_response = response
         try:
             response.raise_for_status()
         except HTTPError:
             # don't cache any HTTP errored queries (especially when the API is down!)
-            try:
-                self._last_query.remove_cache_file(self.cache_location)
-            except OSError:
-                # this is allowed: if `cache` was set to False, this
-                # won't be needed
-                pass
+            self.cache_backend.remove(self._last_query.hash())
             raise
 
         self._raw_response = response.text
@@ -1291,8 +1344,21 @@ class HorizonsClass(BaseQuery):
             self.return_raw = False
             return self._raw_response
 
+        text = response.text
+        # locate the data block directly, so that only the header and the
+        # footer have to be scanned line by line
+        soe_idx = text.find('$$SOE')
+        eoe_idx = text.find('$$EOE', soe_idx) if soe_idx >= 0 else -1
+        block_start = text.find('\n', soe_idx) + 1
+        block_end = text.rfind('\n', 0, eoe_idx) + 1
+        if soe_idx >= 0 and eoe_idx >= 0 and 0 < block_start <= block_end:
+            data_block = text[block_start:block_end]
+            text = text[:block_start] + text[block_end:]
+        else:
+            data_block = None
+
         # split response by line break
-        src = response.text.split('\n')
+        src = text.split('\n')
 
         data_start_idx = 0
         data_end_idx = 0
@@ -1392,8 +1458,13 @@ class HorizonsClass(BaseQuery):
                 headerline = []
                 break
 
+        if data_block is None:
+            data_lines = src[data_start_idx:data_end_idx]
+        else:
+            data_lines = data_block.split('\n')[:-1]
+
         if headerline == []:
-            err_msg = "".join(src[data_start_idx:data_end_idx])
+            err_msg = "".join(data_lines)
             if len(err_msg) > 0:
                 raise ValueError('Query failed with error message:\n'
                                  + err_msg)
@@ -1405,15 +1476,16 @@ class HorizonsClass(BaseQuery):
         headerline = [h.strip() for h in headerline]
 
         # remove all 'Cut-off' messages
-        raw_data = [line for line in src[data_start_idx:data_end_idx]
-                    if 'Cut-off' not in line]
+        if data_block is None or 'Cut-off' in data_block:
+            data_block = '\n'.join(line for line in data_lines
+                                   if 'Cut-off' not in line)
 
         # read in data
-        data = ascii.read(raw_data,
+        data = ascii.read([data_block], format='no_header', delimiter=',', guess=False,
                           names=headerline,
                           fill_values=[('.n.a.', '0'),
                                        ('n.a.', '0')],
-                          fast_reader=False)
+                          fast_reader=True)
         # force to a masked table
         data = Table(data, masked=True)
 
@@ -5,6 +5,7 @@ import os
 from collections import OrderedDict
 
 from numpy.ma import is_masked
+from requests.exceptions import HTTPError
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.utils.exceptions import AstropyDeprecationWarning
 from astropy import units as u
@@ -274,6 +275,71 @@ def test_vectors_query_payload():
         ('TLIST', '2451544.5')])
 
 
+@pytest.mark.parametrize('query', ['ephemerides', 'elements', 'vectors'])
+def test_epochs_split(patch_request, query):
+    epochs = [2451544.5 + i for i in range(200)]
+    obj = jplhorizons.Horizons(id='Ceres', epochs=epochs)
+    with jplhorizons.conf.set_temp('max_uri_length', 1000), \
+            jplhorizons.conf.set_temp('epoch_workers', 2):
+        payloads = getattr(obj, query)(get_query_payload=True)
+        res = getattr(obj, query)()
+
+    assert len(payloads) > 1
+    assert '\n'.join(payload['TLIST'] for payload in payloads) == '\n'.join(str(epoch) for epoch in epochs)
+    assert all(len(jplhorizons.core._prepare_url('https://ssd.jpl.nasa.gov/api/horizons.api', payload)) < 1000
+               for payload in payloads)
+    # the mocked service returns a single epoch per request
+    assert len(res) == len(payloads)
+    assert len(obj.uri) == len(payloads)
+
+
+def test_parse_result_cutoff():
+    with open(data_path(DATA_FILES['ephemerides-range'])) as f:
+        text = f.read()
+    nrows = len(text.split('$$SOE\n')[1].split('$$EOE')[0].splitlines())
+    # messages in the data block are dropped
+    text = text.replace('$$SOE\n', '$$SOE\n Cut-off interval due to airmass\n')
+    obj = jplhorizons.Horizons(id='Ceres')
+    obj.query_type = 'ephemerides'
+    res = obj._parse_result(MockResponse(content=text.encode()))
+    assert len(res) == nrows
+    assert res['targetname'][0] == '1 Ceres (A801 AA)'
+    assert res['RA'].unit == u.deg
+
+
+def test_epochs_split_failed_chunk(patch_request):
+    """The cache entry of the failing chunk is removed, not that of the last request"""
+    class FailedResponse(MockResponse):
+        def raise_for_status(self):
+            raise HTTPError('500 Server Error')
+
+    requests = []
+
+    def request(self, request_type, url, **kwargs):
+        requests.append((url, kwargs['params']))
+        if len(requests) == 1:
+            return FailedResponse(b'', url=url, status_code=500)
+        return nonremote_request(self, request_type, url, **kwargs)
+
+    class CacheBackend:
+        removed = []
+
+        def remove(self, key):
+            self.removed.append(key)
+
+    patch_request.setattr(jplhorizons.core.HorizonsClass, '_request', request)
+    patch_request.setattr(jplhorizons.core.HorizonsClass, 'cache_backend', CacheBackend())
+    obj = jplhorizons.Horizons(id='Ceres', epochs=[2451544.5 + i for i in range(200)])
+    obj._last_query = AstroQuery('GET', 'http://dummy')
+    with jplhorizons.conf.set_temp('max_uri_length', 1000):
+        with pytest.raises(HTTPError):
+            obj.ephemerides()
+
+    assert len(requests) > 2
+    url, params = requests[0]
+    assert CacheBackend.removed == [AstroQuery('GET', url, params=params).hash()]
+
+
 def test_no_H(patch_request):
     """testing missing H value (also applies for G, M1, k1, M2, k2)"""
     res = jplhorizons.Horizons(id='1935 UZ').ephemerides()[0]
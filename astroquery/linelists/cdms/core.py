@@ -11,7 +11,8 @@ from astroquery.query import BaseQuery
 # import configurable items declared in __init__.py
 from astroquery.linelists.cdms import conf
 from astroquery.exceptions import InvalidQueryError, EmptyResponseError
-from astroquery.linelists.core import parse_letternumber, parse_molid
+from astroquery.linelists.core import parse_letternumber, parse_letternumber_array, parse_molid  # noqa: F401
+from astroquery.linelists.core import LineCatalogStoreMixin
 from astroquery.utils import process_asyncs
 from astroquery import log
 
@@ -25,7 +26,7 @@ def data_path(filename):
     return os.path.join(data_dir, filename)
 
 
-class CDMSClass(BaseQuery):
+class CDMSClass(LineCatalogStoreMixin, BaseQuery):
     # use the Configuration Items imported from __init__.py
     URL = conf.search
     SERVER = conf.server
@@ -77,7 +78,14 @@ class CDMSClass(BaseQuery):
         requested_molecule = self._mol_to_payload(molecule, parse_name_locally=parse_name_locally,
                                                   flags=flags) if molecule != 'All' else None
 
-        if requested_molecule and requested_molecule in badlist and not get_query_payload:
+        if (conf.use_catalog_store and isinstance(requested_molecule, str)
+                and requested_molecule[:6].isdigit() and cache
+                and temperature_for_intensity == 300 and not get_query_payload):
+            return self.catalog_store.get(requested_molecule[:6], self.get_molecule,
+                                          min_frequency=min_frequency,
+                                          max_frequency=max_frequency,
+                                          min_strength=min_strength)
+        elif requested_molecule and requested_molecule in badlist and not get_query_payload:
             if fallback_to_getmolecule:
                 try:
                     return self.get_molecule(requested_molecule[:6])
@@ -368,9 +376,7 @@ class CDMSClass(BaseQuery):
                     fix_keys.append(qnind)
             for key in fix_keys:
                 if not np.issubdtype(result[key].dtype, np.integer):
-                    intcol = np.array(list(map(parse_letternumber, result[key])),
-                                      dtype=int)
-                    result[key] = intcol
+                    result[key] = parse_letternumber_array(result[key])
 
             # if there is a crash at this step, something went wrong with the query
             # and the _last_query_temperature was not set.  This shouldn't ever
@@ -501,9 +507,23 @@ class CDMSClass(BaseQuery):
             If True, return the raw `requests.Response` object instead of parsing
             the response.  If this is set, the response will be returned whether
             or not it was successful.  Default is False.
+
+        Notes
+        -----
+        If ``conf.use_catalog_store`` is set, the parsed table is kept in the
+        local `catalog_store` and later calls with ``cache=True`` read it from
+        there.  `query_lines` then also answers queries for a single molecule
+        requested by its tag at the default
+        ``temperature_for_intensity`` from the stored catalog, applying the
+        frequency and strength limits locally and returning the columns of
+        `get_molecule`.
         """
         molecule_id = parse_molid(molecule_id)
 
+        use_store = conf.use_catalog_store and not return_response
+        if use_store and cache and self.catalog_store.is_current(molecule_id):
+            return self.catalog_store.load(molecule_id)
+
         url = f'{self.CLASSIC_URL}/entries/c{molecule_id}.cat'
         response = self._request(method='GET', url=url,
                                  timeout=self.TIMEOUT, cache=cache)
@@ -521,6 +541,9 @@ class CDMSClass(BaseQuery):
         species_table = self.get_species_table()
         result.meta = dict(species_table.loc[int(molecule_id)])
 
+        if use_store:
+            self.catalog_store.save(molecule_id, result)
+
         return result
 
     def _parse_cat(self, text, *, verbose=False):
@@ -592,8 +615,7 @@ class CDMSClass(BaseQuery):
         log.debug(f"fix_keys: {fix_keys} should include Q1, Q2, ..., Q14 and GUP")
         for key in fix_keys:
             if not np.issubdtype(result[key].dtype, np.integer):
-                intcol = np.array(list(map(parse_letternumber, result[key])),
-                                  dtype=int)
+                intcol = parse_letternumber_array(result[key])
                 if any(intcol == -999999):
                     intcol = np.ma.masked_where(intcol == -999999, intcol)
                 result[key] = intcol
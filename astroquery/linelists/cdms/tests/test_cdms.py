@@ -5,6 +5,7 @@ import os
 
 from astropy import units as u
 from astropy.table import Table
+from astroquery.linelists.cdms import conf
 from astroquery.linelists.cdms.core import CDMS, parse_letternumber, build_lookup
 from astroquery.utils.mocks import MockResponse
 from astroquery.exceptions import InvalidQueryError
@@ -331,3 +332,43 @@ def test_malformatted_with_parse_name_locally_and_fallback_error():
                          molecule='NOTREALMOLECULE',
                          parse_name_locally=True,
                          fallback_to_getmolecule=True)
+
+
+def test_catalog_store(patch_post, tmp_path):
+    """
+    Test that get_molecule results are kept in the local catalog store and
+    that query_lines selects the lines of stored molecules from it
+    """
+    patch_post.setattr(CDMS, '_cache_location', tmp_path)
+    with conf.set_temp('use_catalog_store', True):
+        tbl = CDMS.get_molecule('058501')
+        assert '058501' in CDMS.catalog_store
+
+        # no more requests are needed once the molecule is stored
+        patch_post.setattr(CDMS, '_request', None)
+        stored = CDMS.get_molecule(58501)
+        assert stored.meta.keys() == tbl.meta.keys()
+        assert stored.meta['tag'] == 58501
+        assert stored.pformat(max_width=-1) == tbl.pformat(max_width=-1)
+        assert stored['Q14'].mask.all()
+
+        result = CDMS.query_lines(min_frequency=100 * u.MHz,
+                                  max_frequency=400 * u.MHz,
+                                  molecule='058501 H2C2S')
+        assert list(result['FREQ']) == [114.9627, 344.8868]
+        assert result.colnames == tbl.colnames
+
+        result = CDMS.query_lines(min_frequency=1 * u.m,
+                                  max_frequency=0.5 * u.m,
+                                  molecule='058501')
+        assert list(result['FREQ']) == [344.8868]
+
+        result = CDMS.query_lines(min_frequency=100 * u.MHz,
+                                  max_frequency=700 * u.MHz,
+                                  min_strength=-9.6,
+                                  molecule='058501')
+        assert list(result['FREQ']) == [114.9627, 689.7699]
+        assert all(result['LGINT'] >= -9.6)
+
+    CDMS.catalog_store.clear()
+    assert '058501' not in CDMS.catalog_store
@@ -2,8 +2,20 @@
 """
 Base classes and common utilities for linelist queries (JPLSpec, CDMS, etc.)
 """
-import numpy as np
+import os
+import pickle
+import shutil
 import string
+import tempfile
+import time
+from pathlib import Path
+
+import astropy.units as u
+import numpy as np
+from astropy.table import Table, MaskedColumn
+
+from astroquery import cache_conf
+from astroquery.cache import _is_expired
 
 
 def parse_letternumber(st):
@@ -31,6 +43,77 @@ def parse_letternumber(st):
     return int(newst)
 
 
+# Value of each character of a quantum number, and whether it makes it negative
+_LETTERNUMBER_VALUES = np.full(256, -1, dtype=np.int64)
+_LETTERNUMBER_VALUES[[0, ord(' ')]] = 0
+_LETTERNUMBER_VALUES[ord('-')] = 0
+_LETTERNUMBER_VALUES[[ord(x) for x in string.digits]] = np.arange(10)
+_LETTERNUMBER_VALUES[[ord(x) for x in string.ascii_uppercase]] = np.arange(10, 36)
+_LETTERNUMBER_VALUES[[ord(x) for x in string.ascii_lowercase]] = np.arange(1, 27)
+_LETTERNUMBER_NEGATIVE = np.zeros(256, dtype=bool)
+_LETTERNUMBER_NEGATIVE[[ord(x) for x in '-' + string.ascii_lowercase]] = True
+
+
+def parse_letternumber_array(values):
+    """
+    Parse a whole column of CDMS's two-letter QNs into integers.
+
+    This is the array equivalent of `parse_letternumber`: masked values are
+    converted to -999999, and the values that are not a sign or letter
+    followed by digits are passed to `parse_letternumber` one by one.
+
+    Parameters
+    ----------
+    values : array-like of str or int
+        The quantum numbers, e.g. a (masked) table column.
+
+    Returns
+    -------
+    `~numpy.ndarray`
+        The integer quantum numbers.
+    """
+    mask = np.ma.getmaskarray(values)
+    data = np.ma.getdata(values)
+    if np.issubdtype(data.dtype, np.integer):
+        return np.where(mask, -999999, data)
+
+    # read the characters from their UCS4 code points; the ones that do not
+    # fit in a byte are all invalid anyway
+    data = np.ascontiguousarray(data, dtype=str)
+    codes = np.minimum(data.view(np.uint32), 255).astype(np.uint8)
+    width = data.dtype.itemsize // 4
+    codes = codes.reshape(len(data), width)
+
+    if width < 18:
+        # strings are padded with null bytes to the width of the column
+        position = np.arange(width)
+        length = (codes != 0).sum(axis=1)
+        exponent = length[:, None] - 1 - position
+        digits = _LETTERNUMBER_VALUES[codes]
+        # the sign or letter can only be the first character after any
+        # leading spaces, and must be followed by digits
+        nonspace = (codes != 0) & (codes != ord(' '))
+        lead = nonspace.argmax(axis=1)
+        lead_code = codes[np.arange(len(codes)), lead]
+        is_digit = (codes >= ord('0')) & (codes <= ord('9'))
+        valid = (nonspace.any(axis=1)
+                 & np.all(is_digit | (position <= lead[:, None]) | (exponent < 0), axis=1)
+                 & (digits.min(axis=1, initial=0) >= 0)
+                 & ~((lead_code == ord('-')) & (exponent[np.arange(len(codes)), lead] == 0)))
+
+        result = np.where(exponent >= 0, digits * 10 ** np.maximum(exponent, 0), 0).sum(axis=1)
+        result[_LETTERNUMBER_NEGATIVE[lead_code]] *= -1
+    else:
+        result = np.zeros(len(data), dtype=np.int64)
+        valid = np.zeros(len(data), dtype=bool)
+
+    for index in np.flatnonzero(~valid & ~mask):
+        result[index] = parse_letternumber(data[index])
+    result[mask] = -999999
+
+    return result
+
+
 def parse_molid(mol_id):
     """
     Parse molecule ID to ensure it is a zero-padded 6-character string.
@@ -70,3 +153,171 @@ def parse_molid(mol_id):
         raise ValueError("molecule_id should be an integer or a length-6 string of numbers")
 
     return molecule_str
+
+
+class LineCatalogStore:
+    """
+    Local store of parsed species catalogs.
+
+    Each species is kept as one ``.npy`` file per column, together with its
+    frequencies in sorted order, so that the lines in a frequency window are
+    found with a binary search and read from memory-mapped arrays without
+    reading or parsing the rest of the catalog.  Stored catalogs expire
+    like the cached responses, after ``cache_conf.cache_timeout`` seconds.
+
+    Parameters
+    ----------
+    location : str or `~pathlib.Path`
+        Directory holding the store; created when the first species is saved.
+    """
+
+    def __init__(self, location):
+        self.location = Path(location)
+
+    def _path(self, molecule_id):
+        return self.location / parse_molid(molecule_id)
+
+    def __contains__(self, molecule_id):
+        try:
+            return (self._path(molecule_id) / 'index.pickle').exists()
+        except ValueError:
+            return False
+
+    def save(self, molecule_id, tbl):
+        """
+        Store the catalog ``tbl`` of the species ``molecule_id``, replacing
+        any previously stored one.
+        """
+        self.location.mkdir(parents=True, exist_ok=True)
+        path = self._path(molecule_id)
+        tmpdir = Path(tempfile.mkdtemp(dir=self.location, prefix='.tmp'))
+        try:
+            columns = []
+            for ii, name in enumerate(tbl.colnames):
+                col = tbl[name]
+                data = np.asarray(col)
+                if data.dtype.kind == 'O':
+                    data = data.astype(str)
+                np.save(tmpdir / f'col{ii}.npy', data)
+                masked = isinstance(col, MaskedColumn)
+                if masked:
+                    np.save(tmpdir / f'mask{ii}.npy', np.ma.getmaskarray(col))
+                columns.append((name, col.unit, masked))
+
+            freq = np.asarray(tbl['FREQ'])
+            order = np.argsort(freq, kind='stable')
+            np.save(tmpdir / 'order.npy', order)
+            np.save(tmpdir / 'freq_sorted.npy', freq[order])
+            with open(tmpdir / 'index.pickle', 'wb') as fh:
+                pickle.dump({'columns': columns, 'freq_unit': tbl['FREQ'].unit,
+                             'meta': dict(tbl.meta), 'saved': time.time()}, fh)
+
+            if path.exists():
+                shutil.rmtree(path)
+            os.replace(tmpdir, path)
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def is_current(self, molecule_id, *, cache_timeout=None):
+        """
+        Whether the catalog of the species ``molecule_id`` is stored and was
+        saved less than ``cache_timeout`` seconds ago (-1 never expires).
+        ``cache_timeout`` defaults to ``cache_conf.cache_timeout``.
+        """
+        if molecule_id not in self:
+            return False
+        if cache_timeout is None:
+            cache_timeout = cache_conf.cache_timeout
+        with open(self._path(molecule_id) / 'index.pickle', 'rb') as fh:
+            index = pickle.load(fh)
+        # catalogs stored without their save time are fetched again
+        return 'saved' in index and not _is_expired(index['saved'], cache_timeout)
+
+    def get(self, molecule_id, fetch, *, cache_timeout=None, **limits):
+        """
+        Read the stored catalog of the species ``molecule_id`` like `load`,
+        first calling ``fetch(molecule_id)``, which is expected to save it,
+        if it is missing or expired (see `is_current`).
+        """
+        if not self.is_current(molecule_id, cache_timeout=cache_timeout):
+            fetch(molecule_id)
+        return self.load(molecule_id, **limits)
+
+    def load(self, molecule_id, *, min_frequency=None, max_frequency=None,
+             min_strength=None):
+        """
+        Read the stored catalog of the species ``molecule_id``.
+
+        Parameters
+        ----------
+        molecule_id : int or str
+            The species tag/identifier.
+        min_frequency, max_frequency : `~astropy.units.Quantity`, optional
+            Only return the lines in this range of frequency (or any
+            spectral() equivalent). Unbounded if not given.
+        min_strength : float, optional
+            Only return the lines whose ``LGINT`` is at least this value.
+
+        Returns
+        -------
+        Table : `~astropy.table.Table`
+            The stored lines, in their original order.
+        """
+        path = self._path(molecule_id)
+        with open(path / 'index.pickle', 'rb') as fh:
+            index = pickle.load(fh)
+
+        rows = None
+        if min_frequency is not None or max_frequency is not None:
+            freq_sorted = np.load(path / 'freq_sorted.npy', mmap_mode='r')
+            low, high = (None if bound is None
+                         else bound.to_value(index['freq_unit'], u.spectral())
+                         for bound in (min_frequency, max_frequency))
+            # wavelength limits come in the opposite order
+            if low is not None and high is not None and low > high:
+                low, high = high, low
+            start = 0 if low is None else np.searchsorted(freq_sorted, low, side='left')
+            stop = (len(freq_sorted) if high is None
+                    else np.searchsorted(freq_sorted, high, side='right'))
+            order = np.load(path / 'order.npy', mmap_mode='r')
+            rows = np.sort(order[start:stop])
+
+        mmap_mode = None if rows is None else 'r'
+        result = Table(meta=index['meta'])
+        for ii, (name, unit, masked) in enumerate(index['columns']):
+            data = np.load(path / f'col{ii}.npy', mmap_mode=mmap_mode)
+            if rows is not None:
+                data = data[rows]
+            if masked:
+                mask = np.load(path / f'mask{ii}.npy', mmap_mode=mmap_mode)
+                if rows is not None:
+                    mask = mask[rows]
+                result[name] = MaskedColumn(data, mask=mask, unit=unit)
+            else:
+                result[name] = data
+                result[name].unit = unit
+
+        if min_strength is not None and 'LGINT' in result.colnames:
+            result = result[result['LGINT'] >= min_strength]
+
+        return result
+
+    def clear(self):
+        """
+        Remove all the stored catalogs.
+        """
+        shutil.rmtree(self.location, ignore_errors=True)
+
+
+class LineCatalogStoreMixin:
+    """
+    Gives a line list query class a `LineCatalogStore` in its cache directory.
+    """
+
+    @property
+    def catalog_store(self):
+        """
+        The `~astroquery.linelists.core.LineCatalogStore` used when
+        ``conf.use_catalog_store`` is set, kept in the cache directory.
+        """
+        return LineCatalogStore(self.cache_location / 'catalogs')
@@ -25,6 +25,12 @@ class Conf(_config.ConfigNamespace):
         60,
         'Time limit for connecting to JPL server.')
 
+    use_catalog_store = _config.ConfigItem(
+        False,
+        'Keep the molecule catalogs retrieved with get_molecule in a local '
+        'store, and answer query_lines for explicitly requested molecules '
+        'from it.')
+
 
 conf = Conf()
 
@@ -7,7 +7,8 @@ import numpy as np
 from astropy.io import ascii
 from astropy import table
 from astroquery.query import BaseQuery
-from astroquery.linelists.core import parse_letternumber, parse_molid
+from astroquery.linelists.core import (parse_letternumber, parse_letternumber_array, parse_molid,
+                                       LineCatalogStoreMixin)
 # import configurable items declared in __init__.py
 from astroquery.linelists.jplspec import conf, lookup_table
 from astroquery.exceptions import EmptyResponseError, InvalidQueryError
@@ -23,7 +24,7 @@ def data_path(filename):
     return os.path.join(data_dir, filename)
 
 
-class JPLSpecClass(BaseQuery):
+class JPLSpecClass(LineCatalogStoreMixin, BaseQuery):
 
     # use the Configuration Items imported from __init__.py
     URL = conf.server
@@ -160,6 +161,12 @@ class JPLSpecClass(BaseQuery):
         retrieve full molecule catalogs via `get_molecule`. It is needed when
         the JPL query server is unresponsive. Frequency and strength limits
         are not applied in this mode.
+
+        If ``conf.use_catalog_store`` is set, use_getmolecule queries are
+        answered from the catalogs kept in the local `catalog_store`
+        (retrieving them with `get_molecule` when missing or expired), with
+        the frequency and strength limits applied locally.  max_lines is not
+        applied, and the columns are those of `get_molecule`.
         """
         if use_getmolecule:
             if get_query_payload:
@@ -167,6 +174,11 @@ class JPLSpecClass(BaseQuery):
                                                               parse_name_locally=parse_name_locally)))]
             mols = self._resolve_molecules(molecule, flags=flags,
                                            parse_name_locally=parse_name_locally)
+            if conf.use_catalog_store and cache:
+                return self._build_table_from_get_molecule(
+                    mols, limits=dict(min_frequency=min_frequency,
+                                      max_frequency=max_frequency,
+                                      min_strength=min_strength))
             return self._build_table_from_get_molecule(mols)
 
         response = self.query_lines_async(min_frequency=min_frequency,
@@ -200,16 +212,23 @@ class JPLSpecClass(BaseQuery):
             return list(molecule)
         return [molecule]
 
-    def _build_table_from_get_molecule(self, mols):
+    def _build_table_from_get_molecule(self, mols, *, limits=None):
         """
         Fetch full catalog tables for each molecule and combine them.
 
         ``mols`` should be passed through ``_resolve_molecules`` before being
         sent to this function if it is user-specified, but if it comes directly
         from a query, it should be trusted as-is.
+
+        If ``limits`` are given, the lines are instead selected with these
+        keyword arguments of `~astroquery.linelists.core.LineCatalogStore.load`
+        from the local catalog store.
         """
         self.lookup_ids = build_lookup()
-        tbs = [self.get_molecule(mol) for mol in mols]
+        if limits is None:
+            tbs = [self.get_molecule(mol) for mol in mols]
+        else:
+            tbs = [self.catalog_store.get(mol, self.get_molecule, **limits) for mol in mols]
         if len(tbs) > 1:
             for tb, mol in zip(tbs, mols):
                 tb['Name'] = self.lookup_ids.find(str(mol), flags=0)
@@ -352,6 +371,12 @@ class JPLSpecClass(BaseQuery):
         Table : `~astropy.table.Table`
             Table containing all spectral lines for the requested molecule.
 
+        Notes
+        -----
+        If ``conf.use_catalog_store`` is set, the parsed table is kept in the
+        local `catalog_store` and later calls with ``cache=True`` read it from
+        there.
+
         Examples
         --------
         >>> table = JPLSpec.get_molecule(18003)  # doctest: +SKIP
@@ -359,6 +384,9 @@ class JPLSpecClass(BaseQuery):
         """
         molecule_str = parse_molid(molecule_id)
 
+        if conf.use_catalog_store and cache and self.catalog_store.is_current(molecule_str):
+            return self.catalog_store.load(molecule_str)
+
         # Construct the URL to the catalog file
         url = f'{self.FTP_CAT_URL}/c{molecule_str}.cat'
 
@@ -382,6 +410,9 @@ class JPLSpecClass(BaseQuery):
             # Add metadata as a dictionary
             result.meta = dict(zip(matching_rows.colnames, matching_rows[0]))
 
+        if conf.use_catalog_store:
+            self.catalog_store.save(molecule_str, result)
+
         return result
 
     def _parse_cat(self, response, *, verbose=False):
@@ -479,16 +510,22 @@ class JPLSpecClass(BaseQuery):
                         ind1 = ii * 2
                         ind2 = ii * 2 + 2
                         # rjust(qnlen) is needed to enforce that all strings retain their exact original shape
-                        qnp = [int_or_pm(line.rjust(qnlen)[ind1: ind2].strip()) for line in tbl['QN\'']]
-                        qnpp = [int_or_pm(line.rjust(qnlen)[ind1: ind2].strip()) for line in tbl['QN"']]
-                        dtype = str if any('+' in str(x) for x in qnp) else int
-                        tbl[f"QN'{ii+1}"] = np.array(qnp, dtype=dtype)
-                        tbl[f'QN"{ii+1}'] = np.array(qnpp, dtype=dtype)
+                        qnp = [line.rjust(qnlen)[ind1: ind2].strip() for line in tbl['QN\'']]
+                        qnpp = [line.rjust(qnlen)[ind1: ind2].strip() for line in tbl['QN"']]
+                        if pm_is_ok:
+                            qnp = [int_or_pm(st) for st in qnp]
+                            qnpp = [int_or_pm(st) for st in qnpp]
+                            dtype = str if any('+' in str(x) for x in qnp) else int
+                            tbl[f"QN'{ii+1}"] = np.array(qnp, dtype=dtype)
+                            tbl[f'QN"{ii+1}'] = np.array(qnpp, dtype=dtype)
+                        else:
+                            tbl[f"QN'{ii+1}"] = parse_letternumber_array(qnp)
+                            tbl[f'QN"{ii+1}'] = parse_letternumber_array(qnpp)
                 del tbl['QN\'']
                 del tbl['QN"']
             else:
-                tbl['QN\''] = np.array(list(map(parse_letternumber, tbl['QN\''])), dtype=int)
-                tbl['QN"'] = np.array(list(map(parse_letternumber, tbl['QN"'])), dtype=int)
+                tbl['QN\''] = parse_letternumber_array(tbl['QN\''])
+                tbl['QN"'] = parse_letternumber_array(tbl['QN"'])
 
         result = table.vstack(tables)
 
@@ -2,13 +2,16 @@ import numpy as np
 import pytest
 
 from unittest.mock import Mock, MagicMock, patch
+from astroquery import cache_conf
 from astroquery.exceptions import EmptyResponseError
 
 import os
 
 from astropy import units as u
 from astropy.table import Table
+from astroquery.linelists.jplspec import conf
 from astroquery.linelists.jplspec.core import JPLSpec
+from astroquery.utils.mocks import MockResponse
 
 file1 = 'CO.data'
 file2 = 'CO_6.data'
@@ -328,3 +331,45 @@ def test_query_lines_with_fallback():
         assert isinstance(result, Table)
         assert len(result) > 0
         assert 'molecule_id' in result.meta
+
+
+def test_catalog_store(monkeypatch, tmp_path):
+    """Test that query_lines selects the lines of stored catalogs locally."""
+
+    def mock_request(*args, url='', **kwargs):
+        assert url.endswith('c018003.cat')
+        with open(data_path('H2O_sample.cat'), 'rb') as fh:
+            return MockResponse(content=fh.read())
+
+    monkeypatch.setattr(JPLSpec, '_cache_location', tmp_path)
+    monkeypatch.setattr(JPLSpec, '_request', mock_request)
+    with conf.set_temp('use_catalog_store', True):
+        tbl = JPLSpec.get_molecule(18003)
+
+        # no more requests are needed once the molecule is stored
+        monkeypatch.setattr(JPLSpec, '_request', None)
+        stored = JPLSpec.get_molecule('018003')
+        assert stored.pformat(max_width=-1) == tbl.pformat(max_width=-1)
+        assert stored.meta == tbl.meta
+
+        result = JPLSpec.query_lines(min_frequency=20 * u.GHz,
+                                     max_frequency=200 * u.GHz,
+                                     min_strength=-10,
+                                     molecule='18003')
+        expected = tbl[(tbl['FREQ'] >= 20000) & (tbl['FREQ'] <= 200000)
+                       & (tbl['LGINT'] >= -10)]
+        assert len(expected) > 0
+        assert result.pformat(max_width=-1) == expected.pformat(max_width=-1)
+        assert result.meta['molecule_id'] == '18003'
+
+    # expired catalogs are retrieved again
+    requested = []
+
+    def counting_request(*args, **kwargs):
+        requested.append(kwargs['url'])
+        return mock_request(*args, **kwargs)
+
+    monkeypatch.setattr(JPLSpec, '_request', counting_request)
+    with conf.set_temp('use_catalog_store', True), cache_conf.set_temp('cache_timeout', 0):
+        JPLSpec.get_molecule(18003)
+    assert len(requested) == 1
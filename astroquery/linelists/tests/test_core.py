@@ -2,10 +2,14 @@
 """
 Tests for linelists.core utility functions
 """
+import astropy.units as u
 import numpy as np
 import pytest
+from astropy.table import Table
 
-from astroquery.linelists.core import parse_molid
+from astroquery import cache_conf
+from astroquery.linelists.core import (parse_letternumber, parse_letternumber_array, parse_molid,
+                                       LineCatalogStore)
 
 
 class TestParseMolid:
@@ -74,3 +78,58 @@ class TestParseMolid:
 
         with pytest.raises(ValueError, match="integer or a length-6 string"):
             parse_molid(None)
+
+
+class TestParseLetternumberArray:
+    """Tests for the parse_letternumber_array function"""
+
+    def test_matches_parse_letternumber(self):
+        """Test that whole columns decode like parse_letternumber"""
+        values = ['A0', 'Z9', 'a0', 'b5', 'ZZ', '5', '-5', '12', '-12',
+                  ' 3', '3 ', 'A', 'a', 'A12', '+4', '0']
+        expected = [parse_letternumber(value) for value in values]
+        assert list(parse_letternumber_array(values)) == expected
+        assert list(parse_letternumber_array(np.array(values, dtype=object))) == expected
+
+    def test_masked(self):
+        """Test that masked values are converted to -999999"""
+        values = np.ma.MaskedArray(['1', 'A1', 'x'], mask=[False, False, True])
+        assert list(parse_letternumber_array(values)) == [1, 101, -999999]
+
+        values = np.ma.MaskedArray([1, 2], mask=[False, True])
+        assert list(parse_letternumber_array(values)) == [1, -999999]
+
+    def test_errors(self):
+        """Test that invalid values raise like parse_letternumber"""
+        for values in (['-'], [''], ['1', '1.5'], ['é']):
+            with pytest.raises(ValueError, match="invalid literal"):
+                parse_letternumber_array(values)
+
+
+class TestLineCatalogStore:
+
+    def test_get_fetches_missing_and_expired(self, tmp_path):
+        """Test that get fetches a catalog when missing or expired only"""
+        store = LineCatalogStore(tmp_path)
+        fetched = []
+
+        def fetch(molecule_id):
+            fetched.append(molecule_id)
+            store.save(molecule_id, Table({'FREQ': [300., 100., 200.] * u.MHz,
+                                           'LGINT': [-3., -1., -2.]}))
+
+        result = store.get('028001', fetch, min_frequency=150 * u.MHz)
+        assert fetched == ['028001']
+        assert list(result['FREQ']) == [300., 200.]
+
+        result = store.get(28001, fetch, min_strength=-1.5)
+        assert fetched == ['028001']
+        assert list(result['LGINT']) == [-1.]
+        assert store.is_current('028001', cache_timeout=-1)
+
+        with cache_conf.set_temp('cache_timeout', 0):
+            assert not store.is_current('028001')
+            store.get('028001', fetch)
+        assert fetched == ['028001', '028001']
+
+        assert not store.is_current('018003')
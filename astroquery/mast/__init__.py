@@ -29,6 +29,35 @@ class Conf(_config.ConfigNamespace):
     pagesize = _config.ConfigItem(
         50000,
         'Number of results to request at once from the STScI server.')
+    page_workers = _config.ConfigItem(
+        1,
+        'Number of result pages requested concurrently from the MAST Portal once the '
+        'number of pages is known. 1 retrieves the pages one after the other.')
+    batch_workers = _config.ConfigItem(
+        1,
+        'Number of batches requested concurrently when a request is split into batches, '
+        'e.g. by ``get_product_list`` or ``resolve_object``. 1 requests the batches one '
+        'after the other.')
+    batch_retries = _config.ConfigItem(
+        0,
+        'Number of times a batch is retried, with exponential backoff, after a connection '
+        'error, a timeout or a server error.')
+    download_workers = _config.ConfigItem(
+        1,
+        'Number of data products downloaded concurrently by ``download_products``. '
+        '1 downloads the products one after the other.')
+    download_host_connections = _config.ConfigItem(
+        4,
+        'Maximum number of concurrent downloads from a single host.')
+    download_retries = _config.ConfigItem(
+        0,
+        'Number of times a file download is retried, with exponential backoff, after a '
+        'connection error, a timeout or a server error.')
+    download_manifest = _config.ConfigItem(
+        False,
+        'Record completed downloads in a manifest in the download directory, so that '
+        'repeating an interrupted ``download_products`` call with ``cache=True`` skips the '
+        'completed files without contacting the server.')
     enable_cloud_dataset = _config.ConfigItem(
         True,
         'Enable access to cloud-hosted datasets (e.g. on AWS S3) by default. '
@@ -5,10 +5,13 @@ MAST Core
 
 This the base class for MAST queries.
 """
+import os
+from pathlib import Path
+
 from astropy.utils import deprecated
 from astropy.utils.decorators import deprecated_renamed_argument
 from ..query import QueryWithLogin
-from . import utils
+from . import conf, utils
 from .auth import MastAuth
 from .discovery_portal import PortalAPI
 from .services import ServiceAPI
@@ -37,6 +40,42 @@ class MastQueryWithLogin(QueryWithLogin):
 
         self._cloud_connection = None
 
+    def _download_resumable(self, url, local_path, *, cache=True, head_safe=False, verbose=True):
+        """
+        Downloads ``url`` to ``local_path`` through a ``.part`` file.
+
+        The file only appears under its final name once complete. An interrupted
+        download is continued from its ``.part`` file on the next call if the
+        server supports range requests. Connection errors, timeouts and server
+        errors are retried ``conf.download_retries`` times.
+
+        Parameters
+        ----------
+        url : str
+            The URL to download.
+        local_path : str or `~pathlib.Path`
+            The path of the downloaded file.
+        cache : bool, optional
+            Default True. If the file is found on disk it will not be downloaded again.
+        head_safe : bool, optional
+            Default False. Whether the server supports ``HEAD`` requests, see
+            ``BaseQuery._download_file``.
+        verbose : bool, optional
+            Default True. Whether to show download progress in the console.
+        """
+        local_path = Path(local_path)
+        if cache and local_path.exists():
+            # Let _download_file compare the size with the remote one
+            utils._retry_transient(self._download_file, url, local_path, cache=cache, head_safe=head_safe,
+                                   verbose=verbose, retries=conf.download_retries)
+            return
+
+        part_path = local_path.with_name(local_path.name + '.part')
+        utils._retry_transient(self._download_file, url, part_path, cache=cache, head_safe=head_safe,
+                               verbose=verbose, retries=conf.download_retries)
+        if part_path.exists():
+            os.replace(part_path, local_path)
+
     def _login(self, token=None, store_token=False, reenter_token=False):
         """
         Log into the MAST portal.
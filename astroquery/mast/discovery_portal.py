@@ -12,6 +12,8 @@ import uuid
 import json
 import time
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from urllib.parse import quote as urlencode
@@ -51,6 +53,13 @@ def _prepare_service_request_string(json_obj):
     return 'request={}'.format(urlencode(request_string))
 
 
+def _set_request_page(request_string, page, new_page):
+    """
+    Changes the requested page in a URL encoded Mashup request string.
+    """
+    return request_string.replace("page%22%3A%20" + str(page) + "%2C", "page%22%3A%20" + str(new_page) + "%2C")
+
+
 def _json_to_table(json_obj, col_config=None):
     """
     Takes a JSON object as returned from a Mashup request and turns it into an `~astropy.table.Table`.
@@ -72,6 +81,7 @@ def _json_to_table(json_obj, col_config=None):
     if not all(x in json_obj.keys() for x in ['fields', 'data']):
         raise KeyError("Missing required key(s) 'data' and/or 'fields.'")
 
+    col_specs = []
     for col, atype in [(x['name'], x['type']) for x in json_obj['fields']]:
 
         # Removing "_selected_" column
@@ -89,8 +99,14 @@ def _json_to_table(json_obj, col_config=None):
         atype = reg_type[1]
         ignore_value = reg_type[2] if (ignore_value is None) else ignore_value
 
-        # Make the column list (don't assign final type yet or there will be errors)
-        col_data = np.array([x.get(col, ignore_value) for x in json_obj['data']], dtype=object)
+        col_specs.append((col, atype, ignore_value))
+
+    # Make the column arrays in one pass over the rows (don't assign final type yet or there will be errors)
+    columns = utils._json_rows_to_columns(json_obj['data'], [spec[0] for spec in col_specs],
+                                          defaults=[spec[2] for spec in col_specs])
+
+    for col, atype, ignore_value in col_specs:
+        col_data = columns[col]
         if ignore_value is not None:
             col_data[np.where(np.equal(col_data, None))] = ignore_value
 
@@ -172,45 +188,78 @@ class PortalAPI(BaseQuery):
         """
 
         start_time = time.time()
-        all_responses = []
-        total_pages = 1
-        cur_page = 0
+
+        response, status, paging = self._request_page(method, url, params=params, data=data,
+                                                      headers=headers, files=files, stream=stream,
+                                                      auth=auth, start_time=start_time)
+        all_responses = [response]
+        if (status != "COMPLETE") or (not retrieve_all) or (paging is None):
+            return all_responses
+
+        cur_page = paging['page']
+        total_pages = paging['pagesFiltered']
+        workers = min(conf.page_workers, total_pages - cur_page)
+
+        if workers > 1:
+            # Once the number of pages is known, the remaining ones are
+            # independent requests that can be made concurrently
+            def fetch_page(page):
+                page_data = _set_request_page(data, cur_page, page)
+                return self._request_page(method, url, params=params, data=page_data,
+                                          headers=headers, files=files, stream=stream,
+                                          auth=auth, start_time=start_time)[0]
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                all_responses.extend(executor.map(fetch_page, range(cur_page + 1, total_pages + 1)))
+            return all_responses
 
         while cur_page < total_pages:
-            status = "EXECUTING"
+            data = _set_request_page(data, cur_page, cur_page + 1)
+            response, status, paging = self._request_page(method, url, params=params, data=data,
+                                                          headers=headers, files=files, stream=stream,
+                                                          auth=auth, start_time=start_time)
+            all_responses.append(response)
 
-            while status == "EXECUTING":
-                response = super(PortalAPI, self)._request(method, url, params=params, data=data,
-                                                           headers=headers, files=files, cache=False,
-                                                           stream=stream, auth=auth)
+            if (status != "COMPLETE") or (paging is None):
+                break
+            total_pages = paging['pagesFiltered']
+            cur_page = paging['page']
 
-                if (time.time() - start_time) >= self.TIMEOUT:
-                    raise TimeoutError("Timeout limit of {} exceeded.".format(self.TIMEOUT))
+        return all_responses
 
-                # Raising error based on HTTP status if necessary
-                response.raise_for_status()
+    def _request_page(self, method, url, params=None, data=None, headers=None,
+                      files=None, stream=False, auth=None, start_time=None):
+        """
+        Requests a single page of results, repeating the request while the
+        Mashup server reports that the query is still executing.
 
-                result = response.json()
+        Returns
+        -------
+        response, status, paging : `~requests.Response`, str, dict or None
+            The final response, its Mashup status and paging information.
+        """
+        status = "EXECUTING"
 
-                if not result:  # kind of hacky, but col_config service returns nothing if there is an error
-                    status = "ERROR"
-                else:
-                    status = result.get("status")
+        while status == "EXECUTING":
+            response = super(PortalAPI, self)._request(method, url, params=params, data=data,
+                                                       headers=headers, files=files, cache=False,
+                                                       stream=stream, auth=auth)
 
-            all_responses.append(response)
+            if (time.time() - start_time) >= self.TIMEOUT:
+                raise TimeoutError("Timeout limit of {} exceeded.".format(self.TIMEOUT))
 
-            if (status != "COMPLETE") or (not retrieve_all):
-                break
+            # Raising error based on HTTP status if necessary
+            response.raise_for_status()
 
-            paging = result.get("paging")
-            if paging is None:
-                break
-            total_pages = paging['pagesFiltered']
-            cur_page = paging['page']
+            result = utils._parse_json(response)
 
-            data = data.replace("page%22%3A%20"+str(cur_page)+"%2C", "page%22%3A%20"+str(cur_page+1)+"%2C")
+            if not result:  # kind of hacky, but col_config service returns nothing if there is an error
+                status = "ERROR"
+            else:
+                status = result.get("status")
 
-        return all_responses
+        paging = result.get("paging") if result else None
+        return response, status, paging
 
     def _get_col_config(self, service, fetch_name=None):
         """
@@ -285,7 +334,7 @@ class PortalAPI(BaseQuery):
             self._current_service = None  # clearing current service
 
         for resp in responses:
-            result = resp.json()
+            result = utils._parse_json(resp)
 
             # check for error message
             if result['status'] == "ERROR":
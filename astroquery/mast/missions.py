@@ -12,7 +12,7 @@ import warnings
 from collections.abc import Iterable
 from json import JSONDecodeError
 from pathlib import Path
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 
 import astropy.units as u
 import numpy as np
@@ -773,7 +773,7 @@ class MastMissionsClass(MastQueryWithLogin):
 
         try:
             # Attempt file download
-            self._download_file(escaped_url, local_path, cache=cache, verbose=verbose)
+            self._download_resumable(escaped_url, local_path, cache=cache, verbose=verbose)
 
             # Check if file exists
             if not local_path.is_file() and status != 'SKIPPED':
@@ -804,6 +804,8 @@ class MastMissionsClass(MastQueryWithLogin):
         """
         Downloads files listed in an `~astropy.table.Table` of data products to a specified directory.
 
+        The files are downloaded ``conf.download_workers`` at a time, see `~astroquery.mast.Conf`.
+
         Parameters
         ----------
         products : `~astropy.table.Table`
@@ -824,9 +826,15 @@ class MastMissionsClass(MastQueryWithLogin):
             Table containing download results for each data product file.
         """
 
-        manifest_entries = []
         base_dir = Path(base_dir)
+        manifest = utils._DownloadManifest(base_dir) if (cache and conf.download_manifest) else None
+        host = urlparse(self._service_api_connection.MAST_DOWNLOAD_URL).netloc
+
+        # Progress bars of concurrent downloads would be interleaved
+        verbose = verbose and conf.download_workers <= 1
 
+        local_paths = []
+        jobs = []
         for data_product in products:
             col_names = data_product.colnames
             # Determine local path for each file
@@ -850,18 +858,25 @@ class MastMissionsClass(MastQueryWithLogin):
             local_path.mkdir(parents=True, exist_ok=True)
             local_file_path = local_path / Path(filename).name
 
-            # Download files and record status
-            status, msg, url = self.download_file(uri,
-                                                  local_path=local_file_path,
-                                                  cache=cache,
-                                                  mission=mission,
-                                                  verbose=verbose)
-            manifest_entries.append([local_file_path, status, msg, url])
+            local_paths.append(local_file_path)
+            jobs.append((host, local_file_path, (uri, local_file_path, cache, mission, verbose)))
+
+        # Download files and record status
+        results = utils._download_concurrently(self._download_product, jobs,
+                                               workers=conf.download_workers,
+                                               host_connections=conf.download_host_connections,
+                                               manifest=manifest)
+        manifest_entries = [[local_file_path, status, msg, url]
+                            for local_file_path, (status, msg, url) in zip(local_paths, results)]
 
         # Return manifest as Astropy Table
         manifest = Table(rows=manifest_entries, names=('Local Path', 'Status', 'Message', 'URL'))
         return manifest
 
+    def _download_product(self, uri, local_path, cache, mission, verbose):
+        """Downloads a single file of ``_download_files``, see `download_file`."""
+        return self.download_file(uri, local_path=local_path, cache=cache, mission=mission, verbose=verbose)
+
     def download_products(self, products, *, download_dir=None, flat=False,
                           cache=True, extension=None, verbose=True, **filters):
         """
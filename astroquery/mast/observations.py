@@ -10,7 +10,7 @@ import os
 import time
 import warnings
 from pathlib import Path
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 
 import astropy.coordinates as coord
 import astropy.units as u
@@ -778,7 +778,7 @@ class ObservationsClass(MastQueryWithLogin):
                     if self._cloud_enabled_explicitly:
                         warnings.warn(f'The product {uri} was not found in the cloud. '
                                       'Falling back to MAST download.', InputWarning)
-                    self._download_file(escaped_url, local_path, cache=cache, head_safe=True, verbose=verbose)
+                    self._download_resumable(escaped_url, local_path, cache=cache, head_safe=True, verbose=verbose)
                 except (ClientError, BotoCoreError) as ex:
                     # Should be in cloud, but download failed
                     if cloud_only:
@@ -789,12 +789,12 @@ class ObservationsClass(MastQueryWithLogin):
                     if self._cloud_enabled_explicitly:
                         warnings.warn(f'Could not download {uri} from cloud: {ex}. Falling back to MAST download.',
                                       InputWarning)
-                    self._download_file(escaped_url, local_path, cache=cache, head_safe=True, verbose=verbose)
+                    self._download_resumable(escaped_url, local_path, cache=cache, head_safe=True, verbose=verbose)
             else:
                 if cloud_only:
                     warnings.warn("`cloud_only` is True but cloud data access is not enabled. "
                                   "Falling back to MAST download.", InputWarning)
-                self._download_file(escaped_url, local_path, cache=cache, head_safe=True, verbose=verbose)
+                self._download_resumable(escaped_url, local_path, cache=cache, head_safe=True, verbose=verbose)
 
             # check if file exists also this is where would perform md5,
             # and also check the filesize if the database reliably reported file sizes
@@ -810,6 +810,8 @@ class ObservationsClass(MastQueryWithLogin):
         """
         Download a table of MAST data products to a specified directory.
 
+        The products are downloaded ``conf.download_workers`` at a time, see `~astroquery.mast.Conf`.
+
         Parameters
         ----------
         products : `~astropy.table.Table`
@@ -833,13 +835,19 @@ class ObservationsClass(MastQueryWithLogin):
             Table summarizing the download results.
         """
         base_dir = Path(base_dir)
-        manifest_rows = []
+        manifest = utils._DownloadManifest(base_dir) if (cache and conf.download_manifest) else None
+        mast_host = urlparse(self._portal_api_connection.MAST_DOWNLOAD_URL).netloc
+
+        # Progress bars of concurrent downloads would be interleaved
+        verbose = verbose and conf.download_workers <= 1
 
         # Resolve cloud URIs once if cloud is enabled
         cloud_uri_map = None
         if self._cloud_connection is not None:
             cloud_uri_map = self.get_cloud_uris(products, return_uri_map=True, verbose=False)
 
+        local_paths = []
+        jobs = []
         for product in products:
             mast_uri = product['dataURI']
             filename = os.path.basename(product['productFilename'])
@@ -852,51 +860,76 @@ class ObservationsClass(MastQueryWithLogin):
                 local_dir.mkdir(parents=True, exist_ok=True)
             local_path = local_dir / filename
 
-            status, msg, url = 'ERROR', None, None
-
             cloud_uri = cloud_uri_map.get(mast_uri) if cloud_uri_map else None
-            if cloud_uri:
-                try:
-                    self._cloud_connection.download_file_from_cloud(cloud_uri, local_path, cache, verbose)
-                    status = 'COMPLETE'
-                except (ClientError, BotoCoreError) as ex:
-                    # Should be in cloud, but download failed
-                    if cloud_only:
-                        warnings.warn(f'Could not download {cloud_uri} from cloud: {ex}. Skipping download.',
-                                      NoResultsWarning)
-                        status = 'SKIPPED'
-                        msg = str(ex)
-                    else:
-                        if self._cloud_enabled_explicitly:
-                            warnings.warn(f'Could not download {cloud_uri} from cloud: {ex}. '
-                                          'Falling back to MAST download.', InputWarning)
-                        status, msg, url = self.download_file(mast_uri, local_path=local_path, cache=cache,
-                                                              force_on_prem=True, verbose=verbose)
-            else:
-                if cloud_uri_map is not None:
-                    # Cloud is enabled, but product was not found in cloud
-                    if cloud_only:
-                        warnings.warn(f'The product {mast_uri} was not found in the cloud. Skipping download.',
-                                      NoResultsWarning)
-                        status = 'SKIPPED'
-                        msg = 'Product not found in cloud'
-                    else:
-                        if self._cloud_enabled_explicitly:
-                            warnings.warn(f'The product {mast_uri} was not found in the cloud. '
-                                          'Falling back to MAST download.', InputWarning)
-                        status, msg, url = self.download_file(mast_uri, local_path=local_path, cache=cache,
-                                                              force_on_prem=True, verbose=verbose)
+            host = 'cloud' if cloud_uri else mast_host
+            local_paths.append(local_path)
+            jobs.append((host, local_path, (mast_uri, cloud_uri, cloud_uri_map is not None, local_path,
+                                            cache, cloud_only, verbose)))
+
+        results = utils._download_concurrently(self._download_product, jobs,
+                                               workers=conf.download_workers,
+                                               host_connections=conf.download_host_connections,
+                                               manifest=manifest)
+
+        manifest_rows = [[str(local_path), status, msg, url]
+                         for local_path, (status, msg, url) in zip(local_paths, results)]
+        return Table(rows=manifest_rows, names=('Local Path', 'Status', 'Message', 'URL'))
+
+    def _download_product(self, mast_uri, cloud_uri, cloud_enabled, local_path, cache, cloud_only, verbose):
+        """
+        Download a single product of ``_download_files``, from the cloud if it is available there.
+
+        Returns
+        -------
+        status : str
+            Download status, either COMPLETE, SKIPPED, or ERROR.
+        msg : str
+            An error status message, if any.
+        url : str
+            The full url download path, if the download failed.
+        """
+        status, msg, url = 'ERROR', None, None
+
+        if cloud_uri:
+            try:
+                self._cloud_connection.download_file_from_cloud(cloud_uri, local_path, cache, verbose)
+                status = 'COMPLETE'
+            except (ClientError, BotoCoreError) as ex:
+                # Should be in cloud, but download failed
+                if cloud_only:
+                    warnings.warn(f'Could not download {cloud_uri} from cloud: {ex}. Skipping download.',
+                                  NoResultsWarning)
+                    status = 'SKIPPED'
+                    msg = str(ex)
                 else:
-                    # Cloud is not enabled
-                    if cloud_only:
-                        warnings.warn("`cloud_only` is True but cloud data access is not enabled. "
-                                      "Falling back to MAST download.", InputWarning)
+                    if self._cloud_enabled_explicitly:
+                        warnings.warn(f'Could not download {cloud_uri} from cloud: {ex}. '
+                                      'Falling back to MAST download.', InputWarning)
                     status, msg, url = self.download_file(mast_uri, local_path=local_path, cache=cache,
-                                                          cloud_only=False, force_on_prem=True, verbose=verbose)
-
-            manifest_rows.append([str(local_path), status, msg, url])
+                                                          force_on_prem=True, verbose=verbose)
+        else:
+            if cloud_enabled:
+                # Cloud is enabled, but product was not found in cloud
+                if cloud_only:
+                    warnings.warn(f'The product {mast_uri} was not found in the cloud. Skipping download.',
+                                  NoResultsWarning)
+                    status = 'SKIPPED'
+                    msg = 'Product not found in cloud'
+                else:
+                    if self._cloud_enabled_explicitly:
+                        warnings.warn(f'The product {mast_uri} was not found in the cloud. '
+                                      'Falling back to MAST download.', InputWarning)
+                    status, msg, url = self.download_file(mast_uri, local_path=local_path, cache=cache,
+                                                          force_on_prem=True, verbose=verbose)
+            else:
+                # Cloud is not enabled
+                if cloud_only:
+                    warnings.warn("`cloud_only` is True but cloud data access is not enabled. "
+                                  "Falling back to MAST download.", InputWarning)
+                status, msg, url = self.download_file(mast_uri, local_path=local_path, cache=cache,
+                                                      cloud_only=False, force_on_prem=True, verbose=verbose)
 
-        return Table(rows=manifest_rows, names=('Local Path', 'Status', 'Message', 'URL'))
+        return status, msg, url
 
     def _download_curl_script(self, products, out_dir, verbose=True):
         """
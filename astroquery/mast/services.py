@@ -20,7 +20,7 @@ from ..utils import async_to_sync
 from ..utils.class_or_instance import class_or_instance
 from ..exceptions import BlankResponseWarning, InvalidQueryError, TimeoutError, NoResultsWarning
 
-from . import conf
+from . import conf, utils
 
 
 __all__ = ["ServiceAPI"]
@@ -49,10 +49,15 @@ def _json_to_table(json_obj, data_key='data'):
     # determine database type key in case missing
     type_key = 'type' if json_obj['info'][0].get('type') else 'db_type'
 
+    # rows are either data arrays, indexed by column position, or dictionaries indexed by column name
+    rows = json_obj[data_key]
+    by_name = len(rows) > 0 and isinstance(rows[0], dict)
+
     # for each item in info, store the type and column name
     # for each item in info, type has to be converted from DB data types (SQL server in most cases)
     # from missions_mast search service such as varchar, integer, float, boolean etc
     # to corresponding numpy type
+    col_specs = []
     for idx, col in enumerate(json_obj['info']):
 
         # get column name and type
@@ -79,18 +84,17 @@ def _json_to_table(json_obj, data_key='data'):
             col_type = np.float64
             ignore_value = -999
 
-        # Make the column list (don't assign final type yet or there will be errors)
-        try:
-            # Step through data array of values
-            col_data = np.array([x[idx] for x in json_obj[data_key]], dtype=object)
-        except KeyError:
-            # it's not a data array, fall back to using column name as it is array of dictionaries
-            try:
-                col_data = np.array([x[col_name] for x in json_obj[data_key]], dtype=object)
-            except KeyError:
-                # Skip column names not found in data
-                log.debug('Column %s was not found in data. Skipping...', col_name)
-                continue
+        col_specs.append((col_name if by_name else idx, col_name, col_type, ignore_value))
+
+    # Make the column arrays in one pass over the rows (don't assign final type yet or there will be errors)
+    columns = utils._json_rows_to_columns(rows, [spec[0] for spec in col_specs])
+
+    for key, col_name, col_type, ignore_value in col_specs:
+        col_data = columns.get(key)
+        if col_data is None:
+            # Skip column names not found in data
+            log.debug('Column %s was not found in data. Skipping...', col_name)
+            continue
         if ignore_value is not None:
             col_data[np.where(np.equal(col_data, None))] = ignore_value
 
@@ -263,7 +267,7 @@ class ServiceAPI(BaseQuery):
         response : `~astropy.table.Table`
         """
 
-        result = response.json()
+        result = utils._parse_json(response)
         result_table = _json_to_table(result, data_key=data_key)
 
         # Check for no results
@@ -20,6 +20,7 @@ from requests import HTTPError, Response
 from astroquery.mast import (Catalogs, MastMissions, Observations, Tesscut, Zcut, Mast, utils, services,
                              discovery_portal, auth, core, cloud)
 from astroquery.mast.cloud import CloudAccess
+from astroquery.query import BaseQuery
 from astroquery.utils.mocks import MockResponse
 from astroquery.exceptions import (BlankResponseWarning, InvalidQueryError, InputWarning, MaxResultsWarning,
                                    NoResultsWarning, RemoteServiceError, ResolverError)
@@ -69,6 +70,10 @@ DATA_FILES = {'Mast.Caom.Cone': 'caom.json',
               'z_survey': 'zcut_survey.json'}
 
 
+# The Portal paging logic is tested against a mocked BaseQuery._request
+portal_request = discovery_portal.PortalAPI._request
+
+
 def data_path(filename):
     data_dir = os.path.join(os.path.dirname(__file__), 'data')
     return os.path.join(data_dir, filename)
@@ -644,6 +649,29 @@ def test_missions_download_products(tmp_path):
         MastMissions.download_products(json_file, download_dir=tmp_path)
 
 
+@pytest.mark.parametrize("download_workers", [1, 3])
+def test_missions_download_products_resumable(patch_post, tmp_path, download_workers):
+    def write_file(self, url, local_filepath, **kwargs):
+        Path(local_filepath).write_bytes(b'data')
+
+    def fail(self, url, local_filepath, **kwargs):
+        raise AssertionError(f'{url} should not be downloaded again')
+
+    patch_post.setattr(core.MastQueryWithLogin, '_download_file', write_file)
+    with core.conf.set_temp('download_workers', download_workers), core.conf.set_temp('download_manifest', True):
+        result = MastMissions.download_products('Z14Z0104T', download_dir=tmp_path)
+        assert len(result) > 1
+        assert all(result['Status'] == 'COMPLETE')
+        assert all(Path(local_path).is_file() for local_path in result['Local Path'])
+        assert not list(tmp_path.glob('**/*.part'))
+
+        # The files recorded in the manifest are not downloaded again
+        patch_post.setattr(core.MastQueryWithLogin, '_download_file', fail)
+        rerun = MastMissions.download_products('Z14Z0104T', download_dir=tmp_path)
+        assert list(rerun['Local Path']) == list(result['Local Path'])
+        assert all(rerun['Status'] == 'COMPLETE')
+
+
 @patch.object(Path, 'is_file', return_value=True)
 def test_missions_download_file(mock_is_file, tmp_path):
     # JWST download
@@ -903,6 +931,39 @@ def test_session_info():
     assert info['ezid'] == 'alice'
 
 
+@pytest.mark.parametrize("page_workers", [1, 3])
+def test_portal_paging(patch_post, page_workers):
+    total_pages = 5
+    requested_pages = []
+
+    def page_mockreturn(self, method, url, data=None, **kwargs):
+        page = int(re.search(r"page%22%3A%20(\d+)%2C", data).group(1))
+        requested_pages.append(page)
+        result = {'status': 'COMPLETE', 'data': [{'page': page}],
+                  'paging': {'page': page, 'pagesFiltered': total_pages}}
+        return MockResponse(json.dumps(result).encode())
+
+    patch_post.setattr(discovery_portal.PortalAPI, '_request', portal_request)
+    patch_post.setattr(BaseQuery, '_request', page_mockreturn)
+
+    portal = discovery_portal.PortalAPI()
+    data = discovery_portal._prepare_service_request_string({'service': 'Mast.Caom.Cone', 'params': {},
+                                                             'format': 'json', 'pagesize': 1, 'page': 1})
+    with discovery_portal.conf.set_temp('page_workers', page_workers):
+        responses = portal._request("POST", "https://mast.stsci.edu/api/v0/invoke", data=data)
+
+    assert sorted(requested_pages) == [1, 2, 3, 4, 5]
+    # pages are returned in order whatever the order of completion
+    assert [resp.json()['data'][0]['page'] for resp in responses] == [1, 2, 3, 4, 5]
+
+    # only the requested page
+    requested_pages.clear()
+    with discovery_portal.conf.set_temp('page_workers', page_workers):
+        responses = portal._request("POST", "https://mast.stsci.edu/api/v0/invoke", data=data,
+                                    retrieve_all=False)
+    assert requested_pages == [1]
+
+
 ###########################
 # ObservationsClass tests #
 ###########################
@@ -1860,6 +1921,65 @@ def test_parse_input_location():
         assert isinstance(loc, SkyCoord)
 
 
+def test_json_rows_to_columns():
+    # Rows as dictionaries, with a key missing from one row
+    rows = [{'a': 1, 'b': 'x'}, {'a': 2}]
+    columns = utils._json_rows_to_columns(rows, ['a', 'b'], defaults=[None, ''])
+    assert list(columns['a']) == [1, 2]
+    assert list(columns['b']) == ['x', '']
+
+    # Rows as lists, columns missing from every row are left out
+    rows = [[1, 'x'], [2, 'y']]
+    columns = utils._json_rows_to_columns(rows, [0, 1, 2])
+    assert list(columns[1]) == ['x', 'y']
+    assert 2 not in columns
+
+
+def test_retry_transient(monkeypatch):
+    monkeypatch.setattr(utils.time, 'sleep', lambda delay: None)
+    server_error = Response()
+    server_error.status_code = 503
+    calls = []
+
+    def flaky(value):
+        calls.append(value)
+        if len(calls) < 3:
+            raise HTTPError(response=server_error)
+        return value
+
+    assert utils._retry_transient(flaky, 'ok', retries=2) == 'ok'
+    assert len(calls) == 3
+
+    # Client errors are not retried
+    calls.clear()
+    server_error.status_code = 404
+    with pytest.raises(HTTPError):
+        utils._retry_transient(flaky, 'ok', retries=2)
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("batch_workers", [1, 3])
+def test_batched_request(monkeypatch, batch_workers):
+    monkeypatch.setattr(utils.time, 'sleep', lambda delay: None)
+    server_error = Response()
+    server_error.status_code = 503
+    calls = []
+
+    def request_func(params):
+        calls.append(params['ids'])
+        if params['ids'] == [4, 5] and calls.count([4, 5]) == 1:
+            raise HTTPError(response=server_error)
+        return MockResponse(json.dumps(params['ids']).encode())
+
+    with utils.conf.set_temp('batch_workers', batch_workers), utils.conf.set_temp('batch_retries', 1):
+        results = utils._batched_request(list(range(7)), {}, 2, 'ids', request_func,
+                                         extract_func=lambda r: r.json())
+
+    # Results are in order and only the failed batch was requested twice
+    assert results == list(range(7))
+    assert sorted(calls) == [[0, 1], [2, 3], [4, 5], [4, 5], [6]]
+
+
 def test_json_to_table_fallback_type_coercion():
     json_obj = {'info': [{'name': 'test_int', 'type': 'int'}],
                 'data': [['1'], ['2'], ['not_an_int'], ['3'], [-999]]}
@@ -6,9 +6,16 @@ MAST Utils
 Miscellaneous functions used throughout the MAST module.
 """
 
+import json
+import os
 import platform
 import re
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from pathlib import Path
 
 import numpy as np
 import requests
@@ -20,9 +27,17 @@ from astropy.utils.console import ProgressBarOrSpinner
 from astropy.utils.decorators import deprecated_renamed_argument
 
 from .. import log
+from ..cache import resolve_names
 from ..exceptions import (InputWarning, InvalidQueryError, NoResultsWarning, ResolverError)
 from ..utils import commons
 from ..version import version
+from . import conf
+
+try:
+    # Optional faster JSON decoder
+    import orjson
+except ImportError:
+    orjson = None
 
 __all__ = []
 
@@ -72,6 +87,76 @@ def parse_type(dbtype):
     }.get(dbtype, (dbtype, dbtype, dbtype))
 
 
+def _parse_json(response):
+    """
+    Decodes the JSON body of a response, with ``orjson`` if it is installed.
+
+    The decoded object is kept on the response so that it is decoded only once.
+    """
+    result = getattr(response, '_parsed_json', None)
+    if result is None:
+        if orjson is not None:
+            try:
+                result = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # e.g. NaN values, which are not strict JSON
+                pass
+        if result is None:
+            result = response.json()
+        response._parsed_json = result
+    return result
+
+
+def _json_rows_to_columns(rows, keys, *, defaults=None):
+    """
+    Transposes row-major JSON data into one object array per column.
+
+    All the columns are extracted in a single pass over the rows instead of
+    one pass per column.
+
+    Parameters
+    ----------
+    rows : list of lists or list of dicts
+        The data rows.
+    keys : list
+        The index (list rows) or name (dict rows) of each column to extract.
+    defaults : list, optional
+        For dict rows, the value of each column in the rows where it is missing.
+        If not given, columns missing from any row are left out of the result.
+
+    Returns
+    -------
+    response : dict
+        Dictionary of ``key: numpy object array``.
+    """
+    if not keys:
+        return {}
+    try:
+        values = list(map(itemgetter(*keys), rows))
+        if len(keys) == 1:
+            values = [(value,) for value in values]
+        table = np.empty((len(values), len(keys)), dtype=object)
+        table[:] = values
+        return {key: table[:, i] for i, key in enumerate(keys)}
+    except (KeyError, IndexError, TypeError, ValueError):
+        # Some rows lack some of the keys, or hold nested values:
+        # fall back to one column at a time
+        pass
+
+    columns = {}
+    for i, key in enumerate(keys):
+        try:
+            if defaults is None:
+                column = [row[key] for row in rows]
+            else:
+                column = [row.get(key, defaults[i]) for row in rows]
+        except (KeyError, IndexError, TypeError):
+            continue
+        columns[key] = np.empty(len(column), dtype=object)
+        columns[key][:] = column
+    return columns
+
+
 def _simple_request(url, params=None):
     """
     Light wrapper on requests.session().get basically to make monkey patched testing easier/more effective.
@@ -122,31 +207,46 @@ def _batched_request(
     -------
     results : list
         List of results extracted from the responses.
+
+    Notes
+    -----
+    The batches are requested ``conf.batch_workers`` at a time, and the results are
+    returned in the order of ``items`` regardless. A batch failing with a connection
+    error, a timeout or a server error is retried on its own ``conf.batch_retries``
+    times, without requesting the other batches again.
     """
+    def fetch(chunk):
+        def request():
+            resp = request_func({**params, param_key: chunk})
+            resp.raise_for_status()
+            return resp
+
+        resp = _retry_transient(request, retries=conf.batch_retries)
+        return extract_func(resp)
+
     if len(items) > max_batch:
         chunks = list(split_list_into_chunks(items, max_batch))
         results = []
-        with ProgressBarOrSpinner(len(items), f"{desc} in {len(chunks)} batches ...") as pb:
-            fetched = 0
-            pb.update(0)
-            for chunk in chunks:
-                params[param_key] = chunk
-                resp = request_func(params)
-                resp.raise_for_status()
-
-                # Extend results with new response
-                new_resp = extract_func(resp)
-                results.extend(new_resp)
-
-                # Update progress bar
-                fetched += len(chunk)
-                pb.update(fetched)
+        executor = ThreadPoolExecutor(max_workers=conf.batch_workers) if conf.batch_workers > 1 else None
+        try:
+            responses = executor.map(fetch, chunks) if executor else map(fetch, chunks)
+            with ProgressBarOrSpinner(len(items), f"{desc} in {len(chunks)} batches ...") as pb:
+                fetched = 0
+                pb.update(0)
+                for chunk, new_resp in zip(chunks, responses):
+                    # Extend results with new response
+                    results.extend(new_resp)
+
+                    # Update progress bar
+                    fetched += len(chunk)
+                    pb.update(fetched)
+        finally:
+            if executor:
+                # Don't start the remaining batches if one of them failed
+                executor.shutdown(cancel_futures=True)
         return results
     else:
-        params[param_key] = items
-        resp = request_func(params)
-        resp.raise_for_status()
-        return extract_func(resp)
+        return fetch(items)
 
 
 @deprecated_renamed_argument('objectname', 'object_name', since='0.4.12')
@@ -225,76 +325,85 @@ def resolve_object(object_name, *, resolver=None, resolve_all=False, batch_size=
                     catalog = name
                     break
 
-    # Send request to STScI Archive Name Translation Application (SANTA)
-    params = {'outputFormat': 'json', 'resolveAll': resolve_all}  # Always set resolveAll to True for MAST catalogs
-    if resolver and not params['resolveAll']:
-        params['resolver'] = [resolver, catalog] if is_catalog else [resolver]
-
-    # Fetch results (batching if necessary)
-    results = _batched_request(
-        object_names,
-        params,
-        max_batch=batch_size,
-        param_key="name",
-        request_func=lambda p: _simple_request("http://mastresolver.stsci.edu/Santa-war/query", p),
-        extract_func=lambda r: r.json().get("resolvedCoordinate") or [],
-        desc=f"Resolving {len(object_names)} object names")
-
-    resolved_coords = {}
-    for object in object_names:
-        obj_results = [res for res in results if res.get('searchString') == object.lower()]
-        # If a resolver is specified and resolve_all is False, find and return the result for that resolver
-        if resolver and not resolve_all:
-            resolver_result = next((res for res in obj_results if res.get('resolver') == resolver), None)
-            if not resolver_result:
-                msg = (f'Could not resolve "{object}" to a sky position using resolver "{resolver}". '
-                       'Please try another resolver or set `resolver=None` to use the first '
-                       'compatible resolver.')
+    def _resolve(names):
+        """Resolves ``names`` with SANTA."""
+        # Send request to STScI Archive Name Translation Application (SANTA)
+        params = {'outputFormat': 'json', 'resolveAll': resolve_all}  # Always set resolveAll to True for MAST catalogs
+        if resolver and not params['resolveAll']:
+            params['resolver'] = [resolver, catalog] if is_catalog else [resolver]
+
+        # Fetch results (batching if necessary)
+        results = _batched_request(
+            names,
+            params,
+            max_batch=batch_size,
+            param_key="name",
+            request_func=lambda p: _simple_request("http://mastresolver.stsci.edu/Santa-war/query", p),
+            extract_func=lambda r: r.json().get("resolvedCoordinate") or [],
+            desc=f"Resolving {len(names)} object names")
+
+        resolved_coords = {}
+        for object in names:
+            obj_results = [res for res in results if res.get('searchString') == object.lower()]
+            # If a resolver is specified and resolve_all is False, find and return the result for that resolver
+            if resolver and not resolve_all:
+                resolver_result = next((res for res in obj_results if res.get('resolver') == resolver), None)
+                if not resolver_result:
+                    msg = (f'Could not resolve "{object}" to a sky position using resolver "{resolver}". '
+                           'Please try another resolver or set `resolver=None` to use the first '
+                           'compatible resolver.')
+                    if single:
+                        raise ResolverError(msg)
+                    else:
+                        warnings.warn(msg, InputWarning)
+                        continue
+                resolver_coord = SkyCoord(resolver_result['ra'], resolver_result['decl'], unit='deg')
+
+                # If object belongs to a MAST catalog, check the separation between the coordinates from the
+                # resolver and the catalog
+                if is_catalog:
+                    catalog_result = next((res for res in obj_results if res.get('resolver') == catalog), None)
+                    if catalog_result:
+                        catalog_coord = SkyCoord(catalog_result['ra'], catalog_result['decl'], unit='deg')
+                        if resolver_coord.separation(catalog_coord) > 1 * u.arcsec:
+                            # Warn user if the coordinates differ by more than 1 arcsec
+                            warnings.warn(f'Resolver {resolver} returned coordinates that differ from MAST '
+                                          f'{catalog} catalog by more than 1 arcsec. ', InputWarning)
+
+                log.debug(f'Coordinates resolved using {resolver}: {resolver_coord}')
+                resolved_coords[object] = resolver_coord
+                continue
+
+            if not obj_results:
+                msg = f'Could not resolve "{object}" to a sky position.'
                 if single:
                     raise ResolverError(msg)
                 else:
                     warnings.warn(msg, InputWarning)
                     continue
-            resolver_coord = SkyCoord(resolver_result['ra'], resolver_result['decl'], unit='deg')
-
-            # If object belongs to a MAST catalog, check the separation between the coordinates from the
-            # resolver and the catalog
-            if is_catalog:
-                catalog_result = next((res for res in obj_results if res.get('resolver') == catalog), None)
-                if catalog_result:
-                    catalog_coord = SkyCoord(catalog_result['ra'], catalog_result['decl'], unit='deg')
-                    if resolver_coord.separation(catalog_coord) > 1 * u.arcsec:
-                        # Warn user if the coordinates differ by more than 1 arcsec
-                        warnings.warn(f'Resolver {resolver} returned coordinates that differ from MAST '
-                                      f'{catalog} catalog by more than 1 arcsec. ', InputWarning)
-
-            log.debug(f'Coordinates resolved using {resolver}: {resolver_coord}')
-            resolved_coords[object] = resolver_coord
-            continue
 
-        if not obj_results:
-            msg = f'Could not resolve "{object}" to a sky position.'
-            if single:
-                raise ResolverError(msg)
-            else:
-                warnings.warn(msg, InputWarning)
+            # Return results for all compatible resolvers
+            if resolve_all:
+                # Return results for all compatible resolvers
+                coords = {
+                    res['resolver']: SkyCoord(res['ra'], res['decl'], unit='deg')
+                    for res in obj_results
+                }
+                resolved_coords[object] = coords
                 continue
 
-        # Return results for all compatible resolvers
-        if resolve_all:
-            # Return results for all compatible resolvers
-            coords = {
-                res['resolver']: SkyCoord(res['ra'], res['decl'], unit='deg')
-                for res in obj_results
-            }
-            resolved_coords[object] = coords
-            continue
+            # Case when resolve_all is False and no resolver is specified
+            # SANTA returns result from first compatible resolver
+            coord = SkyCoord(obj_results[0]['ra'], obj_results[0]['decl'], unit='deg')
+            log.debug(f'Coordinates resolved using {obj_results[0]["resolver"]}: {coord}')
+            resolved_coords[object] = coord
+        return resolved_coords
 
-        # Case when resolve_all is False and no resolver is specified
-        # SANTA returns result from first compatible resolver
-        coord = SkyCoord(obj_results[0]['ra'], obj_results[0]['decl'], unit='deg')
-        log.debug(f'Coordinates resolved using {obj_results[0]["resolver"]}: {coord}')
-        resolved_coords[object] = coord
+    if resolve_all:
+        resolved_coords = _resolve(object_names)
+    else:
+        # Positions from a single resolver are kept in the shared name resolution cache, if enabled
+        resolved_coords = resolve_names(object_names, _resolve, resolver=f'mast:{resolver or "default"}')
 
     # If no objects could be resolved, raise an error
     if not resolved_coords:
@@ -425,6 +534,143 @@ def get_cloud_paths(mast_uri, *, verbose=True):
     return cloud_paths
 
 
+def _retry_transient(func, *args, retries=0, backoff=1.0, **kwargs):
+    """
+    Calls ``func``, retrying it after connection errors, timeouts and server (5xx) errors.
+
+    Parameters
+    ----------
+    func : callable
+        The function to call with ``*args`` and ``**kwargs``.
+    retries : int, optional
+        Default 0. Number of times the call is retried before the error is raised.
+    backoff : float, optional
+        Default 1. Delay in seconds before the first retry, doubled for each following retry.
+
+    Returns
+    -------
+    response : object
+        The return value of ``func``.
+    """
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                requests.exceptions.ChunkedEncodingError, requests.exceptions.HTTPError) as ex:
+            if isinstance(ex, requests.exceptions.HTTPError):
+                if ex.response is None or ex.response.status_code < 500:
+                    raise
+            if attempt >= retries:
+                raise
+            delay = backoff * 2 ** attempt
+            attempt += 1
+            log.info(f"{ex}. Retrying in {delay} s (attempt {attempt} of {retries}).")
+            time.sleep(delay)
+
+
+class _DownloadManifest:
+    """
+    Record of the files completely downloaded into a directory.
+
+    The record is appended to a JSON lines file in the directory, so that an
+    interrupted bulk download can be restarted without contacting the server
+    about the files it already completed.
+
+    Parameters
+    ----------
+    directory : str or `~pathlib.Path`
+        The download directory.
+    """
+
+    filename = '.mast_download_manifest.jsonl'
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.path = self.directory / self.filename
+        self._lock = threading.Lock()
+        self._sizes = {}
+        if self.path.is_file():
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # e.g. the last line of an interrupted run
+                        continue
+                    self._sizes[entry['path']] = entry['size']
+
+    def _key(self, local_path):
+        return os.path.relpath(local_path, self.directory)
+
+    def is_complete(self, local_path):
+        """Whether ``local_path`` was recorded as complete and still has the recorded size."""
+        size = self._sizes.get(self._key(local_path))
+        if size is None:
+            return False
+        try:
+            return os.stat(local_path).st_size == size
+        except OSError:
+            return False
+
+    def record(self, local_path):
+        """Records ``local_path`` as completely downloaded."""
+        try:
+            size = os.stat(local_path).st_size
+        except OSError:
+            return
+        key = self._key(local_path)
+        with self._lock:
+            self._sizes[key] = size
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(json.dumps({'path': key, 'size': size}) + '\n')
+
+
+def _download_concurrently(download, jobs, *, workers=1, host_connections=None, manifest=None):
+    """
+    Runs a set of downloads, several at a time.
+
+    Parameters
+    ----------
+    download : callable
+        Function downloading a single file and returning its ``(status, msg, url)``.
+    jobs : iterable of tuples
+        ``(host, local_path, args)`` for each file, where ``download(*args)`` downloads
+        the file from ``host`` to ``local_path``.
+    workers : int, optional
+        Default 1. Maximum number of downloads running at once.
+    host_connections : int, optional
+        Maximum number of downloads running at once from the same host. Defaults to ``workers``.
+    manifest : `_DownloadManifest`, optional
+        If given, files recorded as complete are skipped and newly completed files are recorded.
+
+    Returns
+    -------
+    response : list
+        The ``(status, msg, url)`` of each job, in the order of the jobs.
+    """
+    jobs = list(jobs)
+    limits = {host: threading.BoundedSemaphore(host_connections or workers) for host, _, _ in jobs}
+
+    def run(job):
+        host, local_path, args = job
+        if manifest is not None and manifest.is_complete(local_path):
+            log.info(f"Found {local_path} in the download manifest, skipping download.")
+            return 'COMPLETE', None, None
+        with limits[host]:
+            result = download(*args)
+        if manifest is not None and result[0] == 'COMPLETE':
+            manifest.record(local_path)
+        return result
+
+    if workers <= 1 or len(jobs) <= 1:
+        return [run(job) for job in jobs]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, jobs))
+
+
 def remove_duplicate_products(data_products, uri_key):
     """
     Removes duplicate data products that have the same data URI.
@@ -2,7 +2,6 @@
 import abc
 import inspect
 import pickle
-import copy
 import getpass
 import hashlib
 import keyring
@@ -12,7 +11,6 @@ import platform
 import requests
 import textwrap
 
-from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
 from astropy.config import paths
@@ -24,6 +22,7 @@ from astropy.utils import deprecated
 import pyvo
 
 from astroquery import version, log, cache_conf
+from astroquery.cache import PickleCacheBackend, get_cache_backend, _copy_response
 from astroquery.utils import system_tools
 
 
@@ -33,21 +32,7 @@ __all__ = ['BaseVOQuery', 'BaseQuery', 'QueryWithLogin']
 def to_cache(original_response, cache_file):
     log.debug("Caching data to {0}".format(cache_file))
 
-    # Copying a TAPService instance with an auth session produces some warnings
-    # as a side affect. The hooks are not needed in the cache, so we remove
-    # them before caching and restore them afterwards.
-    # Related pyvo issue: https://github.com/astropy/pyvo/issues/755
-    hooks = None
-    if hasattr(original_response, 'request'):
-        hooks = original_response.request.hooks
-        del original_response.request.hooks
-    if hasattr(original_response, 'history'):
-        for r in original_response.history:
-            if hasattr(r, 'request'):
-                del r.request.hooks
-    response_copy = copy.deepcopy(original_response)
-    if hooks:
-        original_response.request.hooks = hooks
+    response_copy = _copy_response(original_response)
     with open(cache_file, "wb") as f:
         pickle.dump(response_copy, f, protocol=4)
 
@@ -125,27 +110,7 @@ class AstroQuery:
         return fn
 
     def from_cache(self, cache_location, cache_timeout):
-        request_file = self.request_file(cache_location)
-        try:
-            if cache_timeout == -1:
-                expired = False
-            else:
-                current_time = datetime.now(timezone.utc)
-                cache_time = datetime.fromtimestamp(request_file.stat().st_mtime, timezone.utc)
-                expired = current_time-cache_time > timedelta(seconds=cache_timeout)
-            if not expired:
-                with open(request_file, "rb") as f:
-                    response = pickle.load(f)
-                if not isinstance(response, requests.Response):
-                    response = None
-            else:
-                log.debug(f"Cache expired for {request_file}...")
-                response = None
-        except FileNotFoundError:
-            response = None
-        if response:
-            log.debug("Retrieved data from {0}".format(request_file))
-        return response
+        return PickleCacheBackend(cache_location).get(self.hash(), cache_timeout)
 
     def remove_cache_file(self, cache_location):
         """
@@ -238,6 +203,9 @@ class BaseQuery(metaclass=LoginABCMeta):
     is implemented as an abstract class and must not be directly instantiated.
     """
 
+    _cache_backend = None
+    _cache_max_size = None
+
     def __init__(self):
         self._session = requests.Session()
         self._session.hooks['response'].append(self._response_hook)
@@ -300,10 +268,47 @@ class BaseQuery(metaclass=LoginABCMeta):
         """Resets the cache location to the default astropy cache"""
         self._cache_location = None
 
-    def clear_cache(self):
-        """Removes all cache files."""
-        for fle in self.cache_location.glob("*.pickle"):
-            fle.unlink()
+    @property
+    def cache_max_size(self):
+        """
+        Maximum size of this service's cache in bytes, 0 means unlimited.
+        Defaults to the astroquery-wide ``cache_conf.cache_max_size``.
+        """
+        if self._cache_max_size is None:
+            return cache_conf.cache_max_size
+        return self._cache_max_size
+
+    @cache_max_size.setter
+    def cache_max_size(self, max_size):
+        self._cache_max_size = max_size
+
+    @property
+    def cache_backend(self):
+        """
+        The `~astroquery.cache.CacheBackend` storing the responses cached in
+        `cache_location`, as selected by ``cache_conf.cache_backend``.
+        """
+        location = self.cache_location
+        backend = self._cache_backend
+        if (backend is None or backend.location != location
+                or backend.name != cache_conf.cache_backend):
+            backend = get_cache_backend(cache_conf.cache_backend)(location)
+            self._cache_backend = backend
+        backend.max_size = self.cache_max_size
+        return backend
+
+    def clear_cache(self, *, url=None, older_than=None):
+        """
+        Removes cached responses, by default all of them.
+
+        Parameters
+        ----------
+        url : str, optional
+            Only remove responses whose URL starts with this prefix.
+        older_than : float, optional
+            Only remove responses cached more than this many seconds ago.
+        """
+        self.cache_backend.invalidate(url=url, older_than=older_than)
 
     def _request(self, method, url,
                  params=None, data=None, headers=None,
@@ -398,7 +403,8 @@ class BaseQuery(metaclass=LoginABCMeta):
                                              allow_redirects=allow_redirects,
                                              json=json)
             else:
-                response = query.from_cache(self.cache_location, cache_conf.cache_timeout)
+                cache_backend = self.cache_backend
+                response = cache_backend.get(query.hash(), cache_conf.cache_timeout)
                 if not response:
                     response = query.request(self._session,
                                              self.cache_location,
@@ -407,7 +413,7 @@ class BaseQuery(metaclass=LoginABCMeta):
                                              allow_redirects=allow_redirects,
                                              verify=verify,
                                              json=json)
-                    to_cache(response, query.request_file(self.cache_location))
+                    cache_backend.set(query.hash(), response)
 
             self._last_query = query
             return response
@@ -481,15 +487,16 @@ class BaseQuery(metaclass=LoginABCMeta):
                 # bytes are indexed from 0:
                 # https://en.wikipedia.org/wiki/List_of_HTTP_header_fields#range-request-header
                 end = "{0}".format(length-1) if length is not None else ""
-                self._session.headers['Range'] = "bytes={0}-{1}".format(existing_file_length,
-                                                                        end)
-                log.debug(f"Continuing with range={self._session.headers['Range']}")
+                # The Range header is passed with this request only rather than
+                # set on the session, which may be shared by concurrent downloads
+                headers = dict(kwargs.pop('headers', None) or {})
+                headers['Range'] = "bytes={0}-{1}".format(existing_file_length, end)
+                log.debug(f"Continuing with range={headers['Range']}")
 
                 response = self._session.request(method, url,
                                                  timeout=timeout, stream=True,
-                                                 auth=auth, **kwargs)
+                                                 auth=auth, headers=headers, **kwargs)
                 response.raise_for_status()
-                del self._session.headers['Range']
 
         elif cache and os.path.exists(local_filepath):
             if length is not None:
@@ -6,9 +6,11 @@ from time import mktime
 from datetime import datetime
 
 from astropy.config import paths
+from astropy.coordinates import SkyCoord
 
 from astroquery.query import QueryWithLogin
 from astroquery import cache_conf
+from astroquery.cache import NameResolutionCache, get_name_resolution_cache, resolve_names
 
 URL1 = "http://fakeurl.edu"
 URL2 = "http://fakeurl.ac.uk"
@@ -212,3 +214,126 @@ def test_deactivate_with_set_temp(changing_mocked_response):
         assert len(os.listdir(mytest.cache_location)) == 0
 
     assert cache_conf.cache_active is True
+
+
+@pytest.fixture
+def sqlite_backend():
+    with cache_conf.set_temp("cache_backend", "sqlite"):
+        yield
+
+
+def test_sqlite_caching(changing_mocked_response, sqlite_backend, tmp_path):
+    mytest = CacheTestClass()
+    mytest.cache_location = tmp_path
+    assert mytest.cache_backend.name == "sqlite"
+
+    resp = mytest.test_func(URL1)
+    assert resp.content == TEXT1
+    resp = mytest.test_func(URL2)
+    assert resp.content == TEXT2
+    resp = mytest.test_func(URL1)
+    assert resp.content == TEXT1  # query that was cached
+
+    # All responses live in a single database file
+    assert os.listdir(mytest.cache_location) == ["cache.sqlite"]
+    stats = mytest.cache_backend.stats()
+    assert stats["entries"] == 2
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+    mytest.clear_cache()
+    assert mytest.cache_backend.stats()["entries"] == 0
+
+    resp = mytest.test_func(URL1)
+    assert resp.content == TEXT2  # Now get new response
+
+
+def test_sqlite_timeout(changing_mocked_response, sqlite_backend, tmp_path):
+    mytest = CacheTestClass()
+    mytest.cache_location = tmp_path
+
+    assert mytest.test_func(URL1).content == TEXT1
+    assert mytest.test_func(URL1).content == TEXT1
+
+    with cache_conf.set_temp("cache_timeout", 0):
+        assert mytest.test_func(URL1).content == TEXT2
+
+
+@pytest.mark.parametrize("backend", ["pickle", "sqlite"])
+def test_max_size(changing_mocked_response, tmp_path, backend):
+    with cache_conf.set_temp("cache_backend", backend):
+        mytest = CacheTestClass()
+        mytest.cache_location = tmp_path
+
+        mytest.test_func(URL1)
+        entry_size = mytest.cache_backend.stats()["size"]
+        mytest.cache_max_size = entry_size + 1
+
+        mytest.test_func(URL2)
+        stats = mytest.cache_backend.stats()
+        assert stats["entries"] == 1
+        assert stats["size"] <= mytest.cache_max_size
+
+        # The oldest entry has been evicted
+        assert mytest.test_func(URL1).content == TEXT2
+
+
+@pytest.mark.parametrize("backend", ["pickle", "sqlite"])
+def test_invalidate_by_url(changing_mocked_response, tmp_path, backend):
+    with cache_conf.set_temp("cache_backend", backend):
+        mytest = CacheTestClass()
+        mytest.cache_location = tmp_path
+        for key, url in (("key1", URL1), ("key2", URL2)):
+            response = _create_response(url)
+            response.url = url
+            mytest.cache_backend.set(key, response)
+
+        mytest.clear_cache(url="http://fakeurl.ac")
+        assert mytest.cache_backend.get("key1", -1).content == URL1
+        assert mytest.cache_backend.get("key2", -1) is None
+
+        mytest.clear_cache(older_than=3600)
+        assert mytest.cache_backend.stats()["entries"] == 1
+
+
+def test_unknown_backend():
+    mytest = CacheTestClass()
+    with cache_conf.set_temp("cache_backend", "nope"):
+        with pytest.raises(ValueError, match="Unknown cache backend"):
+            mytest.cache_backend
+
+
+def test_name_resolution_cache(tmp_path):
+    name_cache = NameResolutionCache(tmp_path)
+    resolved = []
+
+    def resolve(names):
+        resolved.extend(names)
+        return {name: SkyCoord(10, 20, unit="deg") for name in names if name != "nowhere"}
+
+    coords = name_cache.resolve(["M1", "nowhere"], resolve, resolver="test")
+    assert list(coords) == ["M1"]
+    assert coords["M1"].ra.deg == pytest.approx(10)
+
+    # Only the names missing from the cache are resolved again
+    coords = name_cache.resolve(["m1 ", "M2", "nowhere"], resolve, resolver="test")
+    assert list(coords) == ["m1 ", "M2"]
+    assert resolved == ["M1", "nowhere", "M2", "nowhere"]
+
+    # Positions are cached per resolver
+    assert name_cache.get_many(["M1"], resolver="other") == {}
+    assert name_cache.get_many(["M1"], resolver="test", cache_timeout=-1)
+    assert name_cache.stats()["entries"] == 2
+    assert name_cache.stats()["hits"] == 2
+
+    # Expired positions are not returned
+    with cache_conf.set_temp("cache_timeout", 0):
+        assert name_cache.get_many(["M1"], resolver="test") == {}
+
+    assert name_cache.clear(resolver="test") == 2
+
+
+def test_resolve_names_disabled():
+    assert cache_conf.name_resolution_cache is False
+    assert get_name_resolution_cache() is None
+    assert resolve_names(["M1"], lambda names: {"M1": None}) == {"M1": None}
@@ -144,8 +144,8 @@ def patch_get(monkeypatch, mock_response, mock_head_response):
             return response
 
         response = EnhancedMockResponse(TEST_FILE_CONTENT)
-        # Copy any headers from the session
-        for key, value in self.headers.items():
+        # Copy any headers from the session and the request
+        for key, value in {**self.headers, **(kwargs.get('headers') or {})}.items():
             response.headers[key] = value
         return response
 
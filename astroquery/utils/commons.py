@@ -19,6 +19,7 @@ from astropy.io import fits, votable
 
 from astropy.coordinates import BaseCoordinateFrame, SkyCoord
 
+from ..cache import resolve_names
 from ..exceptions import TimeoutError, InputWarning
 
 
@@ -40,6 +41,17 @@ ASTROPY_LT_6_0 = not minversion('astropy', '6.0')
 ASTROPY_LT_7_1_1 = not minversion('astropy', '7.1.1')
 
 
+def _resolve_name(name):
+    """
+    Resolve ``name`` with `~astropy.coordinates.SkyCoord.from_name`, through
+    the shared name resolution cache if it is enabled.
+    """
+    def from_name(names):
+        return {name: SkyCoord.from_name(name, frame="icrs") for name in names}
+
+    return resolve_names([name], from_name, resolver='sesame')[name]
+
+
 def parse_coordinates(coordinates, *, return_frame=None):
     """
     Takes a string or astropy.coordinates object. Checks if the
@@ -85,9 +97,9 @@ def parse_coordinates(coordinates, *, return_frame=None):
                                   "ICRS coordinate provided in degrees.", InputWarning)
 
                 except ValueError:
-                    c = SkyCoord.from_name(coordinates, frame="icrs")
+                    c = _resolve_name(coordinates)
             else:
-                c = SkyCoord.from_name(coordinates, frame="icrs")
+                c = _resolve_name(coordinates)
 
     elif isinstance(coordinates, CoordClasses):
         if hasattr(coordinates, 'frame'):
@@ -263,11 +275,25 @@ class FileContainer:
     """
     A File Object container, meant to offer lazy access to downloaded FITS
     files.
+
+    Parameters
+    ----------
+    target : str
+        URL or path of the file.
+    memmap : bool, optional
+        Default False. Whether `get_fits` downloads the file to the astropy
+        cache and memory maps it, instead of reading it into memory. This
+        allows slicing large images without loading them entirely.
+    **kwargs
+        Passed to `~astropy.utils.data.get_readable_fileobj`.
     """
 
-    def __init__(self, target, **kwargs):
+    def __init__(self, target, *, memmap=False, **kwargs):
         kwargs.setdefault('cache', True)
         self._target = target
+        self._memmap = memmap
+        self._cache = kwargs['cache']
+        self._show_progress = kwargs.get('show_progress', True)
         self._timeout = kwargs.get('remote_timeout', aud.conf.remote_timeout)
         if (os.path.splitext(target)[1] == '.fits' and not
                 ('encoding' in kwargs and kwargs['encoding'] == 'binary')):
@@ -275,11 +301,27 @@ class FileContainer:
                           "likely.", InputWarning)
         self._readable_object = get_readable_fileobj(target, **kwargs)
 
-    def get_fits(self):
+    def get_fits(self, *, memmap=None):
         """
         Assuming the contained file is a FITS file, read it
         and return the file parsed as FITS HDUList
+
+        Parameters
+        ----------
+        memmap : bool, optional
+            Whether to memory map the file from the astropy cache rather than
+            read it into memory. Defaults to the ``memmap`` given to the container.
         """
+        if memmap is None:
+            memmap = self._memmap
+
+        if memmap:
+            local_path = self.get_local_path()
+            if os.path.getsize(local_path) == 0:
+                raise TypeError("The file retrieved was empty.")
+            self._fits = fits.open(local_path, memmap=True)
+            return self._fits
+
         filedata = self.get_string()
 
         if len(filedata) == 0:
@@ -289,6 +331,28 @@ class FileContainer:
 
         return self._fits
 
+    def get_local_path(self):
+        """
+        Download the file, to the astropy cache unless the container was
+        created with ``cache=False``, and return its local path.
+        """
+        if not hasattr(self, '_local_path'):
+            target = str(self._target)
+            if os.path.isfile(target):
+                self._local_path = target
+            else:
+                try:
+                    self._local_path = aud.download_file(target, cache=self._cache, timeout=self._timeout,
+                                                         show_progress=self._show_progress)
+                except URLError as e:
+                    if isinstance(e.reason, socket.timeout):
+                        raise TimeoutError("Query timed out, time elapsed {t}s".
+                                           format(t=self._timeout))
+                    else:
+                        raise e
+
+        return self._local_path
+
     def save_fits(self, savepath, *, link_cache='hard'):
         """
         Save a FITS file to savepath
@@ -303,10 +367,14 @@ class FileContainer:
             If the system is unable to create a hardlink, the file will be
             copied to the target location.
         """
-        self.get_fits()
-        target_key = str(self._target)
+        if self._memmap or hasattr(self, '_local_path'):
+            # The file is on disk already, there is no need to read it
+            target = self.get_local_path()
+        else:
+            self.get_fits()
+            target_key = str(self._target)
 
-        target = aud.download_file(target_key, cache=True, sources=[])
+            target = aud.download_file(target_key, cache=True, sources=[])
 
         if link_cache == 'hard':
             try:
@@ -0,0 +1,73 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Helpers to resolve many DataLink documents at once.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from astroquery import log
+
+__all__ = ['resolve_datalinks', 'check_datalink_errors']
+
+
+def resolve_datalinks(urls, fetch, *, workers=1):
+    """
+    Fetch and parse the DataLink documents at ``urls``.
+
+    Identical URLs are only fetched once, and up to ``workers`` documents are
+    fetched at the same time. A failure to fetch or parse one document does
+    not stop the others.
+
+    Parameters
+    ----------
+    urls : iterable of str
+        The URLs of the DataLink documents.
+    fetch : callable
+        Function fetching and parsing the document at the URL it is given.
+    workers : int, optional
+        Maximum number of documents fetched at the same time. Defaults to 1.
+
+    Returns
+    -------
+    results : list
+        The value returned by ``fetch`` for each of the ``urls``, in order,
+        or `None` where it failed.
+    errors : dict
+        The exception raised for each of the failed ``urls``, keyed by their
+        index.
+    """
+    urls = list(urls)
+    unique_urls = list(dict.fromkeys(urls))
+
+    def fetch_one(url):
+        try:
+            return fetch(url), None
+        except Exception as ex:
+            return None, ex
+
+    if workers > 1 and len(unique_urls) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            resolved = dict(zip(unique_urls, executor.map(fetch_one, unique_urls)))
+    else:
+        resolved = {url: fetch_one(url) for url in unique_urls}
+
+    results = []
+    errors = {}
+    for index, url in enumerate(urls):
+        result, error = resolved[url]
+        results.append(result)
+        if error is not None:
+            errors[index] = error
+    return results, errors
+
+
+def check_datalink_errors(errors, count):
+    """
+    Raise the first of the ``errors`` returned by `resolve_datalinks` if all
+    of the ``count`` documents failed, and log the failed ones otherwise.
+    """
+    if not errors:
+        return
+    if len(errors) == count:
+        raise next(iter(errors.values()))
+    for index, error in errors.items():
+        log.warning(f"DataLink request {index} failed: {error!r}")
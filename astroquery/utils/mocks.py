@@ -34,6 +34,9 @@ class MockResponse:
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
 
+    def close(self):
+        pass
+
     def iter_lines(self):
         content = self.content.split(b"\n")
         for line in content:
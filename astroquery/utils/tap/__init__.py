@@ -15,9 +15,50 @@ Created on 30 jun. 2016
 
 """
 
+from astropy import config as _config
+
+
+class Conf(_config.ConfigNamespace):
+    """
+    Configuration parameters for `astroquery.utils.tap`.
+    """
+    max_memory_size = _config.ConfigItem(
+        64 * 1024 * 1024,
+        "Maximum number of bytes of a TAP result kept in memory while it is "
+        "read; larger results are spooled to a temporary file and "
+        "decompressed while they are parsed.",
+        cfgtype='integer')
+
+    poll_interval = _config.ConfigItem(
+        0.5,
+        "Initial delay (seconds) between two phase requests while waiting for "
+        "an asynchronous job.",
+        cfgtype='float')
+
+    poll_backoff = _config.ConfigItem(
+        1.5,
+        "Factor by which the delay between two phase requests grows while an "
+        "asynchronous job runs.",
+        cfgtype='float')
+
+    max_poll_interval = _config.ConfigItem(
+        10.0,
+        "Maximum delay (seconds) between two phase requests while waiting for "
+        "an asynchronous job.",
+        cfgtype='float')
+
+    wait_time = _config.ConfigItem(
+        0,
+        "If not 0, UWS 1.1 WAIT time (seconds) sent with the phase requests, "
+        "so that servers supporting it hold them until the phase changes.",
+        cfgtype='integer')
+
+
+conf = Conf()
+
 from astroquery.utils.tap.core import Tap
 from astroquery.utils.tap.core import TapPlus
 from astroquery.utils.tap.model.taptable import TapTableMeta
 from astroquery.utils.tap.model.tapcolumn import TapColumn
 
-__all__ = ['Tap', 'TapPlus', 'TapTableMeta', 'TapColumn']
+__all__ = ['Tap', 'TapPlus', 'TapTableMeta', 'TapColumn', 'Conf', 'conf']
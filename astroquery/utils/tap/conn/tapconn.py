@@ -16,10 +16,12 @@ Created on 30 jun. 2016
 """
 
 import http.client as httplib
+import io
 import mimetypes
 import os
 import platform
 import requests
+import threading
 import time
 
 from astroquery import version
@@ -697,6 +699,20 @@ class TapConn:
     def __get_connection_secure(self, *, verbose=False):
         return self.__connectionHandler.get_connection_secure(verbose=verbose)
 
+    def get_pool_stats(self):
+        """Returns the connection pool usage counters
+
+        Returns
+        -------
+        A dictionary with, for each protocol ('http' and 'https'), the number
+        of open, busy, created and reused connections and of requests sent
+        """
+        return self.__connectionHandler.get_pool_stats()
+
+    def close(self):
+        """Closes the kept-alive connections"""
+        self.__connectionHandler.close()
+
     def encode_multipart(self, fields, files):
         """Encodes a multipart form request
 
@@ -741,11 +757,237 @@ class TapConn:
                f"\n\tPort: {self.__connPort}\n\tSSL Port: {self.__connPortSsl}"
 
 
+class _PooledConnectionMixin:
+    """Tracks whether a keep-alive connection can be handed out again
+
+    A connection is busy from the moment it is taken from the pool until
+    the response to its request has been completely read (or closed), as
+    http.client does not allow a new request before that. A thread asking
+    for a connection again without having read the last response it got on
+    it gives that response up: its body is then buffered in memory (see
+    `reclaim`), so that the socket can carry the next request.
+    """
+
+    # Only these requests are sent again when the server drops the socket
+    # before answering, as it may already have processed a POST (e.g.
+    # created a job)
+    _IDEMPOTENT_METHODS = ('GET', 'HEAD')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._checked_out = False
+        self._owner = None
+        self._last_response = None
+        self._last_request = None
+        self._reused = False
+        self.overflow = False
+        self.requests = 0
+
+    def checkout(self):
+        """Marks the connection as busy
+
+        Returns
+        -------
+        The last response received on the connection, to be passed to
+        `reclaim` before a new request is sent
+        """
+        previous = self._last_response
+        self._checked_out = True
+        self._owner = threading.get_ident()
+        self._last_response = None
+        return previous
+
+    def is_idle(self):
+        if not self._checked_out:
+            return True
+        return self._last_response is not None and self._last_response.isclosed()
+
+    def is_reclaimable(self):
+        """Whether the calling thread got the last, unread, response"""
+        return (self._checked_out and self._last_response is not None
+                and self._owner == threading.get_ident())
+
+    def reclaim(self, response):
+        """Frees the socket from a previous response
+
+        The remaining body of a response not completely read is buffered in
+        memory, so that it can still be read. A response closed before the
+        end of its body left data in the socket, which is then dropped.
+        """
+        if response is None:
+            return
+        if response.isclosed():
+            # a chunked body read to its end is not closed explicitly
+            if response.length or (response.chunked and response.closed):
+                self.close()
+            return
+        try:
+            data = response.read()
+        except Exception:
+            self.close()
+            return
+        response.fp = io.BytesIO(data)
+        response.length = len(data)
+        response.chunked = False
+        # http.client would otherwise wait for the buffered response to be
+        # read before accepting a new one
+        self._HTTPConnection__response = None
+
+    def _release(self):
+        self.close()
+        self._checked_out = False
+
+    def request(self, method, url, body=None, headers={}, **kwargs):
+        reused = self.requests > 0 and self.sock is not None
+        self._last_request = (method, url, body, headers, kwargs)
+        self.requests += 1
+        try:
+            super().request(method, url, body, headers, **kwargs)
+        except ConnectionError:
+            if not reused:
+                self._release()
+                raise
+            # the server dropped the idle keep-alive socket: reconnect
+            self.close()
+            try:
+                super().request(method, url, body, headers, **kwargs)
+            except Exception:
+                self._release()
+                raise
+        except Exception:
+            self._release()
+            raise
+        self._reused = reused
+
+    def getresponse(self):
+        try:
+            response = super().getresponse()
+        except ConnectionError:
+            method, url, body, headers, kwargs = self._last_request
+            if (not self._reused or method.upper() not in self._IDEMPOTENT_METHODS
+                    or not (body is None or isinstance(body, (str, bytes)))):
+                self._release()
+                raise
+            # the request was sent on a socket closed by the server
+            self.close()
+            try:
+                super().request(method, url, body, headers, **kwargs)
+                response = super().getresponse()
+            except Exception:
+                self._release()
+                raise
+        except Exception:
+            self._release()
+            raise
+        self._last_response = response
+        if self.overflow and self.sock is not None:
+            # not kept in the pool: the socket is closed along with the
+            # response
+            sock, self.sock = self.sock, None
+            sock.close()
+        return response
+
+
+class _PooledHTTPConnection(_PooledConnectionMixin, httplib.HTTPConnection):
+    pass
+
+
+class _PooledHTTPSConnection(_PooledConnectionMixin, httplib.HTTPSConnection):
+    pass
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of keep-alive connections to one host
+
+    Parameters
+    ----------
+    connection_class : class
+        `http.client.HTTPConnection` like class supporting the pooled
+        connection interface
+    host : str
+        host name
+    port : int
+        port
+    maxsize : int, optional, default 10
+        maximum number of connections kept open. When all of them are busy,
+        extra connections are created but closed once used.
+    """
+
+    def __init__(self, connection_class, host, port, *, maxsize=10):
+        self.connection_class = connection_class
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self.__lock = threading.Lock()
+        self.__connections = []
+        self.__created = 0
+        self.__reused = 0
+        self.__overflow = 0
+
+    def get_connection(self):
+        """Returns an idle connection, creating it if required
+
+        A busy connection whose last response was got, and not read, by the
+        calling thread is reused as well, once that response is buffered.
+        """
+        with self.__lock:
+            candidates = [conn for conn in self.__connections if conn.is_idle()]
+            if not candidates:
+                candidates = [conn for conn in self.__connections
+                              if conn.is_reclaimable()]
+            if candidates:
+                conn = candidates[0]
+                self.__reused += 1
+            else:
+                conn = self.connection_class(self.host, self.port)
+                self.__created += 1
+                if len(self.__connections) < self.maxsize:
+                    self.__connections.append(conn)
+                else:
+                    conn.overflow = True
+                    self.__overflow += 1
+            previous = conn.checkout()
+        conn.reclaim(previous)
+        return conn
+
+    def close(self):
+        """Closes all the pooled connections"""
+        with self.__lock:
+            for conn in self.__connections:
+                conn.close()
+            self.__connections = []
+
+    def get_stats(self):
+        """Returns a dictionary with the pool usage counters"""
+        with self.__lock:
+            busy = sum(1 for conn in self.__connections if not conn.is_idle())
+            return {'host': self.host,
+                    'port': self.port,
+                    'maxsize': self.maxsize,
+                    'connections': len(self.__connections),
+                    'busy': busy,
+                    'created': self.__created,
+                    'reused': self.__reused,
+                    'overflow': self.__overflow,
+                    'requests': sum(conn.requests for conn in self.__connections)}
+
+
 class ConnectionHandler:
-    def __init__(self, host, port, sslport):
+    """Creates the HTTP(s) connections of a TapConn
+
+    Connections are kept alive and reused through one `ConnectionPool` per
+    protocol, so that consecutive requests (e.g. job phase polling) do not
+    pay a new TCP/TLS handshake each time.
+    """
+
+    def __init__(self, host, port, sslport, *, pool_maxsize=10):
         self.__connHost = host
         self.__connPort = port
         self.__connPortSsl = sslport
+        self.__pool = ConnectionPool(_PooledHTTPConnection, host, port,
+                                     maxsize=pool_maxsize)
+        self.__poolSsl = ConnectionPool(_PooledHTTPSConnection, host, sslport,
+                                        maxsize=pool_maxsize)
 
     def get_connection(self, *, ishttps=False, cookie=None, verbose=False):
         if (ishttps) or (cookie is not None):
@@ -755,7 +997,17 @@ class ConnectionHandler:
         else:
             if verbose:
                 print("------>http")
-            return httplib.HTTPConnection(self.__connHost, self.__connPort)
+            return self.__pool.get_connection()
 
     def get_connection_secure(self, verbose):
-        return httplib.HTTPSConnection(self.__connHost, self.__connPortSsl)
+        return self.__poolSsl.get_connection()
+
+    def get_pool_stats(self):
+        """Returns the usage counters of the HTTP and HTTPS pools"""
+        return {'http': self.__pool.get_stats(),
+                'https': self.__poolSsl.get_stats()}
+
+    def close(self):
+        """Closes all the kept-alive connections"""
+        self.__pool.close()
+        self.__poolSsl.close()
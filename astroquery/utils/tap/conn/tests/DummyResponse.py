@@ -66,31 +66,21 @@ class DummyResponse:
                     return v
 
             else:
-                is_zip = False
-
                 if isinstance(v, str) and (v.endswith('zip') or v.endswith('gz')):
-                    is_zip = True
-                    bodyLength = len(self.zip_bytes)
                     v = self.zip_bytes
-                else:
-                    bodyLength = len(v)
+                elif isinstance(v, str):
+                    v = v.encode(encoding='utf_8', errors='strict')
 
                 if self.index < 0:
-                    return ""
-                if size >= bodyLength:
-                    size = bodyLength - 1
-                if size <= 0:
-                    return ""
+                    # end of body: the response can be read again
+                    self.index = 0
+                    return b""
                 endPos = self.index + size
                 tmp = v[self.index:endPos]
                 self.index = endPos
-                if endPos >= (bodyLength - 1):
+                if endPos >= len(v):
                     self.index = -1
-
-                if is_zip:
-                    return tmp
-                else:
-                    return tmp.encode(encoding='utf_8', errors='strict')
+                return tmp
 
     def close(self):
         self.index = 0
@@ -15,9 +15,14 @@ Created on 30 jun. 2016
 
 """
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
-from astroquery.utils.tap.conn.tapconn import TapConn
+import pytest
+
+from astroquery.utils.tap.conn.tapconn import ConnectionHandler, TapConn
 from astroquery.utils.tap.conn.tests.DummyConn import DummyConn
+from astroquery.utils.tap.core import Tap
 
 
 def data_path(filename):
@@ -171,3 +176,143 @@ def test_get_file_from_header():
     result = tap.get_file_from_header(headers)
 
     assert (result == "my_file.vot.gz")
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"EXECUTING"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Drop the socket without announcing it, as servers do with idle
+        # keep-alive connections
+        self.close_connection = self.path == "/drop"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path.endswith("/drop"):
+            # The server processed the request but died before answering
+            self.server.dropped_posts += 1
+            self.close_connection = True
+            return
+        body = b"<html>job created</html>"
+        self.send_response(303)
+        self.send_header("Location", f"http://{self.headers['Host']}/tap/async/1234")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    server.dropped_posts = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_connection_reuse(local_server):
+    host, port = local_server.server_address
+    handler = ConnectionHandler(host, port, port, pool_maxsize=2)
+    for _ in range(3):
+        conn = handler.get_connection()
+        conn.request("GET", "/phase")
+        assert conn.getresponse().read() == b"EXECUTING"
+    stats = handler.get_pool_stats()["http"]
+    assert stats["created"] == 1
+    assert stats["reused"] == 2
+    assert stats["requests"] == 3
+    handler.close()
+
+
+def test_busy_connection_not_reused(local_server):
+    host, port = local_server.server_address
+    handler = ConnectionHandler(host, port, port, pool_maxsize=1)
+    conn1 = handler.get_connection()
+    conn1.request("GET", "/phase")
+    response = conn1.getresponse()
+    # The response has not been read yet by this thread: another thread
+    # cannot take the connection
+    conns = []
+    thread = threading.Thread(target=lambda: conns.append(handler.get_connection()))
+    thread.start()
+    thread.join()
+    conn2 = conns[0]
+    assert conn2 is not conn1
+    assert conn2.overflow
+    stats = handler.get_pool_stats()["http"]
+    assert stats["connections"] == 1
+    assert stats["busy"] == 1
+    assert stats["overflow"] == 1
+    response.read()
+    assert handler.get_connection() is conn1
+    conn2.close()
+    handler.close()
+
+
+def test_unread_response_is_buffered(local_server):
+    host, port = local_server.server_address
+    handler = ConnectionHandler(host, port, port, pool_maxsize=1)
+    conn = handler.get_connection()
+    conn.request("GET", "/phase")
+    response1 = conn.getresponse()
+    # The same thread moves on without reading the response
+    assert handler.get_connection() is conn
+    conn.request("GET", "/phase")
+    response2 = conn.getresponse()
+    assert response1.read() == b"EXECUTING"
+    assert response2.read() == b"EXECUTING"
+    stats = handler.get_pool_stats()["http"]
+    assert stats["created"] == 1
+    assert stats["overflow"] == 0
+    handler.close()
+
+
+def test_launch_job_async_reuses_connections(local_server):
+    host, port = local_server.server_address
+    tap = Tap(url=f"http://{host}:{port}/tap")
+    for _ in range(12):
+        job = tap.launch_job_async("SELECT * FROM t", background=True)
+        assert job.jobid == "1234"
+    stats = tap.get_connection_pool_stats()["http"]
+    assert stats["reused"] > 0
+    assert stats["overflow"] == 0
+    assert stats["created"] == 1
+    tap._Tap__connHandler.close()
+
+
+def test_post_not_sent_again(local_server):
+    host, port = local_server.server_address
+    handler = ConnectionHandler(host, port, port)
+    conn = handler.get_connection()
+    conn.request("GET", "/phase")
+    conn.getresponse().read()
+    conn = handler.get_connection()
+    conn.request("POST", "/tap/async/drop", "QUERY=1",
+                 {"Content-type": "application/x-www-form-urlencoded"})
+    with pytest.raises(ConnectionError):
+        conn.getresponse()
+    assert local_server.dropped_posts == 1
+    handler.close()
+
+
+def test_dropped_connection_is_reopened(local_server):
+    host, port = local_server.server_address
+    handler = ConnectionHandler(host, port, port)
+    conn = handler.get_connection()
+    conn.request("GET", "/drop")
+    assert conn.getresponse().read() == b"EXECUTING"
+    conn = handler.get_connection()
+    conn.request("GET", "/phase")
+    assert conn.getresponse().read() == b"EXECUTING"
+    assert handler.get_pool_stats()["http"]["created"] == 1
+    handler.close()
@@ -455,6 +455,9 @@ class Tap:
             raise requests.exceptions.HTTPError(response.reason)
         else:
             location = self.__connHandler.find_header(response.getheaders(), "location")
+            # only the redirection headers are needed: read the body to free
+            # the kept-alive connection
+            response.read()
             jobid = taputils.get_jobid_from_location(location)
             if verbose:
                 print(f"job {jobid}, at: {location}")
@@ -750,6 +753,16 @@ class Tap:
             print(f"tap context: '{tapContext}'")
         return protocol, host, port, serverContext, tapContext
 
+    def get_connection_pool_stats(self):
+        """Returns the usage counters of the kept-alive HTTP(s) connections
+
+        Returns
+        -------
+        A dictionary with, for each protocol ('http' and 'https'), the number
+        of open, busy, created and reused connections and of requests sent
+        """
+        return self.__connHandler.get_pool_stats()
+
     def __str__(self):
         return f"Created TAP+ (v{VERSION}) - Connection:\n{self.__connHandler}"
 
@@ -7,16 +7,20 @@ TAP plus
 import os
 import time
 from urllib.parse import urlencode
+from xml.etree import ElementTree
 
 import requests
 from astropy.io.votable.tree import VOTableFile
 from astropy.logger import log
 
-from astroquery.utils.tap import taputils
+from astroquery.utils.tap import conf, taputils
 from astroquery.utils.tap.model import modelutils
 from astroquery.utils.tap.xmlparser import utils
 
-__all__ = ['Job']
+__all__ = ['Job', 'wait_for_jobs']
+
+# Phases in which a job is expected to change by itself
+RUNNING_PHASES = ('PENDING', 'QUEUED', 'EXECUTING')
 
 
 class Job:
@@ -65,6 +69,21 @@ class Job:
         self.name = None
         self.quote = None
 
+        # polling of the job phase: the delay between two phase requests
+        # starts at poll_interval and grows by poll_backoff up to
+        # max_poll_interval. If wait_time is set, the UWS 1.1 WAIT parameter
+        # is sent so that servers supporting it block until the phase
+        # changes (or wait_time seconds elapse). The defaults come from
+        # astroquery.utils.tap.conf.
+        self.poll_interval = conf.poll_interval
+        self.poll_backoff = conf.poll_backoff
+        self.max_poll_interval = conf.max_poll_interval
+        self.wait_time = conf.wait_time or None
+        self.__current_poll_interval = None
+        self.__next_poll_time = None
+        self.__last_polled_phase = None
+        self.__last_phase_response_status = None
+
         self.connHandler = connhandler
         self.parameters = {}
         self.parameters['query'] = query
@@ -318,14 +337,13 @@ class Job:
     def wait_for_job_end(self, *, verbose=False):
         """Waits until a job is finished
 
+        The phase is requested with an increasing delay, see `poll`.
+
         Parameters
         ----------
         verbose : bool, optional, default 'False'
             flag to display information about the process
         """
-        currentResponse = None
-        responseData = None
-        lphase = None
         # execute job if not running
         if self._phase == 'PENDING':
             log.info("Job in PENDING phase, sending phase=RUN request.")
@@ -335,19 +353,96 @@ class Job:
                 # ignore
                 if verbose:
                     print("Exception when trying to start job", ex)
-        while True:
-            responseData = self.get_phase(update=True)
-            currentResponse = self.__last_phase_response_status
+        self.reset_polling()
+        while not self.poll(verbose=verbose):
+            time.sleep(self.time_to_next_poll())
+        return self.__last_phase_response_status, self.__last_polled_phase
+
+    def reset_polling(self):
+        """Restarts the polling delay from ``poll_interval``"""
+        self.__current_poll_interval = None
+        self.__next_poll_time = None
+        self.__last_polled_phase = None
+
+    def time_to_next_poll(self):
+        """Returns the number of seconds before `poll` queries the server
+        again"""
+        if self.__next_poll_time is None:
+            return 0
+        return max(0, self.__next_poll_time - time.monotonic())
+
+    def poll(self, *, callback=None, verbose=False):
+        """Updates the job phase without blocking
+
+        The server is only queried if the delay since the previous query has
+        elapsed; this delay increases exponentially while the job runs. This
+        allows several jobs to be followed from a single loop (see
+        `wait_for_jobs`).
 
-            lphase = responseData.upper().strip()
-            if verbose:
-                print(f"Job {self.jobid} status: {lphase}")
-            if "PENDING" != lphase and "QUEUED" != lphase and "EXECUTING" != lphase:
-                break
+        Parameters
+        ----------
+        callback : callable, optional, default None
+            function called with the job as argument once the job ends
+        verbose : bool, optional, default 'False'
+            flag to display information about the process
+
+        Returns
+        -------
+        'True' if the job is no longer PENDING, QUEUED or EXECUTING
+        """
+        if self.__last_polled_phase is not None and self.__last_polled_phase not in RUNNING_PHASES:
+            return True
+        if self.time_to_next_poll() > 0:
+            return False
+
+        previous_phase = self.__last_polled_phase
+        poll_start = time.monotonic()
+        if self.wait_time and previous_phase is not None:
+            phase = self.__get_phase_blocking(previous_phase)
+        else:
+            phase = self.get_phase(update=True)
+        lphase = phase.upper().strip()
+        self.__last_polled_phase = lphase
+        if verbose:
+            print(f"Job {self.jobid} status: {lphase}")
+
+        if lphase not in RUNNING_PHASES:
             # PENDING, QUEUED, EXECUTING, COMPLETED, ERROR, ABORTED, UNKNOWN,
             # HELD, SUSPENDED, ARCHIVED:
-            time.sleep(0.5)
-        return currentResponse, lphase
+            self.__next_poll_time = None
+            if callback is not None:
+                callback(self)
+            return True
+
+        if (self.wait_time and lphase == previous_phase
+                and time.monotonic() - poll_start >= self.wait_time):
+            # the server blocked for the whole WAIT time: ask again
+            interval = 0
+        elif self.__current_poll_interval is None:
+            interval = self.poll_interval
+        else:
+            interval = min(self.__current_poll_interval * self.poll_backoff, self.max_poll_interval)
+        if interval:
+            self.__current_poll_interval = interval
+        self.__next_poll_time = time.monotonic() + interval
+        return False
+
+    def __get_phase_blocking(self, phase):
+        # UWS 1.1: the job document is returned once the phase differs from
+        # PHASE or after WAIT seconds
+        query = urlencode({"WAIT": int(self.wait_time), "PHASE": phase})
+        response = self.connHandler.execute_tapget(f"async/{self.jobid}?{query}")
+        self.__last_phase_response_status = response.status
+        if response.status != 200:
+            err_msg = taputils.get_http_response_error(response)
+            print(response.status, err_msg)
+            raise requests.exceptions.HTTPError(err_msg)
+        root = ElementTree.fromstring(response.read())
+        for element in root.iter():
+            if element.tag.rsplit('}', 1)[-1].lower() == 'phase':
+                self._phase = element.text.strip()
+                return self._phase
+        raise ValueError(f"No phase found in the description of job {self.jobid}")
 
     def __load_async_job_results(self, *, debug=False):
         wjResponse, phase = self.wait_for_job_end()
@@ -481,3 +576,31 @@ class Job:
                f"\nOwner: {self.ownerid}" \
                f"\nOutput file: {self.outputFile}" \
                f"\nResults: {result}"
+
+
+def wait_for_jobs(jobs, *, callback=None, verbose=False):
+    """Waits until all the jobs are finished, polling them from a single loop
+
+    Parameters
+    ----------
+    jobs : list of `Job`, mandatory
+        asynchronous jobs; PENDING jobs are started
+    callback : callable, optional, default None
+        function called with each job as argument as soon as it ends
+    verbose : bool, optional, default 'False'
+        flag to display information about the process
+
+    Returns
+    -------
+    The list of the final phases of the jobs
+    """
+    for job in jobs:
+        if job._phase == 'PENDING':
+            job.start(verbose=verbose)
+        job.reset_polling()
+    running = list(jobs)
+    while running:
+        running = [job for job in running if not job.poll(callback=callback, verbose=verbose)]
+        if running:
+            time.sleep(min(job.time_to_next_poll() for job in running))
+    return [job.get_phase() for job in jobs]
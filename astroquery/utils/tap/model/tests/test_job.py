@@ -22,9 +22,11 @@ from astropy.io.votable import from_table
 from astropy.table import Table
 from astropy.utils.data import get_pkg_data_filename
 
+from astroquery.utils.tap import conf
 from astroquery.utils.tap.conn.tests.DummyConnHandler import DummyConnHandler
 from astroquery.utils.tap.conn.tests.DummyResponse import DummyResponse
-from astroquery.utils.tap.model.job import Job
+from astroquery.utils.tap.model import job as job_module
+from astroquery.utils.tap.model.job import Job, wait_for_jobs
 
 package = "astroquery.utils.tap.model.tests"
 
@@ -174,3 +176,106 @@ def test_job_phase():
     except ValueError:
         # ok
         pass
+
+
+class PhaseSequenceConnHandler(DummyConnHandler):
+    """Returns the given phases, one per phase request"""
+
+    def __init__(self, phases):
+        super().__init__()
+        self.phases = list(phases)
+        self.requests = []
+
+    def execute_tapget(self, request=None, verbose=False):
+        self.requests.append(request)
+        response = DummyResponse(200)
+        phase = self.phases.pop(0) if len(self.phases) > 1 else self.phases[0]
+        if "WAIT=" in request:
+            phase = f'<uws:job xmlns:uws="http://www.ivoa.net/xml/UWS/v1.0"><uws:phase>{phase}</uws:phase></uws:job>'
+        response.set_data(method='GET', body=phase)
+        return response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(job_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(job_module.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_wait_for_job_end_backoff(fake_clock):
+    job = Job(async_job=True, connhandler=PhaseSequenceConnHandler(["EXECUTING"] * 6 + ["COMPLETED"]))
+    job.jobid = "12345"
+    job.max_poll_interval = 1.5
+    status, phase = job.wait_for_job_end()
+    assert (status, phase) == (200, "COMPLETED")
+    assert fake_clock.sleeps == pytest.approx([0.5, 0.75, 1.125, 1.5, 1.5, 1.5])
+    assert job.is_finished()
+
+
+def test_polling_conf(fake_clock):
+    with conf.set_temp('poll_interval', 1), conf.set_temp('poll_backoff', 2), \
+            conf.set_temp('max_poll_interval', 3), conf.set_temp('wait_time', 20):
+        job = Job(async_job=True, connhandler=PhaseSequenceConnHandler(["EXECUTING"] * 4 + ["COMPLETED"]))
+    assert job.wait_time == 20
+    job.wait_time = None
+    job.jobid = "12345"
+    job.wait_for_job_end()
+    assert fake_clock.sleeps == pytest.approx([1, 2, 3, 3])
+    assert Job(async_job=True).wait_time is None
+
+
+def test_poll_does_not_block(fake_clock):
+    conn_handler = PhaseSequenceConnHandler(["QUEUED", "EXECUTING", "COMPLETED"])
+    job = Job(async_job=True, connhandler=conn_handler)
+    job.jobid = "12345"
+    assert not job.poll()
+    # the next poll is not due yet: no request is sent
+    assert not job.poll()
+    assert len(conn_handler.requests) == 1
+    assert job.time_to_next_poll() == 0.5
+
+    fake_clock.now += 0.5
+    assert not job.poll()
+    fake_clock.now += 0.75
+    finished = []
+    assert job.poll(callback=finished.append)
+    assert finished == [job]
+    assert job.poll()
+    assert len(conn_handler.requests) == 3
+
+
+def test_wait_for_jobs(fake_clock):
+    jobs = []
+    for jobid, phases in (("1", ["EXECUTING", "COMPLETED"]), ("2", ["EXECUTING"] * 3 + ["ERROR"])):
+        job = Job(async_job=True, connhandler=PhaseSequenceConnHandler(phases))
+        job.jobid = jobid
+        jobs.append(job)
+    finished = []
+    assert wait_for_jobs(jobs, callback=finished.append) == ["COMPLETED", "ERROR"]
+    assert finished == jobs
+
+
+def test_poll_blocking_wait(fake_clock):
+    conn_handler = PhaseSequenceConnHandler(["EXECUTING", "EXECUTING", "COMPLETED"])
+    job = Job(async_job=True, connhandler=conn_handler)
+    job.jobid = "12345"
+    job.wait_time = 30
+    status, phase = job.wait_for_job_end()
+    assert phase == "COMPLETED"
+    assert conn_handler.requests[0] == "async/12345/phase"
+    assert conn_handler.requests[1] == "async/12345?WAIT=30&PHASE=EXECUTING"
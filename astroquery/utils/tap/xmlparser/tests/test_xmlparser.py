@@ -15,8 +15,12 @@ Created on 30 jun. 2016
 
 """
 
+import gzip
+import io
 import os
 
+import pytest
+
 from astroquery.utils.tap.xmlparser import utils
 from astroquery.utils.tap.xmlparser.jobListSaxParser import JobListSaxParser
 from astroquery.utils.tap.xmlparser.jobSaxParser import JobSaxParser
@@ -156,6 +160,18 @@ def test_job_results_parser_ecsv():
     file.close()
 
 
+@pytest.mark.parametrize("output_format, file_name",
+                         [('votable_gzip', '1714556098855O-result.vot'), ('csv', '1714556098855O-result.csv')])
+@pytest.mark.parametrize("max_memory_size", [1024, None])
+def test_job_results_parser_gzip(output_format, file_name, max_memory_size):
+    with open(data_path(file_name), 'rb') as file:
+        response = io.BytesIO(gzip.compress(file.read()))
+    # a small max_memory_size spools the response to a temporary file
+    result_table = utils.read_http_response(response, output_format, max_memory_size=max_memory_size)
+    assert len(result_table.columns) == 152
+    assert 'solution_id' in result_table.columns
+
+
 def __check_table(table, qualifiedName, numColumns, columnsData, size_bytes=None):
     assert str(table.get_qualified_name()) == str(qualifiedName)
     c = table.columns
@@ -15,9 +15,10 @@ Created on 30 jun. 2016
 
 """
 import gzip
-import io
 import json
+import shutil
 import sys
+import tempfile
 import warnings
 
 import numpy as np
@@ -27,66 +28,105 @@ from astropy.table import Table as APTable
 from astropy.table.table import Table
 from astropy.utils.exceptions import AstropyWarning
 
+from astroquery.utils.tap import conf
+
+GZIP_MAGIC = b'\x1f\x8b'
+READ_BLOCK_SIZE = 1024 * 1024
+
 
 def util_create_string_from_buffer(buffer):
     return ''.join(map(str, buffer))
 
 
-def read_http_response(response, output_format, *, correct_units=True, use_names_over_ids=False):
+def read_http_response(response, output_format, *, correct_units=True, use_names_over_ids=False,
+                       max_memory_size=None):
+    """Parses the table contained in a TAP HTTP response
+
+    The response is read in blocks into a buffer that is spooled to a
+    temporary file once it exceeds ``max_memory_size`` bytes. Gzip compressed
+    responses are decompressed while they are parsed, so the compressed and
+    decompressed data are never both held in memory.
+
+    Parameters
+    ----------
+    response : HTTP response object, mandatory
+        response to read
+    output_format : str, mandatory
+        TAP output format of the response
+    correct_units : bool, optional, default True
+        whether to fix units not recognized by astropy
+    use_names_over_ids : bool, optional, default False
+        use the ``name`` attributes of VOTable fields as column names
+    max_memory_size : int, optional
+        maximum number of bytes kept in memory, defaults to
+        ``astroquery.utils.tap.conf.max_memory_size``
+
+    Returns
+    -------
+    An `~astropy.table.Table`
+    """
     astropy_format = get_suitable_astropy_format(output_format)
-
-    # If we want to use astropy.table, we have to read the data
-    data = io.BytesIO(response.read())
-
-    try:
-        if astropy_format == 'votable':
-            result = APTable.read(io.BytesIO(gzip.decompress(data.read())), format=astropy_format,
-                                  use_names_over_ids=use_names_over_ids)
+    if max_memory_size is None:
+        max_memory_size = conf.max_memory_size
+
+    with tempfile.SpooledTemporaryFile(max_size=max_memory_size) as data:
+        shutil.copyfileobj(response, data, READ_BLOCK_SIZE)
+        data.seek(0)
+        is_gzip = data.read(2) == GZIP_MAGIC
+        data.seek(0)
+
+        if is_gzip:
+            with gzip.GzipFile(fileobj=data, mode='rb') as decompressed:
+                if astropy_format == 'votable':
+                    result = APTable.read(decompressed, format=astropy_format,
+                                          use_names_over_ids=use_names_over_ids)
+                else:
+                    result = APTable.read(decompressed, format=astropy_format)
         else:
-            result = APTable.read(io.BytesIO(gzip.decompress(data.read())), format=astropy_format)
+            result = _read_uncompressed(data, output_format, astropy_format,
+                                        use_names_over_ids=use_names_over_ids)
 
-    except OSError:
-        # data is not a valid gzip file by BadGzipFile.
+    if correct_units:
+        modify_unrecognized_table_units(result)
 
-        if output_format == 'json':
+    return result
 
-            # Set the file’s current position
-            data.seek(0)
-            data_json = json.load(data)
 
-            if data_json.get('data') and data_json.get('metadata'):
+def _read_uncompressed(data, output_format, astropy_format, *, use_names_over_ids=False):
+    if output_format == 'json':
+        data_json = json.load(data)
 
-                column_name = []
-                for name in data_json['metadata']:
-                    column_name.append(name['name'])
+        if data_json.get('data') and data_json.get('metadata'):
 
-                result = Table(rows=data_json['data'], names=column_name, masked=True)
+            column_name = []
+            for name in data_json['metadata']:
+                column_name.append(name['name'])
 
-                for v in data_json['metadata']:
-                    col_name = v['name']
-                    result[col_name].unit = v['unit']
-                    result[col_name].description = v['description']
-                    result[col_name].meta = {'metadata': v}
+            result = Table(rows=data_json['data'], names=column_name, masked=True)
 
-            else:
-                result = APTable.read(data, format=astropy_format)
+            for v in data_json['metadata']:
+                col_name = v['name']
+                result[col_name].unit = v['unit']
+                result[col_name].description = v['description']
+                result[col_name].meta = {'metadata': v}
 
-        elif astropy_format == 'votable':
-            result = APTable.read(data, format=astropy_format, use_names_over_ids=use_names_over_ids)
         else:
-            with warnings.catch_warnings():
-                # Capturing the warning and converting the objid column to int64 is necessary for consistency as
-                # it was converted to string on systems with default integer int32 due to an overflow.
-                if sys.platform.startswith('win'):
-                    warnings.filterwarnings("ignore", category=AstropyWarning,
-                                            message=r'OverflowError converting to IntType in column.*')
-                result = APTable.read(data, format=astropy_format)
-                if 'solution_id' in result.columns:
-                    result['solution_id'] = result['solution_id'].astype(np.uint64)
-
-    if correct_units:
-        modify_unrecognized_table_units(result)
-
+            # Set the file's current position
+            data.seek(0)
+            result = APTable.read(data, format=astropy_format)
+
+    elif astropy_format == 'votable':
+        result = APTable.read(data, format=astropy_format, use_names_over_ids=use_names_over_ids)
+    else:
+        with warnings.catch_warnings():
+            # Capturing the warning and converting the objid column to int64 is necessary for consistency as
+            # it was converted to string on systems with default integer int32 due to an overflow.
+            if sys.platform.startswith('win'):
+                warnings.filterwarnings("ignore", category=AstropyWarning,
+                                        message=r'OverflowError converting to IntType in column.*')
+            result = APTable.read(data, format=astropy_format)
+            if 'solution_id' in result.columns:
+                result['solution_id'] = result['solution_id'].astype(np.uint64)
     return result
 
 
@@ -0,0 +1,31 @@
+import pytest
+
+from ...utils.datalink import resolve_datalinks, check_datalink_errors
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_resolve_datalinks(workers):
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url)
+        if url == 'bad':
+            raise ValueError(url)
+        return url.upper()
+
+    results, errors = resolve_datalinks(['a', 'bad', 'b', 'a'], fetch, workers=workers)
+
+    assert sorted(fetched) == ['a', 'b', 'bad']
+    assert results == ['A', None, 'B', 'A']
+    assert list(errors) == [1]
+    assert isinstance(errors[1], ValueError)
+
+
+def test_check_datalink_errors(caplog):
+    check_datalink_errors({}, 2)
+
+    check_datalink_errors({1: ValueError('bad')}, 2)
+    assert "DataLink request 1 failed" in caplog.text
+
+    with pytest.raises(ValueError, match='bad'):
+        check_datalink_errors({0: ValueError('bad'), 1: ValueError('worse')}, 2)
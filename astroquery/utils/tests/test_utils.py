@@ -6,6 +6,7 @@ import pytest
 import tempfile
 import textwrap
 import urllib
+from pathlib import Path
 
 import astropy.coordinates as coord
 from astropy.io import fits
@@ -455,6 +456,17 @@ def test_filecontainer_get(patch_getreadablefileobj):
     assert isinstance(ff, fits.HDUList)
 
 
+def test_filecontainer_get_memmap(tmp_path):
+    ffile = commons.FileContainer(fitsfilepath, encoding='binary', memmap=True)
+    with ffile.get_fits() as ff:
+        assert isinstance(ff, fits.HDUList)
+        assert ff._file.memmap
+    assert ffile.get_local_path() == fitsfilepath
+
+    ffile.save_fits(tmp_path / 'saved.fits')
+    assert (tmp_path / 'saved.fits').read_bytes() == Path(fitsfilepath).read_bytes()
+
+
 @pytest.mark.parametrize(('coordinates', 'expected'),
                          [("5h0m0s 0d0m0s", True),
                           ("m1", False)
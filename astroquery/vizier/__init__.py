@@ -42,6 +42,16 @@ class Conf(_config.ConfigNamespace):
         'Maximum number of rows that will be fetched from the result '
         '(set to -1 for unlimited).')
 
+    max_positions = _config.ConfigItem(
+        10000,
+        'Maximum number of positions sent in a single request by query_region. '
+        'Longer position lists are split into several requests whose results are '
+        'merged (set to 0 to never split).')
+
+    position_workers = _config.ConfigItem(
+        1,
+        'Number of requests of a split position list that are sent concurrently.')
+
 
 conf = Conf()
 
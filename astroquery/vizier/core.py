@@ -7,8 +7,10 @@ import json
 import copy
 import re
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
+import numpy as np
 import astropy.units as u
 import astropy.coordinates as coord
 import astropy.table as tbl
@@ -17,8 +19,9 @@ from collections import OrderedDict
 import astropy.io.votable as votable
 from astropy.io import ascii, fits
 from pyvo import registry
+from requests import HTTPError
 
-from ..query import BaseQuery
+from ..query import AstroQuery, BaseQuery
 from ..utils import commons
 from ..utils import async_to_sync
 from ..utils import schema
@@ -471,18 +474,7 @@ class VizierClass(BaseQuery):
             target = commons.parse_coordinates(coordinates).transform_to(frame)
 
             if not target.isscalar:
-                center["-c"] = []
-                for pos in target:
-                    if frame == 'galactic':
-                        glon_deg = pos.l.to_string(unit="deg", decimal=True, precision=8)
-                        glat_deg = pos.b.to_string(unit="deg", decimal=True, precision=8,
-                                                   alwayssign=True)
-                        center["-c"] += ["G{}{}".format(glon_deg, glat_deg)]
-                    else:
-                        ra_deg = pos.ra.to_string(unit="deg", decimal=True, precision=8)
-                        dec_deg = pos.dec.to_string(unit="deg", decimal=True,
-                                                    precision=8, alwayssign=True)
-                        center["-c"] += ["{}{}".format(ra_deg, dec_deg)]
+                center["-c"] = _format_positions(target, frame)
                 columns += ["_q"]  # Always request reference to input table
             else:
                 if frame == 'galactic':
@@ -498,17 +490,11 @@ class VizierClass(BaseQuery):
         elif isinstance(coordinates, tbl.Table):
             if (("_RAJ2000" in coordinates.keys()) and ("_DEJ2000" in
                                                         coordinates.keys())):
-                center["-c"] = []
                 sky_coord = coord.SkyCoord(coordinates["_RAJ2000"],
                                            coordinates["_DEJ2000"],
                                            unit=(coordinates["_RAJ2000"].unit,
                                                  coordinates["_DEJ2000"].unit))
-                for (ra, dec) in zip(sky_coord.ra, sky_coord.dec):
-                    ra_deg = ra.to_string(unit="deg", decimal=True,
-                                          precision=8)
-                    dec_deg = dec.to_string(unit="deg", decimal=True,
-                                            precision=8, alwayssign=True)
-                    center["-c"] += ["{}{}".format(ra_deg, dec_deg)]
+                center["-c"] = _format_positions(sky_coord, 'icrs')
                 columns += ["_q"]  # Always request reference to input table
             else:
                 raise ValueError("Table must contain '_RAJ2000' and "
@@ -533,6 +519,31 @@ class VizierClass(BaseQuery):
             raise Exception(
                 "At least one of radius, width/height must be specified")
 
+        positions = center.get("-c")
+        if (isinstance(positions, list) and return_type == 'votable'
+                and 0 < conf.max_positions < len(positions)):
+            # Split long position lists into several requests
+            offsets = range(0, len(positions), conf.max_positions)
+            data_payloads = [
+                self._args_to_payload(center={**center, "-c": positions[offset:offset + conf.max_positions]},
+                                      columns=columns, catalog=catalog, column_filters=column_filters)
+                for offset in offsets]
+
+            if get_query_payload:
+                return data_payloads
+
+            url = self._server_to_url(return_type=return_type)
+
+            def request(data_payload):
+                return self._request(method='POST', url=url, data=data_payload,
+                                     timeout=self.TIMEOUT, cache=cache)
+
+            with ThreadPoolExecutor(max_workers=conf.position_workers) as executor:
+                responses = list(executor.map(request, data_payloads))
+            # ``_last_query`` only holds the last request sent
+            queries = [AstroQuery('POST', url, data=data_payload) for data_payload in data_payloads]
+            return _ChunkedResponses(responses, offsets, queries)
+
         # Prepare payload
         data_payload = self._args_to_payload(center=center, columns=columns,
                                              catalog=catalog, column_filters=column_filters)
@@ -724,7 +735,7 @@ class VizierClass(BaseQuery):
         return "\n".join(script)
 
     def _parse_result(self, response, *, get_catalog_names=False, verbose=False,
-                      invalid='warn'):
+                      invalid='warn', query=None):
         """
         Parses the HTTP response to create a `~astropy.table.Table`.
 
@@ -747,6 +758,9 @@ class VizierClass(BaseQuery):
             returned. A value of 'exception' will not catch the
             exception, while a value of 'mask' will simply always mask
             invalid values.
+        query : `~astroquery.query.AstroQuery`, optional
+            The request of ``response``, removed from the cache if the
+            service returned an error. Defaults to the last request sent.
 
         Returns
         -------
@@ -755,11 +769,15 @@ class VizierClass(BaseQuery):
             as a string.
 
         """
+        if isinstance(response, _ChunkedResponses):
+            return self._parse_chunked_result(response, get_catalog_names=get_catalog_names,
+                                              verbose=verbose, invalid=invalid)
+
         if response.content[:5] == b'<?xml':
             try:
                 return self._parse_vizier_votable(
                     response.content, verbose=verbose, invalid=invalid,
-                    get_catalog_names=get_catalog_names)
+                    get_catalog_names=get_catalog_names, query=query)
             except ValueError as ex:
                 self.response = response
                 self.table_parse_error = ex
@@ -776,6 +794,33 @@ class VizierClass(BaseQuery):
             return fits.open(BytesIO(response.content),
                              ignore_missing_end=True)
 
+    def _parse_chunked_result(self, responses, **kwargs):
+        """
+        Parses the responses of a position list split into several requests,
+        and merges the tables of each catalog, with ``_q`` numbering the
+        positions of the whole list.
+        """
+        tables = OrderedDict()
+        for response, offset, query in zip(responses, responses.offsets, responses.queries):
+            try:
+                response.raise_for_status()
+            except HTTPError:
+                self.cache_backend.remove(query.hash())
+                raise
+            result = self._parse_result(response, query=query, **kwargs)
+            if kwargs.get('get_catalog_names'):
+                tables.update(dict.fromkeys(result))
+                continue
+            for name, table in zip(result.keys(), result):
+                if '_q' in table.colnames:
+                    table['_q'] += offset
+                tables.setdefault(name, []).append(table)
+
+        if kwargs.get('get_catalog_names'):
+            return list(tables)
+        return commons.TableList([(name, tbl.vstack(chunks, metadata_conflicts='silent'))
+                                  for name, chunks in tables.items()])
+
     @property
     def valid_keywords(self):
         if not hasattr(self, '_valid_keyword_dict'):
@@ -789,7 +834,7 @@ class VizierClass(BaseQuery):
 
         return self._valid_keyword_dict
 
-    def _raise_error_on_server_error(self, vo_tree):
+    def _raise_error_on_server_error(self, vo_tree, *, query=None):
         if not commons.ASTROPY_LT_5_3:
             query_status = next(vo_tree.get_infos_by_name("QUERY_STATUS"), None)
         else:  # remove when support for astropy older than 5.3 is dropped
@@ -798,8 +843,10 @@ class VizierClass(BaseQuery):
 
         if query_status is not None and query_status.value == "ERROR":
             # remove failed query from cache
-            if self._last_query is not None:
-                self._last_query.remove_cache_file(self.cache_location)
+            if query is None:
+                query = self._last_query
+            if query is not None:
+                self.cache_backend.remove(query.hash())
             # display error message
             if not commons.ASTROPY_LT_5_3:
                 message = "".join(line.value for line in vo_tree.get_infos_by_name("Error"))
@@ -808,7 +855,7 @@ class VizierClass(BaseQuery):
             raise RemoteServiceError(message)
 
     def _parse_vizier_votable(self, data, *, verbose=False, invalid='warn',
-                              get_catalog_names=False):
+                              get_catalog_names=False, query=None):
         """
         Given a votable as string, parse it into dict or tables
         """
@@ -831,7 +878,7 @@ class VizierClass(BaseQuery):
             raise ValueError("Invalid keyword for 'invalid'. "
                              "Must be exception, mask, or warn")
 
-        self._raise_error_on_server_error(vo_tree)
+        self._raise_error_on_server_error(vo_tree, query=query)
 
         if get_catalog_names:
             return OrderedDict([(R.name, R) for R in vo_tree.resources])
@@ -897,6 +944,34 @@ def _parse_angle(angle):
         return u.deg, "d", angle.to_value(u.deg)
 
 
+def _format_positions(coordinates, frame):
+    """
+    Formats the positions of a non-scalar coordinate object as a list of
+    ``-c`` values, the same as `~astropy.coordinates.Angle.to_string` with
+    8 decimals would, but for all the positions at once.
+    """
+    if frame == 'galactic':
+        lon = np.char.add('G', np.char.mod('%.8f', coordinates.l.deg.ravel()))
+        lat = coordinates.b.deg.ravel()
+    else:
+        lon = np.char.mod('%.8f', coordinates.ra.deg.ravel())
+        lat = coordinates.dec.deg.ravel()
+    return np.char.add(lon, np.char.mod('%+.8f', lat)).tolist()
+
+
+class _ChunkedResponses(list):
+    """
+    The responses of a position list queried in several requests, with the
+    index in the list of the first position of each request and the
+    requests themselves.
+    """
+
+    def __init__(self, responses, offsets, queries):
+        super().__init__(responses)
+        self.offsets = list(offsets)
+        self.queries = list(queries)
+
+
 class VizierKeyword(list):
 
     """Helper class for setting keywords for Vizier queries"""
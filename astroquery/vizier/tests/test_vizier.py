@@ -11,6 +11,7 @@ from astropy.table import Table
 import astropy.units as u
 
 from ... import vizier
+from ...query import AstroQuery
 from ...exceptions import EmptyResponseError, RemoteServiceError, TableParseError
 from ...utils import commons
 from astroquery.utils.mocks import MockResponse
@@ -178,6 +179,68 @@ def test_query_regions(patch_post):
         vector_skycoord, radius=5 * u.deg, catalog=["HIP", "NOMAD", "UCAC"])
 
 
+@pytest.mark.parametrize("frame", ["icrs", "galactic"])
+def test_format_positions(frame):
+    target = vector_skycoord.transform_to(frame)
+    expected = []
+    for pos in target:
+        lon, lat = (pos.l, pos.b) if frame == "galactic" else (pos.ra, pos.dec)
+        expected.append(("G" if frame == "galactic" else "")
+                        + lon.to_string(unit="deg", decimal=True, precision=8)
+                        + lat.to_string(unit="deg", decimal=True, precision=8, alwayssign=True))
+    assert vizier.core._format_positions(target, frame) == expected
+
+
+@pytest.mark.parametrize("position_workers", [1, 2])
+def test_query_regions_chunked(patch_post, position_workers):
+    coordinates = SkyCoord(ra=[299.590, 299.90, 300.1] * u.deg, dec=[35.201, 35.201, 35.3] * u.deg)
+    with vizier.conf.set_temp("max_positions", 2), vizier.conf.set_temp("position_workers", position_workers):
+        payloads = vizier.core.Vizier.query_region(coordinates, radius=5 * u.deg, catalog=["HIP", "NOMAD", "UCAC"],
+                                                   get_query_payload=True)
+        assert len(payloads) == 2
+        assert [len(payload.split("-c=<<====AstroqueryList\n")[1].splitlines()) for payload in payloads] == [3, 2]
+
+        single = vizier.core.Vizier.query_region(scalar_skycoord, radius=5 * u.deg,
+                                                 catalog=["HIP", "NOMAD", "UCAC"])
+        result = vizier.core.Vizier.query_region(coordinates, radius=5 * u.deg, catalog=["HIP", "NOMAD", "UCAC"])
+
+    # The tables of each request are stacked
+    assert isinstance(result, commons.TableList)
+    assert result.keys() == single.keys()
+    assert len(result[0]) == 2 * len(single[0])
+
+
+def test_query_regions_chunked_error(monkeypatch, tmp_path):
+    """Checks that a chunk with an error response is removed from the cache."""
+    with open(data_path("no_server_error.xml"), 'rb') as f:
+        error_content = f.read()
+    requests_sent = []
+
+    def mock_request(self, method, url, data=None, **kwargs):
+        requests_sent.append(data)
+        if len(requests_sent) == 1:
+            return MockResponse(error_content)
+        return post_mockreturn(self, method, url, data=data)
+
+    monkeypatch.setattr(requests.Session, 'request', mock_request)
+
+    coordinates = SkyCoord(ra=[299.590, 299.90, 300.1] * u.deg, dec=[35.201, 35.201, 35.3] * u.deg)
+    v = vizier.core.Vizier(catalog=["HIP", "NOMAD", "UCAC"])
+    v.cache_location = tmp_path
+    with vizier.conf.set_temp("max_positions", 2):
+        payloads = v.query_region(coordinates, radius=5 * u.deg, get_query_payload=True)
+        with pytest.raises(RemoteServiceError,
+                           match="The database is not currently reachable"):
+            v.query_region(coordinates, radius=5 * u.deg)
+
+    assert requests_sent == payloads
+    url = v._server_to_url(return_type='votable')
+    failed, last = (AstroQuery('POST', url, data=payload).hash() for payload in payloads)
+    assert v._last_query.hash() == last
+    assert v.cache_backend.get(failed, -1) is None
+    assert v.cache_backend.get(last, -1) is not None
+
+
 def test_query_object_async(patch_post):
     response = vizier.core.Vizier.query_object_async(
         "HD 226868", catalog=["NOMAD", "UCAC"])
@@ -14,6 +14,27 @@ class Conf(_config.ConfigNamespace):
         300,
         'time limit for connecting to xMatch server')
 
+    tables_ttl = _config.ConfigItem(
+        86400,
+        'Time in seconds after which the list of the VizieR tables available '
+        'in xMatch, kept in memory, is requested again.')
+
+    chunk_size = _config.ConfigItem(
+        0,
+        'Maximum number of rows of an uploaded table sent in one request. '
+        'Larger tables are split into chunks of nearby sources, matched '
+        'separately and merged. 0 never splits the uploaded tables.')
+
+    chunk_workers = _config.ConfigItem(
+        1,
+        'Number of chunks of an uploaded table matched concurrently. Keep '
+        'this small to not overload the xMatch server.')
+
+    chunk_retries = _config.ConfigItem(
+        0,
+        'Number of times the match of a chunk is retried, with exponential '
+        'backoff, after a connection error, a timeout or a server error.')
+
 
 conf = Conf()
 
@@ -1,12 +1,19 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO, BytesIO
 
+import numpy as np
+from astropy.coordinates import SkyCoord
 from astropy.io import votable
 import astropy.units as u
-from astropy.table import Table
+from astropy.table import Table, vstack
+import requests
 from requests import HTTPError
 
+from astroquery import log
 from astroquery.query import BaseQuery
 from astroquery.exceptions import InvalidQueryError
 from astroquery.utils import url_helpers, prepend_docstr_nosections, async_to_sync
@@ -14,14 +21,67 @@ from astroquery.utils import url_helpers, prepend_docstr_nosections, async_to_sy
 from . import conf
 try:
     from regions import CircleSkyRegion
+    HAS_REGIONS = True
 except ImportError:
-    pass
+    HAS_REGIONS = False
+
+
+def _split_by_position(ra, dec, chunk_size):
+    """
+    Split the row indices of a table into chunks of at most ``chunk_size``
+    rows, each holding sources close to each other on the sky: the rows are
+    sorted in declination bands, then by right ascension within each band.
+    """
+    n_rows = len(ra)
+    n_chunks = -(-n_rows // chunk_size)
+    n_bands = int(np.ceil(np.sqrt(n_chunks)))
+    band = np.empty(n_rows, dtype=int)
+    band[np.argsort(dec, kind='stable')] = np.arange(n_rows) * n_bands // n_rows
+    return np.array_split(np.lexsort((ra, band)), n_chunks)
+
+
+def _bounding_cone(ra, dec, margin):
+    """
+    Return a ``regions.CircleSkyRegion`` holding all the given positions (in
+    degrees), enlarged by ``margin``, or None if it would cover the whole sky.
+    """
+    finite = np.isfinite(ra) & np.isfinite(dec)
+    if not HAS_REGIONS or not finite.any():
+        return None
+    ra, dec = np.radians(ra[finite]), np.radians(dec[finite])
+    xyz = np.array([np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)])
+    center = xyz.mean(axis=1)
+    norm = np.linalg.norm(center)
+    if norm < 1e-6:
+        return None
+    center /= norm
+    radius = np.degrees(np.arccos(np.clip(center @ xyz, -1, 1)).max()) * u.deg + margin
+    if radius >= 180 * u.deg:
+        return None
+    center = SkyCoord(np.degrees(np.arctan2(center[1], center[0])) % 360,
+                      np.degrees(np.arcsin(center[2])), unit='deg')
+    return CircleSkyRegion(center=center, radius=radius.to(u.arcsec))
+
+
+def _is_transient(error):
+    """Return True if ``error`` was caused by a connection error, a timeout or a server error."""
+    while error is not None:
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                              requests.exceptions.ChunkedEncodingError)):
+            return True
+        if (isinstance(error, HTTPError) and error.response is not None
+                and error.response.status_code >= 500):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
 
 
 @async_to_sync
 class XMatchClass(BaseQuery):
     URL = conf.url
     TIMEOUT = conf.timeout
+    # the VizieR tables available at each xMatch URL, shared by all the instances
+    _table_registry = {}
 
     def query(self, cat1, cat2, max_distance, *,
               colRA1=None, colDec1=None, colRA2=None, colDec2=None,
@@ -71,6 +131,19 @@ class XMatchClass(BaseQuery):
         -------
         table : `~astropy.table.Table`
             Query results table
+
+        Notes
+        -----
+        If ``conf.chunk_size`` is set, an uploaded `~astropy.table.Table`
+        with more rows is split into chunks of nearby sources, which are
+        matched in separate requests, ``conf.chunk_workers`` at a time. Unless
+        an ``area`` is given, each request is restricted to a cone around its
+        chunk. A request failing with a connection error, a timeout or a
+        server error is retried on its own ``conf.chunk_retries`` times. The
+        uploaded chunks have an extra ``cat1_row`` (or ``cat2_row``) column
+        holding the index of their rows in the original table, and the
+        merged results are sorted by it. In this case, `query_async` and
+        ``get_query_payload`` return a list with an element per chunk.
         """
         response = self.query_async(cat1, cat2, max_distance, colRA1=colRA1, colDec1=colDec1,
                                     colRA2=colRA2, colDec2=colDec2, area=area, cache=cache,
@@ -79,6 +152,13 @@ class XMatchClass(BaseQuery):
         if get_query_payload:
             return response
 
+        if isinstance(response, list):
+            result = vstack([Table.read(BytesIO(resp.content), format='votable',
+                                        use_names_over_ids=True)
+                             for resp in response], metadata_conflicts='silent')
+            row_column = 'cat1_row' if 'cat1_row' in result.colnames else 'cat2_row'
+            return result[np.argsort(result[row_column], kind='stable')]
+
         content = BytesIO(response.content)
         return Table.read(content, format='votable', use_names_over_ids=True)
 
@@ -94,6 +174,25 @@ class XMatchClass(BaseQuery):
         """
         if max_distance > 180 * u.arcsec:
             raise ValueError('max_distance argument must not be greater than 180".')
+
+        query_kwargs = dict(cat1=cat1, cat2=cat2, max_distance=max_distance,
+                            colRA1=colRA1, colDec1=colDec1, colRA2=colRA2, colDec2=colDec2,
+                            area=area, cache=cache, get_query_payload=get_query_payload,
+                            **kwargs)
+        for cat_index, cat in ((1, cat1), (2, cat2)):
+            if (conf.chunk_size and isinstance(cat, Table) and len(cat) > conf.chunk_size
+                    and query_kwargs[f'colRA{cat_index}'] is not None
+                    and query_kwargs[f'colDec{cat_index}'] is not None):
+                return self._query_chunks(cat_index, query_kwargs)
+
+        return self._send_query(**query_kwargs)
+
+    def _send_query(self, cat1, cat2, max_distance, *, colRA1=None, colDec1=None,
+                    colRA2=None, colDec2=None, area='allsky', cache=True,
+                    get_query_payload=False, **kwargs):
+        """
+        Send a single xmatch request, see `query_async`.
+        """
         payload = {'request': 'xmatch',
                    'distMaxArcsec': max_distance.to(u.arcsec).value,
                    'RESPONSEFORMAT': 'votable',
@@ -127,13 +226,72 @@ class XMatchClass(BaseQuery):
 
         return response
 
+    def _query_chunks(self, cat_index, query_kwargs):
+        """
+        Match the uploaded table ``cat{cat_index}`` of ``query_kwargs`` in
+        chunks of nearby sources, and return the list of responses (or
+        payloads) of the chunks.
+        """
+        table = query_kwargs[f'cat{cat_index}']
+        row_column = f'cat{cat_index}_row'
+        if row_column in table.colnames:
+            raise ValueError(f"The uploaded table cannot have a '{row_column}' "
+                             "column when it is split into chunks.")
+        ra, dec = (np.ma.filled(np.ma.masked_array(table[query_kwargs[f'{key}{cat_index}']],
+                                                   dtype=float), np.nan)
+                   for key in ('colRA', 'colDec'))
+
+        # a file-like other catalogue can only be read once
+        other_key = f'cat{3 - cat_index}'
+        other_content = None
+        if not isinstance(query_kwargs[other_key], (str, Table)):
+            other_content = query_kwargs[other_key].read()
+
+        area = query_kwargs['area']
+        split_area = area is None or area == 'allsky'
+        # the matches of the sources of a chunk lie within max_distance of it
+        margin = query_kwargs['max_distance'] + 1 * u.arcsec
+
+        def query_chunk(rows):
+            chunk = table[rows]
+            chunk[row_column] = rows
+            chunk_kwargs = {**query_kwargs, f'cat{cat_index}': chunk}
+            if other_content is not None:
+                chunk_kwargs[other_key] = (BytesIO(other_content) if isinstance(other_content, bytes)
+                                           else StringIO(other_content))
+            if split_area:
+                chunk_kwargs['area'] = _bounding_cone(ra[rows], dec[rows], margin) or 'allsky'
+            attempt = 0
+            while True:
+                try:
+                    return self._send_query(**chunk_kwargs)
+                except Exception as ex:
+                    if attempt >= conf.chunk_retries or not _is_transient(ex):
+                        raise
+                    delay = 2 ** attempt
+                    attempt += 1
+                    log.info(f"{ex}. Retrying the chunk in {delay} s "
+                             f"(attempt {attempt} of {conf.chunk_retries}).")
+                    time.sleep(delay)
+
+        chunks = _split_by_position(ra, dec, conf.chunk_size)
+        if conf.chunk_workers > 1:
+            executor = ThreadPoolExecutor(max_workers=conf.chunk_workers)
+            try:
+                return list(executor.map(query_chunk, chunks))
+            finally:
+                # don't start the remaining chunks if one of them failed
+                executor.shutdown(cancel_futures=True)
+        return [query_chunk(rows) for rows in chunks]
+
     def _prepare_sending_table(self, cat_index, payload, kwargs, cat, colRA, colDec):
         '''Check if table is a string, a `astropy.table.Table`, etc. and set
         query parameters accordingly.
         '''
         catstr = 'cat{0}'.format(cat_index)
+        available = self.is_table_available(cat)
         if isinstance(cat, str):
-            if (self.is_table_available(cat) and not cat.startswith("vizier:")):
+            if (available and not cat.startswith("vizier:")):
                 # if we detect that the given name is a vizier table, we can make
                 # it comply to the API, see issue #3191
                 cat = f"vizier:{cat}"
@@ -155,7 +313,7 @@ class XMatchClass(BaseQuery):
                 # assume it's a file-like object, support duck-typing
                 kwargs['files'].update({catstr: (f'cat{cat_index}.csv', cat.read())})
 
-        if not self.is_table_available(cat):
+        if not available:
             if ((colRA is None) or (colDec is None)):
                 raise ValueError(
                     f"'{cat}' is not available on the XMatch server. If you are "
@@ -195,27 +353,56 @@ class XMatchClass(BaseQuery):
         if table_id.startswith('vizier:'):
             table_id = table_id[7:]
 
-        return table_id in self.get_available_tables()
+        return table_id in self._get_table_registry()['set']
 
-    def get_available_tables(self, *, cache=True):
+    def get_available_tables(self, *, cache=True, prefix=None):
         """Get the list of the VizieR tables which are available in the
         xMatch service and return them as a list of strings.
 
+        The list is kept in memory and only requested again after
+        ``conf.tables_ttl`` seconds.
+
         Parameters
         ----------
         cache : bool
             Defaults to True. If set overrides global caching behavior.
             See :ref:`caching documentation <astroquery_cache>`.
+            If False, the list kept in memory is also refreshed.
+        prefix : str, optional
+            Only return the tables whose name starts with ``prefix``, e.g.
+            ``'II/246'``, in alphabetical order.
+        """
+        registry = self._get_table_registry(cache=cache)
+        if prefix is None:
+            return list(registry['list'])
+
+        names = registry['sorted']
+        start = bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return names[start:end]
+
+    def _get_table_registry(self, *, cache=True):
+        """
+        Return the VizieR tables available at ``self.URL``, requesting them
+        if they are not in memory yet or if they are older than
+        ``conf.tables_ttl``.
         """
-        response = self._request(
-            'GET',
-            url_helpers.urljoin_keep_path(self.URL, 'tables'),
-            {'action': 'getVizieRTableNames', 'RESPONSEFORMAT': 'txt'},
-            cache=cache,
-        )
-
-        content = response.text
-        return content.splitlines()
+        registry = self._table_registry.get(self.URL)
+        if (registry is None or not cache
+                or time.monotonic() - registry['time'] > conf.tables_ttl):
+            response = self._request(
+                'GET',
+                url_helpers.urljoin_keep_path(self.URL, 'tables'),
+                {'action': 'getVizieRTableNames', 'RESPONSEFORMAT': 'txt'},
+                cache=cache,
+            )
+            tables = response.text.splitlines()
+            registry = {'time': time.monotonic(), 'list': tables,
+                        'set': frozenset(tables), 'sorted': sorted(tables)}
+            self._table_registry[self.URL] = registry
+        return registry
 
 
 XMatch = XMatchClass()
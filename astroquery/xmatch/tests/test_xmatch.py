@@ -1,15 +1,18 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from io import BytesIO
 from pathlib import Path
 import re
 
+import numpy as np
 import requests
 import pytest
 from astropy.io import ascii
 from astropy.table import Table
-from astropy.units import arcsec
+from astropy.units import arcsec, deg
 
 from astroquery.utils.mocks import MockResponse
-from ...xmatch import XMatch
+from ...xmatch import XMatch, conf
+from ...xmatch import core
 
 DATA_DIR = Path(__file__).parent / "data"
 DATA_FILES = {
@@ -33,6 +36,13 @@ class MockResponseXmatch(MockResponse):
         return self.content
 
 
+@pytest.fixture(autouse=True)
+def empty_table_registry(monkeypatch):
+    # the table registry is shared by the whole process: don't let the
+    # mocked table lists reach other tests
+    monkeypatch.setattr(core.XMatchClass, '_table_registry', {})
+
+
 @pytest.fixture
 def patch_request(request):
     mp = request.getfixturevalue("monkeypatch")
@@ -61,6 +71,35 @@ def test_get_available_tables(monkeypatch):
     assert 'II/246/out' in tables
 
 
+def test_table_registry(monkeypatch):
+    requests_sent = []
+
+    def mock_request(method, url, data, **kwargs):
+        requests_sent.append(kwargs['cache'])
+        return request_mockreturn(method, url, data)
+
+    xm = XMatch()
+    monkeypatch.setattr(xm, '_request', mock_request)
+    for _ in range(3):
+        assert xm.is_table_available('II/246/out')
+        assert not xm.is_table_available('blabla')
+    assert XMatch().is_table_available('vizier:II/246/out')
+    assert requests_sent == [True]
+
+    assert xm.get_available_tables(prefix='II/246') == ['II/246/out']
+    assert xm.get_available_tables(prefix='blabla') == []
+    tables = xm.get_available_tables()
+    assert 'II/246/out' in tables
+    assert xm.get_available_tables(prefix='') == sorted(tables)
+    assert requests_sent == [True]
+
+    # the list is requested again when it is too old or without cache
+    xm.get_available_tables(cache=False)
+    with conf.set_temp('tables_ttl', -1):
+        xm.is_table_available('II/246/out')
+    assert requests_sent == [True, False, True]
+
+
 def test_xmatch_is_avail_table(monkeypatch):
     xm = XMatch()
     monkeypatch.setattr(xm, '_request', request_mockreturn)
@@ -156,3 +195,53 @@ def test_prepare_sending_tables(monkeypatch):
     assert (kwargs == {'files': {'cat1': ('cat1.csv', 'a,b\n0,3\n1,4\n2,5\n')}}
             # for windows systems
             or kwargs == {'files': {'cat1': ('cat1.csv', 'a,b\r\n0,3\r\n1,4\r\n2,5\r\n')}})
+
+
+@pytest.mark.parametrize("chunk_workers", [1, 3])
+def test_query_chunked(monkeypatch, chunk_workers):
+    rng = np.random.default_rng(42)
+    cat1 = Table({'ra': rng.uniform(0, 360, 25), 'dec': rng.uniform(-90, 90, 25),
+                  'my_id': np.arange(25)})
+    failed = []
+
+    def mock_request(method, url, data, files, **kwargs):
+        # fail the first request once to check that it is retried on its own
+        if not failed:
+            failed.append(data)
+            raise requests.exceptions.ConnectionError("connection reset")
+        chunk = ascii.read(files['cat1'][1], format='csv')
+        assert data['cat2'] == 'vizier:II/246/out'
+        assert len(chunk) <= 10
+        chunk['angDist'] = 0.
+        chunk['twomass'] = [f'J{row}' for row in chunk['cat1_row']]
+        content = BytesIO()
+        chunk[::-1].write(content, format='votable')
+        return MockResponse(content=content.getvalue())
+
+    xm = XMatch()
+    monkeypatch.setattr(xm, '_request', mock_request)
+    monkeypatch.setattr(xm, 'is_table_available', lambda table_id: isinstance(table_id, str))
+    monkeypatch.setattr(core.time, 'sleep', lambda delay: None)
+    with (conf.set_temp('chunk_size', 10), conf.set_temp('chunk_workers', chunk_workers),
+          conf.set_temp('chunk_retries', 1)):
+        payloads = xm.query(cat1=cat1, cat2='vizier:II/246/out', max_distance=5 * arcsec,
+                            colRA1='ra', colDec1='dec', get_query_payload=True)
+        assert len(payloads) == 3
+        result = xm.query(cat1=cat1, cat2='vizier:II/246/out', max_distance=5 * arcsec,
+                          colRA1='ra', colDec1='dec')
+
+    assert len(failed) == 1
+    assert list(result['cat1_row']) == list(range(25))
+    assert list(result['my_id']) == list(range(25))
+    assert list(result['twomass']) == [f'J{row}' for row in range(25)]
+    assert 'cat1_row' not in cat1.colnames
+
+
+def test_chunk_area():
+    pytest.importorskip('regions')
+    ra = np.array([10., 10.5, 11.])
+    dec = np.array([-5., -5., -4.5])
+    cone = core._bounding_cone(ra, dec, 5 * arcsec)
+    assert cone.center.separation(core.SkyCoord(ra, dec, unit='deg')).max() <= cone.radius
+    assert cone.radius < 1 * deg
+    assert core._bounding_cone(np.array([0., 180.]), np.array([0., 0.]), 5 * arcsec) is None